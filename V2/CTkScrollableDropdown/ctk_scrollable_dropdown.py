@@ -6,8 +6,11 @@ Author: Akash Bora
 import customtkinter
 import sys
 import time
+import math
 import difflib
 
+FADE_FRAME_MS = 16
+
 class CTkScrollableDropdown(customtkinter.CTkToplevel):
     
     def __init__(self, attach, x=None, y=None, button_color=None, height: int = 200, width: int = None,
@@ -15,13 +18,19 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
                  scrollbar=True, scrollbar_button_hover_color=None, frame_border_width=2, values=[],
                  command=None, image_values=[], alpha: float = 0.97, frame_corner_radius=20, double_click=False,
                  resize=True, frame_border_color=None, text_color=None, autocomplete=False, 
-                 hover_color=None, **button_kwargs):
+                 hover_color=None, search=None, virtual=False, overscan=3, fade_duration: int = 100,
+                 **button_kwargs):
         
         super().__init__(takefocus=1)
         
         self.focus()
         self.lift()
         self.alpha = alpha
+        # Fades run on after() timers; fade_duration=0 (or "instant") shows/hides immediately
+        self.fade_duration = 0 if fade_duration == "instant" else fade_duration
+        self._fade_job = None
+        self._fade_target = None
+        self.selection_latency = None
         self.attach = attach
         self.corner = frame_corner_radius
         self.padding = 0
@@ -66,15 +75,21 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
             self.scroll_button_color = self.fg_color
             self.scroll_hover_color = self.fg_color
             
-        self.frame = customtkinter.CTkScrollableFrame(self, bg_color=self.transparent_color, fg_color=self.fg_color,
-                                        scrollbar_button_hover_color=self.scroll_hover_color,
-                                        corner_radius=self.corner, border_width=frame_border_width,
-                                        scrollbar_button_color=self.scroll_button_color,
-                                        border_color=self.frame_border_color)
-        self.frame._scrollbar.grid_configure(padx=3)
-        self.frame.pack(expand=True, fill="both")
+        # Virtual mode keeps only the visible rows (plus overscan) as widgets and recycles them on scroll
+        self.virtual = virtual
+        self.overscan = overscan
+        if self.virtual:
+            self._init_virtual_frame(frame_border_width)
+        else:
+            self.frame = customtkinter.CTkScrollableFrame(self, bg_color=self.transparent_color, fg_color=self.fg_color,
+                                            scrollbar_button_hover_color=self.scroll_hover_color,
+                                            corner_radius=self.corner, border_width=frame_border_width,
+                                            scrollbar_button_color=self.scroll_button_color,
+                                            border_color=self.frame_border_color)
+            self.frame._scrollbar.grid_configure(padx=3)
+            self.frame.pack(expand=True, fill="both")
         self.dummy_entry = customtkinter.CTkEntry(self.frame, fg_color="transparent", border_width=0, height=1, width=1)
-        self.no_match = customtkinter.CTkLabel(self.frame, text="No Match")
+        self.no_match = customtkinter.CTkLabel(self.viewport if self.virtual else self.frame, text="No Match")
         self.height = height
         self.height_new = height
         self.width = width
@@ -82,6 +97,7 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
         self.fade = False
         self.resize = resize
         self.autocomplete = autocomplete
+        self.search = search  # optional callable(query) -> ranked list of matching values
         self.var_update = customtkinter.StringVar()
         self.appear = False
         
@@ -93,9 +109,11 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
             self.justify = "c"
             
         self.button_height = button_height
+        self.row_height = button_height + 4  # pack(pady=2) spacing in normal mode
         self.values = values
         self.button_num = len(self.values)
-        self.image_values = None if len(image_values)!=len(self.values) else image_values
+        self.image_values = None if len(image_values)!=len(self.values) or self.virtual else image_values
+        self.button_kwargs = button_kwargs
         
         self.resizable(width=False, height=False)
         self.transient(self.master)
@@ -161,26 +179,159 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
             self.attach.bind("<Key>", appear)
             self.var_update.trace_add('write', self._update)
         
-    def fade_out(self):
-        for i in range(100,0,-10):
-            if not self.winfo_exists():
-                break
-            self.attributes("-alpha", i/100)
-            self.update()
-            time.sleep(1/100)
-            
-    def fade_in(self):
-        for i in range(0,100,10):
+    def cancel_fade(self):
+        if getattr(self, "_fade_job", None) is not None:
+            self.after_cancel(self._fade_job)
+            self._fade_job = None
+
+    def withdraw(self):
+        # A hidden popup fades in from zero next time, and a pending fade must not reshow it
+        self.cancel_fade()
+        self._fade_target = None
+        super().withdraw()
+
+    def _fade(self, start, end, on_done=None):
+        """Step alpha from start to end over fade_duration ms without blocking the event loop"""
+        self.cancel_fade()
+        self._fade_target = end
+        if not self.fade_duration:
+            self.attributes("-alpha", end)
+            if on_done:
+                on_done()
+            return
+        began = time.perf_counter()
+
+        def step():
+            self._fade_job = None
             if not self.winfo_exists():
-                break
-            self.attributes("-alpha", i/100)
-            self.update()
-            time.sleep(1/100)
+                return
+            progress = min(1.0, (time.perf_counter() - began) * 1000 / self.fade_duration)
+            self.attributes("-alpha", start + (end - start) * progress)
+            if progress < 1.0:
+                self._fade_job = self.after(FADE_FRAME_MS, step)
+            elif on_done:
+                on_done()
+
+        step()
+
+    def fade_out(self, on_done=None):
+        self._fade(float(self.attributes("-alpha")), 0.0, on_done)
+
+    def fade_in(self, on_done=None):
+        start = 0.0 if self._fade_target is None else float(self.attributes("-alpha"))
+        self._fade(start, self.alpha, on_done)
             
-    def _init_buttons(self, **button_kwargs):
+    def _init_virtual_frame(self, frame_border_width):
+        self.frame = customtkinter.CTkFrame(self, bg_color=self.transparent_color, fg_color=self.fg_color,
+                                            corner_radius=self.corner, border_width=frame_border_width,
+                                            border_color=self.frame_border_color)
+        self.frame.pack(expand=True, fill="both")
+        inset = max(frame_border_width, self.corner // 2)
+        self.v_scrollbar = customtkinter.CTkScrollbar(self.frame, command=self._virtual_scroll,
+                                                      button_color=self.scroll_button_color,
+                                                      button_hover_color=self.scroll_hover_color)
+        self.v_scrollbar.pack(side="right", fill="y", padx=3, pady=inset)
+        self.viewport = customtkinter.CTkFrame(self.frame, fg_color=self.fg_color, corner_radius=0)
+        self.viewport.pack(side="left", expand=True, fill="both", padx=(inset, 0), pady=inset)
+        self.viewport.bind("<Configure>", lambda e: self._render_rows(), add="+")
+        self._bind_wheel(self.viewport)
+        self.rows = []
+        self.offset = 0
+        self.pool = []
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel, add="+")
+        widget.bind("<Button-4>", lambda e: self._virtual_scroll("scroll", -1, "units"), add="+")
+        widget.bind("<Button-5>", lambda e: self._virtual_scroll("scroll", 1, "units"), add="+")
+
+    def _on_wheel(self, event):
+        if sys.platform.startswith("darwin"):
+            steps = -event.delta
+        else:
+            steps = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._virtual_scroll("scroll", steps, "units")
+
+    def _row_width(self):
+        # CTk widgets only take width in their constructor or configure(), never in place(), so rows
+        # are sized from the viewport's current (unscaled) width, which CTk tracks on <Configure>
+        return max(1, round(self.viewport._current_width) - self.padding)
+
+    def _view_height(self):
+        height = self.viewport.winfo_height()
+        return height if height > 1 else self.height
+
+    def _virtual_scroll(self, action, amount, unit=None):
+        total = len(self.rows) * self.row_height
+        view = self._view_height()
+        if action == "moveto":
+            offset = float(amount) * total
+        elif unit == "pages":
+            offset = self.offset + int(amount) * view
+        else:
+            offset = self.offset + int(amount) * self.row_height
+        self.offset = int(max(0, min(offset, total - view)))
+        self._render_rows()
+
+    def _ensure_pool(self):
+        needed = math.ceil(max(self.height, self._view_height()) / self.row_height) + 1 + 2 * self.overscan
+        while len(self.pool) < needed:
+            button = customtkinter.CTkButton(self.viewport,
+                                             height=self.button_height,
+                                             fg_color=self.button_color,
+                                             text_color=self.text_color,
+                                             anchor=self.justify,
+                                             **self.button_kwargs)
+            self._bind_wheel(button)
+            for child in button.winfo_children():
+                self._bind_wheel(child)
+            self.widgets[len(self.pool)] = button
+            self.pool.append(button)
+
+    def _render_rows(self):
+        if not self.virtual or not self.pool:
+            return
+        view = self._view_height()
+        first = max(0, self.offset // self.row_height - self.overscan)
+        row_width = self._row_width()
+        for slot, button in enumerate(self.pool):
+            index = first + slot
+            if index >= len(self.rows):
+                button.place_forget()
+                continue
+            value = self.rows[index]
+            if button.cget("text") != value:
+                button.configure(text=value, command=lambda k=value: self._attach_key_press(k))
+            if button.cget("width") != row_width:
+                button.configure(width=row_width)
+            button.place(x=self.padding, y=index * self.row_height - self.offset + 2)
+        total = len(self.rows) * self.row_height
+        if total > view:
+            self.v_scrollbar.set(self.offset / total, (self.offset + view) / total)
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
+
+    def _set_rows(self, rows):
+        self.rows = rows
+        self.offset = 0
+        self._ensure_pool()
+        self._render_rows()
+
+    def _init_buttons(self, values=None, **button_kwargs):
+        if self.virtual:
+            if not hasattr(self, "widgets"):
+                self.widgets = {}
+            if button_kwargs:
+                self.button_kwargs = button_kwargs
+            self.i = len(self.values)
+            self._set_rows(self.values if values is None else values)
+            self.hide = False
+            return
         self.i = 0
         self.widgets = {}
-        for row in self.values:
+        if values is not None:
+            image_values = self.image_values
+            self.image_values = None
+        for row in (self.values if values is None else values):
             self.widgets[self.i] = customtkinter.CTkButton(self.frame,
                                                           text=row,
                                                           height=self.button_height,
@@ -191,10 +342,13 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
                                                           command=lambda k=row: self._attach_key_press(k), **button_kwargs)
             self.widgets[self.i].pack(fill="x", pady=2, padx=(self.padding, 0))
             self.i+=1
+        if values is not None:
+            self.image_values = image_values
  
         self.hide = False
             
     def destroy_popup(self):
+        self.cancel_fade()
         self.destroy()
         self.disable = True
 
@@ -213,8 +367,8 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
 
         self.geometry('{}x{}+{}+{}'.format(self.width_new, self.height_new,
                                            self.x_pos, self.y_pos))
-        self.fade_in()
-        self.attributes('-alpha', self.alpha)
+        if self._fade_target != self.alpha:
+            self.fade_in()
         self.attach.focus()
 
     def _iconify(self):
@@ -235,20 +389,38 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
             self.hide = True
             
     def _attach_key_press(self, k):
+        began = time.perf_counter()
         self.event_generate("<<Selected>>")
         self.fade = True
         if self.command:
             self.command(k)
         self.fade = False
-        self.fade_out()
-        self.withdraw()
         self.hide = True
+        self.fade_out(on_done=self.withdraw)
+        self.selection_latency = time.perf_counter() - began
             
     def live_update(self, string=None):
         if not self.appear: return
         if self.disable: return
         if self.fade: return
-        if string:
+        if self.virtual:
+            self._live_update_virtual(string)
+            return
+        if string and self.search is not None:
+            # Indexed search: only the ranked matches become buttons
+            matches = self.search(string)
+            self._deiconify()
+            for key in self.widgets.keys():
+                self.widgets[key].destroy()
+            self._init_buttons(matches)
+            if not matches:
+                self.no_match.pack(fill="x", pady=2, padx=(self.padding, 0))
+            else:
+                self.no_match.pack_forget()
+            self.button_num = len(matches) + 1
+            self.place_dropdown()
+            
+        elif string:
             string = string.lower()
             self._deiconify()
             i=1
@@ -280,7 +452,34 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
         self.frame._parent_canvas.yview_moveto(0.0)
         self.appear = False
         
+    def _live_update_virtual(self, string):
+        # Filtering only swaps the row list; the pooled buttons are relabelled, never rebuilt
+        if string and self.search is not None:
+            rows = self.search(string)
+        elif string:
+            string = string.lower()
+            rows = [value for value in self.values
+                    if value.lower().startswith(string)
+                    or difflib.SequenceMatcher(None, value.lower()[0:len(string)], string).ratio() > 0.75]
+        else:
+            rows = self.values
+        self._deiconify()
+        self._set_rows(rows)
+        if string and not rows:
+            self.no_match.configure(width=self._row_width())
+            self.no_match.place(x=self.padding, y=2)
+        else:
+            self.no_match.place_forget()
+        self.button_num = len(rows) + 1 if string else len(rows)
+        self.place_dropdown()
+        self.appear = False
+
     def insert(self, value, **kwargs):
+        if self.virtual:
+            self.values.append(value)
+            self.i += 1
+            self._set_rows(self.values)
+            return
         self.widgets[self.i] = customtkinter.CTkButton(self.frame,
                                                        text=value,
                                                        height=self.button_height,
@@ -320,13 +519,16 @@ class CTkScrollableDropdown(customtkinter.CTkToplevel):
             self.values = kwargs.pop("values")
             self.image_values = None
             self.button_num = len(self.values)
-            for key in self.widgets.keys():
-                self.widgets[key].destroy()
-            self._init_buttons()
+            if self.virtual:
+                self._set_rows(self.values)
+            else:
+                for key in self.widgets.keys():
+                    self.widgets[key].destroy()
+                self._init_buttons()
  
         if "image_values" in kwargs:
             self.image_values = kwargs.pop("image_values")
-            self.image_values = None if len(self.image_values)!=len(self.values) else self.image_values
+            self.image_values = None if len(self.image_values)!=len(self.values) or self.virtual else self.image_values
             if self.image_values is not None:
                 i=0
                 for key in self.widgets.keys():
@@ -0,0 +1,78 @@
+"""
+Benchmark: password hashing cost on this machine
+
+Times credentials.hash_password over a range of scrypt n values and PBKDF2
+iteration counts and suggests the most expensive setting that still fits the
+target login delay. Copy the suggestion into SCRYPT_N / PBKDF2_ITERATIONS in
+credentials.py; existing hashes are upgraded on each user's next login.
+
+Run from the V2 folder:
+    python benchmarks/bench_credentials.py [target_ms]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import credentials
+from credentials import hash_password, verify_password, needs_rehash
+
+PASSWORD = "correct horse battery staple"
+REPEATS = 3
+
+
+def time_hash(scheme, params):
+    """Best of REPEATS, in ms"""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        hash_password(PASSWORD, scheme, params)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    target_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 250.0
+    print(f"target login delay: {target_ms:.0f} ms (best of {REPEATS})")
+
+    suggestions = {}
+    if hasattr(credentials.hashlib, 'scrypt'):
+        print(f"\n{'scrypt n':>10} {'r':>3} {'p':>3} {'memory':>9} {'ms':>9}")
+        for log_n in range(12, 19):
+            params = {'n': 2 ** log_n, 'r': credentials.SCRYPT_R, 'p': credentials.SCRYPT_P}
+            ms = time_hash('scrypt', params)
+            memory_mb = 128 * params['r'] * params['n'] / 1048576
+            print(f"{params['n']:>10} {params['r']:>3} {params['p']:>3} {memory_mb:>7.0f}MB {ms:>9.1f}")
+            if ms <= target_ms:
+                suggestions['scrypt'] = f"SCRYPT_N = 2 ** {log_n}"
+            else:
+                break
+
+    print(f"\n{'pbkdf2 iterations':>18} {'ms':>9}")
+    for iterations in (100_000, 200_000, 400_000, 600_000, 800_000, 1_200_000, 1_600_000):
+        ms = time_hash('pbkdf2_sha256', {'i': iterations})
+        print(f"{iterations:>18,} {ms:>9.1f}")
+        if ms <= target_ms:
+            suggestions['pbkdf2_sha256'] = f"PBKDF2_ITERATIONS = {iterations:_}"
+        else:
+            break
+
+    # Current settings: one login round trip, plus a legacy plain-text row that gets upgraded
+    stored = hash_password(PASSWORD)
+    start = time.perf_counter()
+    assert verify_password(PASSWORD, stored)
+    verify_ms = (time.perf_counter() - start) * 1000
+    assert verify_password(PASSWORD, PASSWORD) and needs_rehash(PASSWORD) and not needs_rehash(stored)
+    print(f"\ncurrent {credentials.DEFAULT_SCHEME} {credentials.current_params()}: verify {verify_ms:.1f} ms")
+
+    for scheme, suggestion in suggestions.items():
+        marker = " (default scheme)" if scheme == credentials.DEFAULT_SCHEME else ""
+        print(f"suggested for {scheme}{marker}: {suggestion}")
+    if not suggestions:
+        print("no setting fits the target; raise it or use the cheapest row above")
+
+
+if __name__ == "__main__":
+    main()
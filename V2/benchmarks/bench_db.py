@@ -0,0 +1,104 @@
+"""
+Micro-benchmark: per-call sqlite3.connect() vs the pooled connections in database.py
+
+Run from the V2 folder:
+    python benchmarks/bench_db.py [iterations]
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from database import ConnectionPool
+
+USERS_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS users (
+        username TEXT PRIMARY KEY,
+        password TEXT NOT NULL,
+        security_question TEXT NOT NULL,
+        security_answer TEXT NOT NULL,
+        daily_calorie_limit INTEGER DEFAULT 2000,
+        daily_calorie_intake INTEGER DEFAULT 0,
+        daily_fat REAL DEFAULT 0,
+        daily_carbs REAL DEFAULT 0,
+        daily_protein REAL DEFAULT 0,
+        daily_sugars REAL DEFAULT 0,
+        last_update DATE DEFAULT (DATE('now'))
+    )
+'''
+
+
+def legacy_read(path):
+    conn = sqlite3.connect(path, timeout=10.0)
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        return conn.execute("SELECT daily_calorie_intake FROM users WHERE username = ?",
+                            ("bench",)).fetchone()
+    finally:
+        conn.close()
+
+
+def legacy_write(path):
+    conn = sqlite3.connect(path, timeout=10.0)
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        conn.execute("UPDATE users SET daily_calorie_intake = daily_calorie_intake + 1 WHERE username = ?",
+                     ("bench",))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def pooled_read(pool):
+    with pool.connection() as conn:
+        return conn.execute("SELECT daily_calorie_intake FROM users WHERE username = ?",
+                            ("bench",)).fetchone()
+
+
+def pooled_write(pool):
+    with pool.transaction() as conn:
+        conn.execute("UPDATE users SET daily_calorie_intake = daily_calorie_intake + 1 WHERE username = ?",
+                     ("bench",))
+
+
+def measure(func, arg, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        conn = sqlite3.connect(path)
+        conn.execute(USERS_SCHEMA)
+        conn.execute("INSERT INTO users (username, password, security_question, security_answer) "
+                     "VALUES ('bench', 'x', 'q', 'a')")
+        conn.commit()
+        conn.close()
+
+        # Legacy numbers are taken first so they run in the default rollback-journal mode
+        results = [
+            ("legacy read", measure(legacy_read, path, iterations)),
+            ("legacy write", measure(legacy_write, path, iterations)),
+        ]
+        pool = ConnectionPool(path)
+        results += [
+            ("pooled read", measure(pooled_read, pool, iterations)),
+            ("pooled write", measure(pooled_write, pool, iterations)),
+        ]
+        pool.close()
+
+    print(f"{iterations} iterations per operation")
+    for name, micros in results:
+        print(f"{name:<14} {micros:10.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark: time spent inside the dropdown's selection handler, with and without a fade
+
+Needs a display. Run from the V2 folder:
+    python benchmarks/bench_dropdown_latency.py [selections]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import customtkinter
+from CTkScrollableDropdown import CTkScrollableDropdown
+
+
+def measure(root, fade_duration, selections):
+    entry = customtkinter.CTkEntry(root)
+    entry.pack()
+    dropdown = CTkScrollableDropdown(entry, values=[f"Item {i}" for i in range(50)],
+                                     fade_duration=fade_duration, command=lambda value: None)
+    latencies = []
+    for i in range(selections):
+        dropdown.hide = True
+        dropdown._iconify()
+        root.update()
+        dropdown._attach_key_press(f"Item {i % 50}")
+        latencies.append(dropdown.selection_latency * 1000)
+        root.update()
+    dropdown.destroy_popup()
+    entry.destroy()
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[-1]
+
+
+def main():
+    selections = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    root = customtkinter.CTk()
+    root.geometry("400x300")
+    root.update()
+    for fade_duration in (100, "instant"):
+        median, worst = measure(root, fade_duration, selections)
+        print(f"fade_duration={fade_duration!s:<8} selection handler: median {median:6.2f} ms, max {worst:6.2f} ms")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: load and look up a synthetic food catalog
+
+Run from the V2 folder:
+    python benchmarks/bench_food_catalog.py [items]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from food_catalog import FoodCatalog, FOOD_CATALOG_PATH
+
+WORDS = ("apple", "banana", "chicken", "rice", "bread", "yogurt", "cheese", "salmon", "oats",
+         "lentil", "tofu", "pasta", "spinach", "almond", "butter", "potato", "beef", "egg", "milk")
+
+
+def write_synthetic_catalog(path, count, seed=0):
+    """Real catalog rows first, then generated ones up to count"""
+    rng = random.Random(seed)
+    with open(FOOD_CATALOG_PATH, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    header, rows = rows[0], rows[1:]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+        for i in range(len(rows) + 1, count + 1):
+            name = " ".join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 3)))
+            writer.writerow([i, f"{name} #{i}", rng.randint(10, 800),
+                             round(rng.uniform(0, 50), 1), round(rng.uniform(0, 80), 1),
+                             round(rng.uniform(0, 40), 1), round(rng.uniform(0, 30), 1)])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'foods.csv')
+        write_synthetic_catalog(path, count)
+
+        start = time.perf_counter()
+        catalog = FoodCatalog.load(path)
+        load_ms = (time.perf_counter() - start) * 1000
+
+    names = [item.name for item in catalog]
+    lookups = [random.choice(names) for _ in range(10000)]
+    start = time.perf_counter()
+    for name in lookups:
+        catalog.by_name(name)
+    lookup_us = (time.perf_counter() - start) / len(lookups) * 1e6
+
+    print(f"{len(catalog)} items loaded in {load_ms:.1f} ms")
+    print(f"by_name lookup: {lookup_us:.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
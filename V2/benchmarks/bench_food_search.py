@@ -0,0 +1,72 @@
+"""
+Benchmark: FoodSearchIndex query latency on a synthetic catalog, typed one key at a time
+
+Also repeats whole typo queries, which take the fuzzy trigram path, and exits
+with status 1 when their p99 goes over budget.
+
+Run from the V2 folder:
+    python benchmarks/bench_food_search.py [items]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from food_catalog import FoodCatalog
+from food_search import FoodSearchIndex
+from bench_food_catalog import write_synthetic_catalog
+
+QUERIES = ("chicken breast", "greek yog", "salmn", "peanut butter", "tofu", "brocoli")
+FUZZY_QUERIES = ("salmn", "chiken", "yogrt", "brocoli")  # no name prefix matches these
+FUZZY_REPEATS = 200
+FUZZY_P99_BUDGET_US = 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'foods.csv')
+        write_synthetic_catalog(path, count)
+        catalog = FoodCatalog.load(path)
+
+    start = time.perf_counter()
+    index = FoodSearchIndex(catalog.names)
+    print(f"Index over {len(catalog)} names built in {(time.perf_counter() - start) * 1000:.1f} ms")
+    start = time.perf_counter()
+    index.warm()
+    print(f"Trigram postings built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for query in QUERIES:
+        timings = []
+        for length in range(1, len(query) + 1):
+            start = time.perf_counter()
+            results = index.search(query[:length])
+            timings.append((time.perf_counter() - start) * 1e6)
+        print(f"{query!r:<18} per keystroke: mean {sum(timings) / len(timings):8.1f} us, "
+              f"max {max(timings):8.1f} us -> {results[:3]}")
+
+    failures = []
+    for query in FUZZY_QUERIES:
+        timings = []
+        for _ in range(FUZZY_REPEATS):
+            start = time.perf_counter()
+            index.search(query)
+            timings.append((time.perf_counter() - start) * 1e6)
+        timings.sort()
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        print(f"{query!r:<18} fuzzy x{FUZZY_REPEATS}: mean {sum(timings) / len(timings):8.1f} us, "
+              f"p99 {p99:8.1f} us")
+        if p99 > FUZZY_P99_BUDGET_US:
+            failures.append(f"{query!r} fuzzy p99 {p99:.0f} us > budget {FUZZY_P99_BUDGET_US} us")
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        return 1
+    print(f"\nOK: fuzzy p99 within {FUZZY_P99_BUDGET_US} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
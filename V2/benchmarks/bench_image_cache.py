@@ -0,0 +1,52 @@
+"""
+Benchmark: cold vs cached thumbnail loads for the bundled image folders
+
+Run from the V2 folder:
+    python benchmarks/bench_image_cache.py [rounds]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PIL import Image
+
+from image_cache import get_image_cache
+
+FOLDERS = (('workoutimgs', (315, 177)), ('mealimages', (350, 196)), ('dashboardimgs', (350, 196)))
+
+
+def load(path, size):
+    """Same decode + resize as main.safe_load_image, through the cache"""
+    def decode():
+        img = Image.open(path).resize(size)
+        img.load()
+        return img
+    return get_image_cache().get_or_load((path, size, 'pil'), decode)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    jobs = [(os.path.join(folder, name), size) for folder, size in FOLDERS
+            for name in sorted(os.listdir(folder))]
+
+    start = time.perf_counter()
+    for path, size in jobs:
+        load(path, size)
+    cold = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for path, size in jobs:
+            load(path, size)
+    warm = (time.perf_counter() - start) * 1000 / rounds
+
+    print(f"{len(jobs)} thumbnails: cold {cold:.1f} ms, cached {warm:.3f} ms per pass")
+    get_image_cache().log_stats()
+    print(get_image_cache().stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: full decode + resize vs draft/reduce decoding for the bundled images
+
+Each strategy runs in its own process so its peak resident memory can be
+reported alongside per-image decode times. Peak memory comes from the
+resource module on Unix and from psutil, when installed, on Windows; the
+memory column is left out when neither is available.
+
+Run from the V2 folder:
+    python benchmarks/bench_image_decode.py [rounds]
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from PIL import Image
+
+from thumbnails import THUMBNAIL_SPECS, open_scaled, spec_sources
+
+STRATEGIES = ('full', 'draft')
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process in MB, or None when it can't be read here"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        return peak * (1 if sys.platform == 'darwin' else 1024) / 1048576
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        # Windows reports the peak working set; elsewhere only the current RSS is known
+        return getattr(info, 'peak_wset', info.rss) / 1048576
+    return None
+
+
+def full_decode(path, size):
+    """What safe_load_image did before: decode everything, then resize"""
+    with Image.open(path) as img:
+        return img.resize(size)
+
+
+def run(strategy, rounds):
+    decode = full_decode if strategy == 'full' else open_scaled
+    jobs = [(source, sizes[0]) for path, sizes in THUMBNAIL_SPECS.items() for source in spec_sources(path)]
+    baseline = peak_memory_mb()
+    total = 0.0
+    for path, size in jobs:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            decode(path, size)
+        elapsed = (time.perf_counter() - start) / rounds * 1000
+        total += elapsed
+        with Image.open(path) as img:
+            source = img.size
+        print(f"  {path:<28} {source[0]:>5}x{source[1]:<5} -> {size[0]}x{size[1]}  {elapsed:7.2f} ms")
+    peak = peak_memory_mb()
+    memory = (f", peak RSS {peak:.1f} MB (+{peak - baseline:.1f} MB while decoding)"
+              if peak is not None else " (peak memory unavailable: no resource module or psutil)")
+    print(f"{strategy}: {len(jobs)} images, {total:.1f} ms per pass{memory}")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--strategy':
+        run(sys.argv[2], int(sys.argv[3]))
+        return
+    rounds = sys.argv[1] if len(sys.argv) > 1 else '3'
+    for strategy in STRATEGIES:
+        subprocess.run([sys.executable, __file__, '--strategy', strategy, rounds], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: caller-side cost of a log call, synchronous FileHandler vs the queue pipeline
+
+Measures how long the calling (Tk) thread spends per logger.info call that
+carries a dict, as update_user_data does, and how a 60 FPS error storm is
+cut down by the rate limit.
+
+Run from the V2 folder:
+    python benchmarks/bench_logging.py [records]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import log_pipeline
+from log_pipeline import setup_logging, stop_logging
+
+PAYLOAD = {'daily_calorie_intake': 1850, 'daily_fat': 61.5, 'daily_carbs': 210.0,
+           'daily_protein': 95.25, 'daily_sugars': 40.0}
+
+
+def time_calls(logger, records):
+    start = time.perf_counter()
+    for i in range(records):
+        logger.info("Updated user data for %s: %s", f"user{i % 50}", PAYLOAD)
+    return (time.perf_counter() - start) / records * 1e6
+
+
+def line_count(path):
+    with open(path, encoding='utf-8') as f:
+        return sum(1 for _ in f)
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_path = os.path.join(tmp, 'sync.log')
+        sync_logger = logging.getLogger('bench.sync')
+        sync_logger.propagate = False
+        handler = logging.FileHandler(sync_path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter(log_pipeline.LOG_FORMAT))
+        sync_logger.addHandler(handler)
+        sync_logger.setLevel(logging.INFO)
+        sync_us = time_calls(sync_logger, records)
+        handler.close()
+
+        queued_path = os.path.join(tmp, 'queued.log')
+        # No console and no effective rate limit: measure the queue itself
+        setup_logging(logging.INFO, queued_path, console=False, rate=records, burst=records)
+        queued_us = time_calls(logging.getLogger('bench.queued'), records)
+        start = time.perf_counter()
+        stop_logging()
+        drain_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{records} records carrying a dict")
+        print(f"  FileHandler on caller thread: {sync_us:6.2f} us per call ({line_count(sync_path)} lines)")
+        print(f"  queue pipeline:               {queued_us:6.2f} us per call ({line_count(queued_path)} lines, "
+              f"writer drained the backlog {drain_ms:.0f} ms after the last call)")
+
+        # Error storm: one error per frame for 2 seconds at 60 FPS, default limits
+        storm_path = os.path.join(tmp, 'storm.log')
+        setup_logging(logging.INFO, storm_path, console=False)
+        storm_logger = logging.getLogger('bench.particles')
+        frames = 120
+        for frame in range(frames):
+            storm_logger.error("Error moving particles: %s", ValueError(f"frame {frame}"))
+            time.sleep(1 / 60)
+        stop_logging()
+        print(f"  error storm: {frames} errors over 2 s -> {line_count(storm_path)} lines written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: upgrade a legacy (INTEGER column, user_version 0) fitplus.db with many users
+
+Run from the V2 folder:
+    python benchmarks/bench_migrations.py [users]
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from database import configure_pool, close_pool
+from migrations import migrate
+
+LEGACY_USERS_SCHEMA = '''
+    CREATE TABLE users (
+        username TEXT PRIMARY KEY,
+        password TEXT NOT NULL,
+        security_question TEXT NOT NULL,
+        security_answer TEXT NOT NULL,
+        daily_calorie_limit INTEGER DEFAULT 2000,
+        daily_calorie_intake INTEGER DEFAULT 0,
+        daily_fat INTEGER DEFAULT 0,
+        daily_carbs INTEGER DEFAULT 0,
+        daily_protein INTEGER DEFAULT 0,
+        daily_sugars INTEGER DEFAULT 0,
+        current_weight INTEGER DEFAULT 0,
+        ideal_weight INTEGER DEFAULT 0,
+        bench_press_pr INTEGER DEFAULT 0,
+        squat_pr INTEGER DEFAULT 0,
+        deadlift_pr INTEGER DEFAULT 0,
+        last_update DATE DEFAULT (DATE('now'))
+    )
+'''
+
+
+def main():
+    users = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'legacy.db')
+        conn = sqlite3.connect(path)
+        conn.execute(LEGACY_USERS_SCHEMA)
+        conn.executemany('''
+            INSERT INTO users (username, password, security_question, security_answer,
+                               current_weight, bench_press_pr)
+            VALUES (?, 'password', 'Where were you born?', 'answer', ?, ?)
+        ''', ((f"user{i}", 60 + i % 40, 40 + i % 80) for i in range(users)))
+        conn.commit()
+        conn.close()
+
+        configure_pool(path)
+        start = time.perf_counter()
+        applied = migrate()
+        total = (time.perf_counter() - start) * 1000
+        close_pool()
+
+    print(f"Upgraded {users} users in {total:.1f} ms")
+    for version, name, duration_ms in applied:
+        print(f"  {version}: {name:<60} {duration_ms:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
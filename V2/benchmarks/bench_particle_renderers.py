@@ -0,0 +1,96 @@
+"""
+Benchmark: item-per-particle canvas renderer vs single-PhotoImage renderer
+
+With a display each frame is timed through to Tk finishing its redraw
+(update_idletasks). Without one only the image renderer's rasterization
+(including the palette -> RGB conversion PhotoImage.paste does) can run, so
+that is what gets timed.
+
+Run from the V2 folder:
+    python benchmarks/bench_particle_renderers.py [frames]
+"""
+
+import os
+import sys
+import time
+import tkinter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from particles import ParticleEngine, ParticleFrame, ImageRenderer, RENDERERS
+
+DENSITIES = (50, 500, 5000)
+
+
+class RasterStandIn:
+    """Just enough of a canvas for ImageRenderer, with the PhotoImage upload stubbed out"""
+
+    move_particles = ParticleFrame.move_particles
+
+    def __init__(self, count):
+        self.size = 3
+        self.color = "white"
+        self.engine = ParticleEngine(count, rng=np.random.default_rng(0))
+        self.renderer = ImageRenderer(self)
+        self.renderer.allocate()
+        self.renderer.photo = type("Photo", (), {"paste": lambda self, image: image.convert("RGB")})()
+        self.engine.spawn()
+
+    def winfo_rgb(self, color):
+        return (0, 0, 0) if color == "black" else (65535, 65535, 65535)
+
+    def cget(self, option):
+        return "black"
+
+
+def time_frames(frame, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def with_display(root, frames):
+    for count in DENSITIES:
+        results = []
+        for renderer in RENDERERS:
+            frame = ParticleFrame(root, particle_count=count, renderer=renderer, width=800, height=600)
+            frame.pack()
+            root.update()
+            frame.scheduler.unregister(frame)
+            frame.create_particles()
+            frame.engine.lifetime[:] = frames + 1
+
+            def step():
+                frame.move_particles()
+                root.update_idletasks()
+
+            results.append(f"{renderer} {time_frames(step, frames):7.2f} ms")
+            frame.stop()
+            frame.destroy()
+        print(f"{count:>5} particles: " + ", ".join(results) + " per frame")
+
+
+def headless(frames):
+    print("No display: timing the image renderer's rasterization only")
+    for count in DENSITIES:
+        standin = RasterStandIn(count)
+        standin.engine.lifetime[:] = frames + 1
+        print(f"{count:>5} particles: image raster {time_frames(standin.move_particles, frames):7.2f} ms per frame")
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        headless(frames)
+        return
+    with_display(root, frames)
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
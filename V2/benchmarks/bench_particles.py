@@ -0,0 +1,131 @@
+"""
+Benchmark: per-frame cost of the particle animation, vectorized engine vs one object per particle
+
+With a display the full frame (state update + canvas update) is timed; without
+one the canvas is replaced by a no-op Tcl command, so Python<->Tcl call
+overhead is still counted but drawing is not.
+
+Run from the V2 folder:
+    python benchmarks/bench_particles.py [frames]
+"""
+
+import os
+import sys
+import time
+import random
+import tkinter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from particles import ParticleEngine, ParticleFrame, ItemRenderer, PARTICLE_LIFETIME
+
+COUNTS = (50, 500, 5000)
+
+
+class LegacyParticle:
+    """The previous per-particle object, minus the canvas"""
+
+    def __init__(self):
+        self.x = random.randint(3, 797)
+        self.y = random.randint(3, 597)
+        self.dx = random.uniform(-0.5, 0.5)
+        self.dy = random.uniform(-0.5, 0.5)
+        self.lifetime = random.randint(*PARTICLE_LIFETIME)
+        self.age = 0
+
+    def move(self):
+        self.x += self.dx
+        self.y += self.dy
+        self.age += 1
+
+
+def time_frames(frame, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+class TclCanvasStandIn:
+    """ParticleFrame's update path against a no-op Tcl command standing in for the canvas"""
+
+    move_particles = ParticleFrame.move_particles
+
+    def __init__(self, tcl, count):
+        self.tk = tcl
+        self._w = "canvas"
+        self.size = 3
+        self.engine = ParticleEngine(count, rng=np.random.default_rng(0))
+        self.renderer = ItemRenderer(self)
+        self.renderer.item_ids = np.arange(1, count + 1)
+        self.renderer.draw(shown=self.engine.spawn())
+
+
+def headless(tcl, count, frames):
+    legacy = [LegacyParticle() for _ in range(count)]
+    for i, particle in enumerate(legacy, 1):
+        particle.id = i
+
+    def legacy_frame():
+        for particle in legacy:
+            particle.move()
+            tcl.call("canvas", "move", particle.id, particle.dx, particle.dy)
+
+    standin = TclCanvasStandIn(tcl, count)
+    standin.engine.lifetime[:] = frames + 1  # the legacy loop above never expires particles either
+    return time_frames(legacy_frame, frames), time_frames(standin.move_particles, frames)
+
+
+def with_canvas(root, count, frames):
+    canvas = tkinter.Canvas(root, width=800, height=600)
+    canvas.pack()
+    root.update()
+    legacy = []
+    for _ in range(count):
+        particle = LegacyParticle()
+        particle.id = canvas.create_oval(particle.x - 3, particle.y - 3, particle.x + 3, particle.y + 3)
+        legacy.append(particle)
+
+    def legacy_frame():
+        for particle in legacy:
+            particle.move()
+            canvas.move(particle.id, particle.dx, particle.dy)
+
+    legacy_us = time_frames(legacy_frame, frames)
+    canvas.destroy()
+
+    frame = ParticleFrame(root, particle_count=count, width=800, height=600)
+    frame.pack()
+    frame.stop()
+    frame._stop = False
+    frame.create_particles()
+    root.update()
+    frame.engine.lifetime[:] = frames + 1
+    engine_us = time_frames(frame.move_particles, frames)
+    frame.destroy()
+    return legacy_us, engine_us
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        root = None
+        tcl = tkinter.Tcl()
+        tcl.eval("proc canvas {args} {}")
+        print("No display: canvas calls go to a no-op Tcl command")
+
+    for count in COUNTS:
+        legacy_us, engine_us = with_canvas(root, count, frames) if root else headless(tcl, count, frames)
+        print(f"{count:>5} particles: per-particle objects {legacy_us:9.1f} us/frame, "
+              f"vectorized {engine_us:9.1f} us/frame")
+
+    if root:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
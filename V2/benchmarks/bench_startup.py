@@ -0,0 +1,80 @@
+"""
+Benchmark: cold start of main.py up to the first frame, checked against a budget
+
+Launches main.py with --profile-startup --exit-after-startup several times,
+reads the startup_profile.json each run writes and prints the slowest
+phases. Exits with status 1 when the first (coldest) run's time to first
+frame, or its share spent importing, goes over budget, so it can guard
+against startup regressions. Needs a display, like the app itself.
+
+Run from the V2 folder:
+    python benchmarks/bench_startup.py [runs] [budget_ms]
+"""
+
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from startup_profile import PROFILE_FLAG, EXIT_FLAG, STARTUP_REPORT
+
+STARTUP_BUDGET_MS = 2500  # launch to first frame of the login screen
+IMPORT_BUDGET_MS = 1500  # part of that spent in main.py's top-level imports
+RUN_TIMEOUT = 60  # seconds
+
+
+def run_once(v2_dir):
+    """(report, process wall ms) for one launch"""
+    report_path = os.path.join(v2_dir, STARTUP_REPORT)
+    if os.path.exists(report_path):
+        os.remove(report_path)
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, 'main.py', PROFILE_FLAG, EXIT_FLAG], cwd=v2_dir,
+                               capture_output=True, text=True, timeout=RUN_TIMEOUT)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if not os.path.exists(report_path):
+        sys.stderr.write(completed.stderr[-2000:])
+        raise SystemExit(f"main.py exited with {completed.returncode} before writing {STARTUP_REPORT}")
+    with open(report_path, encoding='utf-8') as f:
+        return json.load(f), wall_ms
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else STARTUP_BUDGET_MS
+    v2_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+    results = [run_once(v2_dir) for _ in range(runs)]
+    cold, cold_wall_ms = results[0]
+
+    print(f"{'run':>4} {'first frame ms':>15} {'imports ms':>11} {'process wall ms':>16}")
+    for i, (report, wall_ms) in enumerate(results):
+        print(f"{i + 1:>4} {report['total_ms']:>15.0f} {report['imports_ms']:>11.0f} {wall_ms:>16.0f}")
+    if runs > 1:
+        warm = [report['total_ms'] for report, _ in results[1:]]
+        print(f"warm median first frame: {statistics.median(warm):.0f} ms")
+
+    print("\nslowest phases of the cold run:")
+    for phase in sorted(cold['phases'], key=lambda phase: phase['duration_ms'], reverse=True)[:10]:
+        print(f"  {phase['duration_ms']:8.1f} ms  {phase['name']}")
+    for name, ms in cold['marks'].items():
+        print(f"  mark {name}: {ms:.0f} ms")
+
+    failures = []
+    if cold['total_ms'] > budget_ms:
+        failures.append(f"first frame {cold['total_ms']:.0f} ms > budget {budget_ms:.0f} ms")
+    if cold['imports_ms'] > IMPORT_BUDGET_MS:
+        failures.append(f"imports {cold['imports_ms']:.0f} ms > budget {IMPORT_BUDGET_MS} ms")
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        return 1
+    print(f"\nOK: cold start within {budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+FitPlus credentials
+Password hashing with a standard-library KDF. Every stored hash names its
+scheme and cost next to the salt and digest, for example
+    scrypt$n=16384,r=8,p=1$<salt>$<digest>
+    pbkdf2_sha256$i=600000$<salt>$<digest>
+so the cost constants can be raised at any time: old hashes still verify,
+and needs_rehash() tells the login path to store a fresh one. Rows written
+before hashing was introduced hold the plain password; they verify once and
+are rehashed on that login.
+
+Hashing takes tens to hundreds of milliseconds on purpose, so the UI hands login,
+registration and resets to run_in_background() instead of blocking Tk.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Cost parameters; benchmarks/bench_credentials.py helps pick them per machine
+SCRYPT_N = 2 ** 14  # CPU/memory cost; memory used is about 128 * r * n bytes (16 MB here)
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = 600_000
+SALT_BYTES = 16
+HASH_BYTES = 32
+DEFAULT_SCHEME = 'scrypt' if hasattr(hashlib, 'scrypt') else 'pbkdf2_sha256'
+
+CREDENTIAL_WORKERS = 1
+CREDENTIAL_POLL_MS = 15
+
+
+def current_params(scheme=DEFAULT_SCHEME):
+    """Cost parameters new hashes of scheme are made with"""
+    if scheme == 'scrypt':
+        return {'n': SCRYPT_N, 'r': SCRYPT_R, 'p': SCRYPT_P}
+    if scheme == 'pbkdf2_sha256':
+        return {'i': PBKDF2_ITERATIONS}
+    raise ValueError(f"Unknown password scheme {scheme}")
+
+
+def _b64encode(data):
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+
+def _b64decode(text):
+    return base64.b64decode(text + '=' * (-len(text) % 4))
+
+
+def _derive(scheme, password, salt, params, length=HASH_BYTES):
+    secret = password.encode('utf-8')
+    if scheme == 'scrypt':
+        n, r, p = params['n'], params['r'], params['p']
+        # hashlib's default 32 MB cap is too small once n goes past 2**14
+        return hashlib.scrypt(secret, salt=salt, n=n, r=r, p=p, dklen=length,
+                              maxmem=2 * 128 * r * (n + p))
+    if scheme == 'pbkdf2_sha256':
+        return hashlib.pbkdf2_hmac('sha256', secret, salt, params['i'], dklen=length)
+    raise ValueError(f"Unknown password scheme {scheme}")
+
+
+def parse_hash(stored):
+    """(scheme, params, salt, digest) for a stored hash; None for a legacy plain-text value"""
+    parts = stored.split('$') if isinstance(stored, str) else []
+    if len(parts) != 4 or parts[0] not in ('scrypt', 'pbkdf2_sha256'):
+        return None
+    try:
+        params = {key: int(value) for key, value in (item.split('=') for item in parts[1].split(','))}
+        return parts[0], params, _b64decode(parts[2]), _b64decode(parts[3])
+    except ValueError:
+        return None
+
+
+def hash_password(password, scheme=DEFAULT_SCHEME, params=None):
+    """Self-describing hash of password with a fresh random salt"""
+    params = params or current_params(scheme)
+    salt = os.urandom(SALT_BYTES)
+    digest = _derive(scheme, password, salt, params)
+    encoded_params = ','.join(f"{key}={value}" for key, value in params.items())
+    return f"{scheme}${encoded_params}${_b64encode(salt)}${_b64encode(digest)}"
+
+
+def verify_password(password, stored):
+    """True if password matches stored, a hash from hash_password or a legacy plain-text value
+
+    With stored None (no such user) a throwaway hash is still computed so the
+    answer takes as long as for a real account.
+    """
+    if stored is None:
+        _derive(DEFAULT_SCHEME, password, os.urandom(SALT_BYTES), current_params())
+        return False
+    parsed = parse_hash(stored)
+    if parsed is None:
+        return hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8'))
+    scheme, params, salt, digest = parsed
+    try:
+        candidate = _derive(scheme, password, salt, params, len(digest))
+    except (KeyError, ValueError) as e:
+        logger.error("Unusable %s password hash: %s", scheme, e)
+        return False
+    return hmac.compare_digest(candidate, digest)
+
+
+def needs_rehash(stored):
+    """True when stored is plain text, uses another scheme or is cheaper than the current cost"""
+    parsed = parse_hash(stored)
+    if parsed is None or parsed[0] != DEFAULT_SCHEME:
+        return True
+    params = parsed[1]
+    return any(params.get(key, 0) < value for key, value in current_params().items())
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=CREDENTIAL_WORKERS,
+                                               thread_name_prefix="credentials")
+    return _executor
+
+
+def run_in_background(owner, work, on_done):
+    """Run work() on the credential worker, then on_done(result) on owner's Tk thread
+
+    An exception raised by work() is passed to on_done in place of the result.
+    """
+    future = _get_executor().submit(work)
+
+    def poll():
+        if not future.done():
+            owner.after(CREDENTIAL_POLL_MS, poll)
+            return
+        error = future.exception()
+        on_done(error if error is not None else future.result())
+
+    owner.after(CREDENTIAL_POLL_MS, poll)
+    return future
+
+
+def shutdown_worker():
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,158 @@
+"""
+FitPlus database connection manager
+Keeps a small bounded pool of long-lived SQLite connections so helpers no longer
+pay for a connect + PRAGMA round on every call.
+"""
+
+import sqlite3
+import threading
+import queue
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Pool constants
+DB_PATH = 'fitplus.db'
+POOL_SIZE = 4
+POOL_TIMEOUT = 10.0  # seconds to wait for a free connection
+CACHE_SIZE_KB = 8192  # per-connection page cache
+WARM_TABLES = ('users',)
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections opened once with WAL and a warm cache"""
+
+    def __init__(self, path=DB_PATH, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self.path = path
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=self.size)
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self):
+        """Open and configure a single long-lived connection"""
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+        self._warm(conn)
+        return conn
+
+    def _warm(self, conn):
+        """Pull the schema and hot tables into the page cache"""
+        try:
+            conn.execute("SELECT name FROM sqlite_master").fetchall()
+            for table in WARM_TABLES:
+                for _ in conn.execute(f"SELECT * FROM {table}"):
+                    pass
+        except sqlite3.Error:
+            # Tables may not exist yet on a fresh database
+            pass
+
+    def acquire(self):
+        """Get an idle connection, opening a new one while under the size limit"""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                conn = self._connect()
+                self._created += 1
+                return conn
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a database connection")
+
+    def release(self, conn):
+        """Return a connection to the pool, discarding any unfinished transaction"""
+        if conn.in_transaction:
+            conn.rollback()
+        if self._closed:
+            conn.close()
+            return
+        self._idle.put_nowait(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """Connection that commits on success and rolls back on error.
+
+        The write lock is taken up front so read-then-write helpers are atomic.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """Close every idle connection; busy ones are closed on release"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        logger.info("Closed database pool for %s", self.path)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure_pool(path=DB_PATH, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+    """Replace the process-wide pool, closing the previous one"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = ConnectionPool(path, size, timeout)
+    return _pool
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def db_connection():
+    """Context manager yielding a pooled connection for reads"""
+    return get_pool().connection()
+
+
+def db_transaction():
+    """Context manager yielding a pooled connection inside a transaction"""
+    return get_pool().transaction()
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
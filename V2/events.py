@@ -0,0 +1,213 @@
+"""
+FitPlus event log
+Structured records of user actions (logins, food adds, progress updates,
+page switches) with the acting user, how long the action took and how it
+ended. Events are buffered in memory and written to the events table in
+batches, by a background thread on a timer or inline once a batch fills up;
+the report command turns them into latency percentiles per action.
+
+Report from the V2 folder with:
+    python events.py report [--days N] [--action NAME]
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import argparse
+import threading
+import logging
+from contextlib import contextmanager
+
+from database import db_connection, db_transaction
+
+logger = logging.getLogger(__name__)
+
+EVENT_BATCH = 50  # buffered events that trigger a write
+EVENT_FLUSH_INTERVAL = 15  # seconds an event may wait for its batch
+EVENT_RETRY_MAX = 300  # longest wait, in seconds, before retrying after failed writes
+EVENT_BUFFER_LIMIT = 5000  # oldest events are dropped beyond this if writes keep failing
+REPORT_PERCENTILES = (50, 90, 99)
+
+
+class EventRecorder:
+    """In-memory event buffer flushed to SQLite in batches"""
+
+    def __init__(self, batch=EVENT_BATCH, interval=EVENT_FLUSH_INTERVAL):
+        self.batch = batch
+        self.interval = interval
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._failures = 0  # consecutive failed writes
+        self._retry_at = 0.0  # monotonic time before which no write is attempted
+        self._stopping = threading.Event()
+        self._worker = None
+        self.written = 0
+        self.dropped = 0
+
+    def start(self):
+        """Start the thread that writes whatever is buffered every interval seconds"""
+        with self._lock:
+            if self._worker is None:
+                self._stopping.clear()
+                self._worker = threading.Thread(target=self._run, name="events", daemon=True)
+                self._worker.start()
+
+    def stop(self):
+        """Stop the timer thread and write out what is left"""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._stopping.set()
+            worker.join()
+        return self.flush()
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            with self._lock:
+                due = bool(self._buffer) and time.monotonic() >= self._retry_at
+            if due:
+                self.flush()
+
+    def record(self, action, username=None, duration_ms=None, outcome='ok', **detail):
+        row = (time.time(), action, username or None, duration_ms, outcome,
+               json.dumps(detail, default=str) if detail else None)
+        with self._lock:
+            self._buffer.append(row)
+            if len(self._buffer) > EVENT_BUFFER_LIMIT:
+                del self._buffer[0]
+                self.dropped += 1
+            # A full batch is the only write made on the caller's thread; the timer thread does the rest
+            due = len(self._buffer) >= self.batch and time.monotonic() >= self._retry_at
+        if due:
+            self.flush()
+
+    @contextmanager
+    def timed(self, action, username=None, **detail):
+        """Time the with-block; set event['outcome'] inside it, an exception records 'error'"""
+        event = {'outcome': 'ok', **detail}
+        start = time.perf_counter()
+        try:
+            yield event
+        except BaseException:
+            event['outcome'] = 'error'
+            raise
+        finally:
+            outcome = event.pop('outcome')
+            self.record(action, username, (time.perf_counter() - start) * 1000, outcome, **event)
+
+    def flush(self):
+        """Write buffered events in one transaction; returns how many were written"""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows:
+            return 0
+        try:
+            with db_transaction() as conn:
+                conn.executemany('''
+                    INSERT INTO events (recorded_at, action, username, duration_ms, outcome, detail)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
+        except sqlite3.Error as e:
+            with self._lock:
+                self._buffer[:0] = rows
+                overflow = len(self._buffer) - EVENT_BUFFER_LIMIT
+                if overflow > 0:
+                    del self._buffer[:overflow]
+                    self.dropped += overflow
+                self._failures += 1
+                # Back off so a locked or broken database isn't retried on every full batch
+                delay = min(EVENT_RETRY_MAX, self.interval * 2 ** self._failures)
+                self._retry_at = time.monotonic() + delay
+            logger.error("Error writing %s events, retrying in %.0f s: %s", len(rows), delay, e)
+            return 0
+        with self._lock:
+            self._failures = 0
+            self._retry_at = 0.0
+            self.written += len(rows)
+        return len(rows)
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_event_recorder():
+    """Process-wide recorder shared by every page; its timer thread starts with it"""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = EventRecorder()
+                _recorder.start()
+    return _recorder
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def latency_report(days=None, action=None, percentiles=REPORT_PERCENTILES):
+    """Per-action count, outcome counts and duration percentiles, busiest action first"""
+    query = 'SELECT action, outcome, duration_ms FROM events WHERE 1 = 1'
+    params = []
+    if days is not None:
+        query += ' AND recorded_at >= ?'
+        params.append(time.time() - days * 86400)
+    if action is not None:
+        query += ' AND action = ?'
+        params.append(action)
+    query += ' ORDER BY action, duration_ms'
+
+    actions = {}
+    with db_connection() as conn:
+        for name, outcome, duration_ms in conn.execute(query, params):
+            entry = actions.setdefault(name, {'action': name, 'count': 0, 'outcomes': {}, 'durations': []})
+            entry['count'] += 1
+            entry['outcomes'][outcome] = entry['outcomes'].get(outcome, 0) + 1
+            if duration_ms is not None:
+                entry['durations'].append(duration_ms)
+
+    report = []
+    for entry in actions.values():
+        durations = entry.pop('durations')
+        entry['percentiles'] = {pct: percentile(durations, pct) for pct in percentiles}
+        entry['max'] = durations[-1] if durations else None
+        report.append(entry)
+    return sorted(report, key=lambda entry: entry['count'], reverse=True)
+
+
+def _format_ms(value):
+    return f"{value:9.1f}" if value is not None else f"{'-':>9}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the FitPlus event log")
+    commands = parser.add_subparsers(dest='command', required=True)
+    report_parser = commands.add_parser('report', help="latency percentiles per action")
+    report_parser.add_argument('--days', type=float, default=None, help="only the last N days")
+    report_parser.add_argument('--action', default=None, help="only this action")
+    args = parser.parse_args(argv)
+
+    if args.command == 'report':
+        report = latency_report(args.days, args.action)
+        if not report:
+            print("No events recorded")
+            return 0
+        header = ''.join(f"{f'p{pct} ms':>9}" for pct in REPORT_PERCENTILES)
+        print(f"{'action':<18}{'count':>7}{header}{'max ms':>9}  outcomes")
+        for entry in report:
+            cells = ''.join(_format_ms(entry['percentiles'][pct]) for pct in REPORT_PERCENTILES)
+            outcomes = ', '.join(f"{name} {count}" for name, count in sorted(entry['outcomes'].items()))
+            print(f"{entry['action']:<18}{entry['count']:>7}{cells}{_format_ms(entry['max'])}  {outcomes}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
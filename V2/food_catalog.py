@@ -0,0 +1,92 @@
+"""
+FitPlus food catalog
+Nutrition data loaded once from fooddata/foods.csv and indexed by id and by
+name, so lookups stay O(1) however large the dataset grows.
+"""
+
+import csv
+import os
+import threading
+import logging
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+FOOD_CATALOG_PATH = os.path.join('fooddata', 'foods.csv')
+NUTRIENTS = ('calories', 'fat', 'carbs', 'protein', 'sugars')
+
+
+class FoodItem(NamedTuple):
+    id: int
+    name: str
+    calories: int
+    fat: float
+    carbs: float
+    protein: float
+    sugars: float
+
+    def nutrition(self):
+        return {nutrient: getattr(self, nutrient) for nutrient in NUTRIENTS}
+
+
+class FoodCatalog:
+    """Immutable collection of FoodItems with id and name indexes"""
+
+    def __init__(self, items):
+        self._items = tuple(items)
+        self._by_id = {item.id: item for item in self._items}
+        self._by_name = {item.name.casefold(): item for item in self._items}
+        self._names = tuple(item.name for item in self._items)
+
+    @classmethod
+    def load(cls, path=FOOD_CATALOG_PATH):
+        """Read the catalog file; a missing or unreadable file gives an empty catalog"""
+        items = []
+        try:
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                columns = [header.index(field) for field in FoodItem._fields]
+                for row in reader:
+                    try:
+                        item_id, name, calories, fat, carbs, protein, sugars = (row[c] for c in columns)
+                        items.append(FoodItem(int(item_id), name, int(float(calories)), float(fat),
+                                              float(carbs), float(protein), float(sugars)))
+                    except (IndexError, ValueError) as e:
+                        logger.warning("Skipping malformed food row %s: %s", row, e)
+        except ValueError as e:
+            logger.error("Food catalog %s is missing a column: %s", path, e)
+        except OSError as e:
+            logger.error("Error loading food catalog %s: %s", path, e)
+        logger.info("Loaded %s food items from %s", len(items), path)
+        return cls(items)
+
+    def get(self, item_id):
+        return self._by_id.get(item_id)
+
+    def by_name(self, name):
+        return self._by_name.get(name.casefold()) if name else None
+
+    @property
+    def names(self):
+        return self._names
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_food_catalog():
+    """Process-wide catalog, loaded on first use"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = FoodCatalog.load()
+    return _catalog
@@ -0,0 +1,170 @@
+"""
+FitPlus food log
+Append-only record of every food a user adds, with a per-day summary table that
+a trigger keeps up to date on insert so today's totals are a single-row lookup.
+Adds are held in memory and written in one transaction per batch: when the
+batch fills up, every few seconds from a background thread, and whenever a
+user's totals are read, their day is cleared or they log out.
+"""
+
+import sqlite3
+import datetime
+import threading
+import logging
+
+from database import db_connection, db_transaction
+
+logger = logging.getLogger(__name__)
+
+NUTRIENTS = ('calories', 'fat', 'carbs', 'protein', 'sugars')
+FOOD_LOG_BATCH = 20  # pending adds that trigger a write
+FOOD_LOG_FLUSH_INTERVAL = 5  # seconds an add may wait for its batch
+
+
+class FoodLogWriter:
+    """Pending food adds, written to food_log in one transaction per batch"""
+
+    def __init__(self, batch=FOOD_LOG_BATCH, interval=FOOD_LOG_FLUSH_INTERVAL):
+        self.batch = batch
+        self.interval = interval
+        self._pending = []  # (username, day, item, *NUTRIENTS)
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._worker = None
+        self.written = 0
+        self.dropped = 0
+
+    def start(self):
+        """Start the thread that writes whatever is pending every interval seconds"""
+        with self._lock:
+            if self._worker is None:
+                self._stopping.clear()
+                self._worker = threading.Thread(target=self._run, name="food-log", daemon=True)
+                self._worker.start()
+
+    def stop(self):
+        """Stop the timer thread and write out what is left"""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._stopping.set()
+            worker.join()
+        return self.flush()
+
+    def _run(self):
+        while not self._stopping.wait(self.interval):
+            self.flush()
+
+    def add(self, username, item_name, nutrition, day):
+        with self._lock:
+            self._pending.append((username, day, item_name, *(nutrition.get(n, 0) for n in NUTRIENTS)))
+            due = len(self._pending) >= self.batch
+        if due:
+            self.flush()
+
+    def discard(self, username, day=None):
+        """Forget username's pending adds, only those for day when given"""
+        with self._lock:
+            self._pending = [row for row in self._pending
+                             if row[0] != username or (day is not None and row[1] != day)]
+
+    def flush(self, username=None):
+        """Write pending adds, everyone's or only username's, in one transaction; returns rows written
+
+        Adds for a user that no longer exists are dropped rather than retried.
+        """
+        with self._lock:
+            if username is None:
+                rows, self._pending = self._pending, []
+            else:
+                rows = [row for row in self._pending if row[0] == username]
+                self._pending = [row for row in self._pending if row[0] != username]
+        if not rows:
+            return 0
+        try:
+            with db_transaction() as conn:
+                written = conn.executemany('''
+                    INSERT INTO food_log (username, day, item, calories, fat, carbs, protein, sugars)
+                    SELECT ?, ?, ?, ?, ?, ?, ?, ?
+                    WHERE EXISTS (SELECT 1 FROM users WHERE username = ?1)
+                ''', rows).rowcount
+        except sqlite3.Error as e:
+            logger.error("Error writing %s food log entries: %s", len(rows), e)
+            with self._lock:
+                self._pending[:0] = rows
+            return 0
+        with self._lock:
+            self.written += written
+            self.dropped += len(rows) - written
+        if written < len(rows):
+            logger.warning("Dropped %s food log entries for users that no longer exist", len(rows) - written)
+        return written
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_food_log_writer():
+    """Process-wide writer; its timer thread starts with it"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = FoodLogWriter()
+                _writer.start()
+    return _writer
+
+
+def log_food(username, item_name, nutrition, day=None):
+    """Queue one entry; once written, the trigger folds it into that day's summary row"""
+    day = day or datetime.date.today().isoformat()
+    get_food_log_writer().add(username, item_name, nutrition, day)
+    return True, "Food logged"
+
+
+def get_daily_totals(username, day=None):
+    """Summary row for one day as a dict; zeros when nothing was logged"""
+    day = day or datetime.date.today().isoformat()
+    get_food_log_writer().flush(username)
+    try:
+        with db_connection() as conn:
+            row = conn.execute(f'''
+                SELECT {", ".join(NUTRIENTS)}, entries FROM daily_nutrition
+                WHERE username = ? AND day = ?
+            ''', (username, day)).fetchone()
+    except sqlite3.Error as e:
+        logger.error("Error reading daily totals: %s", e)
+        row = None
+    return dict(zip(NUTRIENTS + ('entries',), row or (0,) * (len(NUTRIENTS) + 1)))
+
+
+def get_food_log(username, day=None):
+    """All entries for one day, oldest first"""
+    day = day or datetime.date.today().isoformat()
+    get_food_log_writer().flush(username)
+    try:
+        with db_connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT logged_at, item, {", ".join(NUTRIENTS)} FROM food_log
+                WHERE username = ? AND day = ? ORDER BY id
+            ''', (username, day))
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    except sqlite3.Error as e:
+        logger.error("Error reading food log: %s", e)
+        return []
+
+
+def clear_day(username, day=None):
+    """Remove a day's entries and its summary row (the Reset button)"""
+    day = day or datetime.date.today().isoformat()
+    get_food_log_writer().discard(username, day)
+    try:
+        with db_transaction() as conn:
+            conn.execute("DELETE FROM food_log WHERE username = ? AND day = ?", (username, day))
+            conn.execute("DELETE FROM daily_nutrition WHERE username = ? AND day = ?", (username, day))
+        return True, "Daily intake cleared"
+    except sqlite3.Error as e:
+        logger.error("Error clearing food log: %s", e)
+        return False, f"Database error: {str(e)}"
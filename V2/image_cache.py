@@ -0,0 +1,118 @@
+"""
+FitPlus image cache
+Process-wide LRU cache for decoded images, keyed by (path, size, mode) where
+mode says what is stored: a PIL image, a Tk PhotoImage or a CTkImage. Entries
+are charged by their estimated pixel memory and evicted least recently used
+first once the byte budget is exceeded.
+"""
+
+import threading
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_BUDGET = 64 * 1024 * 1024  # bytes
+PHOTO_BYTES_PER_PIXEL = 4  # Tk photo images are stored as 32-bit RGBA
+
+
+def image_nbytes(image):
+    """Approximate memory held by a PIL image, PhotoImage or CTkImage"""
+    if hasattr(image, 'getbands'):
+        return image.width * image.height * len(image.getbands())
+    if hasattr(image, 'cget') and hasattr(image, '_light_image'):
+        # CTkImage: keeps its source images plus one scaled PhotoImage per appearance mode
+        size = image.cget('size')
+        return size[0] * size[1] * PHOTO_BYTES_PER_PIXEL * 2
+    return image.width() * image.height() * PHOTO_BYTES_PER_PIXEL
+
+
+class ImageCache:
+    """Byte-budgeted LRU map from (path, size, mode) to a loaded image"""
+
+    def __init__(self, budget=IMAGE_CACHE_BUDGET):
+        self.budget = budget
+        self._entries = OrderedDict()  # key -> (image, nbytes)
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, image, nbytes=None):
+        nbytes = image_nbytes(image) if nbytes is None else nbytes
+        if nbytes > self.budget:
+            logger.debug("Not caching %s: %s bytes exceeds the whole budget", key, nbytes)
+            return image
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[1]
+            self._entries[key] = (image, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.budget:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+        return image
+
+    def get_or_load(self, key, loader):
+        """Cached image for key, calling loader() and caching its result on a miss"""
+        image = self.get(key)
+        if image is None:
+            image = self.put(key, loader())
+        return image
+
+    def discard(self, path):
+        """Drop every entry for path, whatever its size or mode"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self.nbytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'budget': self.budget,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info("Image cache: %s entries, %.1f of %.0f MB, %s hits / %s misses (%.0f%%), %s evictions",
+                    stats['entries'], stats['bytes'] / 1048576, stats['budget'] / 1048576,
+                    stats['hits'], stats['misses'], stats['hit_rate'] * 100, stats['evictions'])
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_image_cache():
+    """Process-wide image cache shared by every page"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ImageCache()
+    return _cache
@@ -0,0 +1,96 @@
+"""
+FitPlus async image loader
+Decodes and resizes images on a small worker pool so pages can show
+placeholders immediately. Results are handed back to the Tk main thread by
+an after() poll, since Tk objects must only be touched from that thread.
+Jobs belong to a group (e.g. the workouts page); cancelling a group drops
+its queued jobs and discards results that finish afterwards.
+"""
+
+import queue
+import threading
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+IMAGE_LOADER_WORKERS = 4
+IMAGE_LOADER_POLL_MS = 15
+
+
+class AsyncImageLoader:
+    """Worker-pool image decoding with main-thread delivery and per-group cancellation"""
+
+    def __init__(self, workers=IMAGE_LOADER_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-loader")
+        self._results = queue.SimpleQueue()
+        self._generations = defaultdict(int)
+        self._pending = {}  # future -> group; main thread only
+        self._poll_job = None
+        self._owner = None
+        self.completed = 0
+        self.cancelled = 0
+
+    def submit(self, owner, group, load, on_ready):
+        """Run load() on a worker, then on_ready(result) on owner's main loop unless group was cancelled"""
+        generation = self._generations[group]
+        future = self._pool.submit(load)
+        self._pending[future] = group
+        future.add_done_callback(lambda f: self._results.put((f, group, generation, on_ready)))
+        self._ensure_polling(owner)
+        return future
+
+    def cancel(self, group):
+        """Forget every outstanding job of group"""
+        self._generations[group] += 1
+        for future, pending_group in list(self._pending.items()):
+            if pending_group == group:
+                future.cancel()
+
+    def _ensure_polling(self, owner):
+        if self._poll_job is None:
+            self._owner = owner.winfo_toplevel()
+            self._poll_job = self._owner.after(IMAGE_LOADER_POLL_MS, self._drain)
+
+    def _drain(self):
+        self._poll_job = None
+        while True:
+            try:
+                future, group, generation, on_ready = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.pop(future, None)
+            if future.cancelled() or generation != self._generations[group]:
+                self.cancelled += 1
+                continue
+            if future.exception() is not None:
+                logger.error("Error loading image in background: %s", future.exception())
+                continue
+            try:
+                on_ready(future.result())
+                self.completed += 1
+            except Exception as e:
+                logger.error("Error showing background-loaded image: %s", e)
+        if self._pending:
+            self._ensure_polling(self._owner)
+
+    def shutdown(self):
+        for group in list(self._generations):
+            self.cancel(group)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("Image loader: %s delivered, %s cancelled", self.completed, self.cancelled)
+
+
+_loader = None
+_loader_lock = threading.Lock()
+
+
+def get_image_loader():
+    """Process-wide loader shared by every page"""
+    global _loader
+    if _loader is None:
+        with _loader_lock:
+            if _loader is None:
+                _loader = AsyncImageLoader()
+    return _loader
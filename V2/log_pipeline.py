@@ -0,0 +1,116 @@
+"""
+FitPlus log pipeline
+Logging calls only put the record on a queue. A QueueListener thread then
+formats it and writes fitplus.log, rotated by size, and the console. Records
+are queued unformatted, so %-style arguments are rendered on the writer
+thread, never on the Tk thread. A token bucket per logger and level drops
+storms, such as an error repeated every animation frame, before they are
+queued, without letting a flood of INFO records silence that logger's errors.
+"""
+
+import time
+import queue
+import atexit
+import threading
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FILE = 'fitplus.log'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+RATE_LIMIT_PER_SECOND = 5  # sustained records per logger and level
+RATE_LIMIT_BURST = 20  # records a logger may emit at one level at once before the limit applies
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
+
+    def prepare(self, record):
+        # Traceback objects pin live frames, so only they are rendered before queueing
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per (logger name, level); reports how many records it dropped on the next one it lets through"""
+
+    def __init__(self, rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}  # (logger name, level) -> [tokens, last refill, dropped since last pass]
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def filter(self, record):
+        if record.levelno >= logging.CRITICAL:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            key = (record.name, record.levelno)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now, 0]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                self.dropped += 1
+                return False
+            bucket[0] = tokens - 1
+            dropped, bucket[2] = bucket[2], 0
+        if dropped:
+            record.msg = (f"{record.msg} [{dropped} earlier {record.levelname} messages from {record.name} "
+                          f"dropped by rate limit]")
+        return True
+
+
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def setup_logging(level=logging.INFO, path=LOG_FILE, console=True,
+                  rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST):
+    """Route every logger through the queue to a rotating file and the console; safe to call twice"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return _listener
+        formatter = logging.Formatter(LOG_FORMAT)
+        file_handler = RotatingFileHandler(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS,
+                                           encoding='utf-8')
+        handlers = [file_handler, logging.StreamHandler()] if console else [file_handler]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        records = queue.SimpleQueue()
+        queue_handler = DeferredQueueHandler(records)
+        queue_handler.addFilter(RateLimitFilter(rate, burst))
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+
+        _listener = QueueListener(records, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+        return _listener
+
+
+def stop_logging():
+    """Write out everything still queued and stop the writer thread"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
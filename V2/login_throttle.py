@@ -0,0 +1,158 @@
+"""
+FitPlus login throttle
+Failed-login limits kept in memory: a sliding window of failure times per
+username plus one shared window across all usernames. A throttled attempt
+is rejected before any database read or password hash. Only lockouts are
+persisted, collected and written in batches, so they survive a restart
+without a database write on every failed attempt.
+"""
+
+import time
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict, deque
+
+from database import db_connection, db_transaction
+
+logger = logging.getLogger(__name__)
+
+USER_MAX_FAILURES = 5  # failures per username within USER_WINDOW before a lockout
+USER_WINDOW = 300  # seconds
+LOCKOUT_SECONDS = 900
+GLOBAL_MAX_FAILURES = 50  # failures across all usernames within GLOBAL_WINDOW
+GLOBAL_WINDOW = 60  # seconds
+MAX_TRACKED_USERS = 10_000  # least recently failed usernames are dropped beyond this
+FLUSH_BATCH = 20  # pending lockout changes that trigger a write
+FLUSH_INTERVAL = 30  # seconds a pending change may wait for its batch
+
+
+class LoginThrottle:
+    """Per-username and global sliding windows of failed logins, with batched lockout persistence"""
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = OrderedDict()  # username -> deque of failure times, least recent first
+        self._global = deque(maxlen=GLOBAL_MAX_FAILURES)
+        self._lockouts = {}  # username -> locked_until
+        self._dirty = {}  # username -> locked_until to write, 0 to delete
+        self._last_flush = clock()
+        self.rejected = 0
+
+    def load(self):
+        """Read lockouts that have not expired yet; called once before the first check"""
+        try:
+            with db_connection() as conn:
+                rows = conn.execute('SELECT username, locked_until FROM login_lockouts WHERE locked_until > ?',
+                                    (self._clock(),)).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Error loading login lockouts: %s", e)
+            return 0
+        with self._lock:
+            self._lockouts.update(rows)
+        if rows:
+            logger.info("Restored %s login lockouts", len(rows))
+        return len(rows)
+
+    def check(self, username):
+        """(allowed, retry_after_seconds) for an attempt to log in as username"""
+        now = self._clock()
+        with self._lock:
+            locked_until = self._lockouts.get(username)
+            if locked_until is not None:
+                if locked_until > now:
+                    self.rejected += 1
+                    return False, locked_until - now
+                del self._lockouts[username]
+                self._dirty[username] = 0
+            # The global window is full once maxlen failures fall inside it
+            if len(self._global) == self._global.maxlen and now - self._global[0] < GLOBAL_WINDOW:
+                self.rejected += 1
+                return False, GLOBAL_WINDOW - (now - self._global[0])
+        return True, 0
+
+    def record_failure(self, username):
+        now = self._clock()
+        with self._lock:
+            self._global.append(now)
+            failures = self._failures.pop(username, None) or deque(maxlen=USER_MAX_FAILURES)
+            failures.append(now)
+            while failures and now - failures[0] >= USER_WINDOW:
+                failures.popleft()
+            self._failures[username] = failures
+            if len(failures) >= USER_MAX_FAILURES:
+                self._lockouts[username] = self._dirty[username] = now + LOCKOUT_SECONDS
+                failures.clear()
+                logger.warning("Locked out %s for %s s after "
+                               "%s failed logins", username, LOCKOUT_SECONDS, USER_MAX_FAILURES)
+            self._evict(now)
+        self._maybe_flush(now)
+
+    def record_success(self, username):
+        now = self._clock()
+        with self._lock:
+            self._failures.pop(username, None)
+            if self._lockouts.pop(username, None) is not None:
+                self._dirty[username] = 0
+        self._maybe_flush(now)
+
+    def _evict(self, now):
+        # Entries are ordered by last failure, so expired ones sit at the front
+        while self._failures:
+            username, failures = next(iter(self._failures.items()))
+            if len(self._failures) <= MAX_TRACKED_USERS and failures and now - failures[-1] < USER_WINDOW:
+                break
+            self._failures.popitem(last=False)
+        for username in [name for name, until in self._lockouts.items() if until <= now]:
+            del self._lockouts[username]
+
+    def _maybe_flush(self, now):
+        if self._dirty and (len(self._dirty) >= FLUSH_BATCH or now - self._last_flush >= FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        """Write pending lockout changes in one transaction"""
+        with self._lock:
+            pending, self._dirty = self._dirty, {}
+            self._last_flush = self._clock()
+        if not pending:
+            return 0
+        try:
+            with db_transaction() as conn:
+                conn.executemany('INSERT OR REPLACE INTO login_lockouts (username, locked_until) VALUES (?, ?)',
+                                 [(name, until) for name, until in pending.items() if until])
+                conn.executemany('DELETE FROM login_lockouts WHERE username = ?',
+                                 [(name,) for name, until in pending.items() if not until])
+        except sqlite3.Error as e:
+            logger.error("Error saving login lockouts: %s", e)
+            with self._lock:
+                # Keep anything newer that arrived while writing
+                self._dirty = {**pending, **self._dirty}
+            return 0
+        return len(pending)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'tracked_users': len(self._failures),
+                'locked_out': len(self._lockouts),
+                'pending_writes': len(self._dirty),
+                'rejected': self.rejected,
+            }
+
+
+_throttle = None
+_throttle_lock = threading.Lock()
+
+
+def get_login_throttle():
+    """Process-wide throttle, with persisted lockouts loaded on first use"""
+    global _throttle
+    if _throttle is None:
+        with _throttle_lock:
+            if _throttle is None:
+                throttle = LoginThrottle()
+                throttle.load()
+                _throttle = throttle
+    return _throttle
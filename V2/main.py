@@ -1,3 +1,7 @@
+# Startup profiling (FITPLUS_PROFILE_STARTUP=1 or --profile-startup) has to start before the imports it times
+from startup_profile import get_startup_profiler
+startup = get_startup_profiler()
+
 # Importing the required libraries
 import tkinter
 from tkinter import ttk, Label, simpledialog
@@ -10,23 +14,33 @@ from PIL import Image, ImageTk
 import webbrowser
 import sqlite3
 import pywinstyles
-import random
 import datetime
+import math
+import time
 import pygame
 import logging
 import os
 import sys
 from pathlib import Path
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('fitplus.log'),
-        logging.StreamHandler()
-    ]
-)
+from database import db_connection, db_transaction, close_pool
+from user_state import get_user_snapshot, invalidate_snapshot, apply_user_deltas, forget_user
+from food_log import log_food, clear_day, get_food_log_writer
+from measurements import record_measurement, get_downsampled
+from migrations import migrate, SCHEMA_VERSION
+from food_catalog import get_food_catalog
+from food_search import get_food_search_index
+from particles import ParticleFrame, get_animation_scheduler
+from image_cache import get_image_cache
+from thumbnails import get_thumbnail, open_scaled, RESAMPLE
+from image_loader import get_image_loader
+from pages import Page
+from login_throttle import get_login_throttle
+from credentials import hash_password, verify_password, needs_rehash, run_in_background, shutdown_worker
+from log_pipeline import setup_logging, stop_logging
+from events import get_event_recorder
+
+# Configure logging: records are queued here and written to a rotating fitplus.log by a background thread
+setup_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Constants for better maintainability
@@ -51,210 +65,58 @@ FONTS = {
     'section_title': ("Impact", 35)
 }
 
-# Performance constants
-PARTICLE_COUNT = 50  # Reduced from 100
-PARTICLE_UPDATE_INTERVAL = 16  # ~60 FPS
-PARTICLE_RESPAWN_TIME = 15
-
 # Validation constants
 MIN_PASSWORD_LENGTH = 6
 MIN_USERNAME_LENGTH = 3
 MAX_WEIGHT = 500  # kg
 MAX_PR = 1000  # kg
 
-#--------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-# Enhanced Particle System with memory leak fixes
-
-class Particle:
-    def __init__(self, canvas):
-        try:
-            self.canvas = canvas
-            self.radius = min(self.canvas.size, 5)  # Limit particle size
-            canvas_width = max(self.canvas.winfo_width(), 800)
-            canvas_height = max(self.canvas.winfo_height(), 600)
-            
-            self.x = random.randint(self.radius, canvas_width - self.radius)
-            self.y = random.randint(self.radius, canvas_height - self.radius)
-            self.dx = random.uniform(-0.5, 0.5)  # Slower movement for better performance
-            self.dy = random.uniform(-0.5, 0.5)
-            self.lifetime = random.randint(100, 300)  # Particle lifetime
-            self.age = 0
-        except Exception as e:
-            logger.error(f"Error creating particle: {e}")
-            self.x = self.y = 50
-            self.dx = self.dy = 0.1
+# Pages other than the dashboard are built on first visit, or in idle time after login
+PREWARM_PAGES = True
+PREWARM_DELAY_MS = 300  # pause between pre-warmed pages so input stays responsive
 
-    def move(self):
-        try:
-            self.x += self.dx
-            self.y += self.dy
-            self.age += 1
-            if hasattr(self, 'id'):
-                self.canvas.move(self.id, self.dx, self.dy)
-        except Exception as e:
-            logger.error(f"Error moving particle: {e}")
-
-    def is_expired(self):
-        return self.age > self.lifetime
-
-class ParticleFrame(tkinter.Canvas):
-    def __init__(self,
-                 master,
-                 fg_color="black",
-                 particle_color="white",
-                 particle_size=3,
-                 particle_count=PARTICLE_COUNT,
-                 respawn=PARTICLE_RESPAWN_TIME,
-                 **kwargs):
-
-        super().__init__(master, bg=fg_color,
-                         highlightthickness=0,
-                         borderwidth=0, **kwargs)
-        
-        self.color = particle_color
-        self.size = particle_size
-        self.particles = []
-        self.num_particles = particle_count
-        self.respawn = respawn
-        self._stop = False
-        self.max_particles = particle_count * 2  # Limit total particles
-        
-        self.after(200, self.start)
-        self.bind("<Destroy>", lambda e: self.stop())
-        
-    def stop(self):
-        self._stop = True
-        self.cleanup_particles()
-        
-    def cleanup_particles(self):
-        """Clean up particle objects to prevent memory leaks"""
-        try:
-            for particle in self.particles[:]:
-                if hasattr(particle, 'id'):
-                    self.delete(particle.id)
-            self.particles.clear()
-        except Exception as e:
-            logger.error(f"Error cleaning up particles: {e}")
-        
-    def create_particles(self):
-        if self._stop:
-            return
-            
-        try:
-            # Remove expired particles first
-            self.particles = [p for p in self.particles if not p.is_expired()]
-            
-            # Limit total particles
-            particles_to_create = min(
-                self.num_particles - len(self.particles),
-                self.max_particles - len(self.particles)
-            )
-            
-            for _ in range(max(0, particles_to_create)):
-                particle = Particle(self)
-                try:
-                    particle.id = self.create_oval(
-                        particle.x - self.size,
-                        particle.y - self.size,
-                        particle.x + self.size,
-                        particle.y + self.size,
-                        fill=self.color, outline=self.color
-                    )
-                    self.particles.append(particle)
-                except Exception as e:
-                    logger.error(f"Error creating particle oval: {e}")
-                    
-            self.after(self.respawn * 1000, self.create_particles)
-        except Exception as e:
-            logger.error(f"Error in create_particles: {e}")
-        
-    def move_particles(self):
-        try:
-            expired_particles = []
-            for particle in self.particles:
-                particle.move()
-                if particle.is_expired():
-                    expired_particles.append(particle)
-            
-            # Remove expired particles
-            for particle in expired_particles:
-                try:
-                    if hasattr(particle, 'id'):
-                        self.delete(particle.id)
-                    self.particles.remove(particle)
-                except Exception as e:
-                    logger.error(f"Error removing expired particle: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error moving particles: {e}")
+# Calorie counter nutrient rows: label and UserSnapshot field
+CALORIE_NUTRIENTS = [
+    ("Fats", 'daily_fat'),
+    ("Carbohydrates", 'daily_carbs'),
+    ("Proteins", 'daily_protein'),
+    ("Sugars", 'daily_sugars'),
+]
 
-    def start(self):
-        self.create_particles()
-        self.after(PARTICLE_UPDATE_INTERVAL, self.update_simulation)
-        self._stop = False
-        
-    def update_simulation(self):
-        if self._stop:
-            return
-        try:
-            self.move_particles()
-            self.after(PARTICLE_UPDATE_INTERVAL, self.update_simulation)
-        except Exception as e:
-            logger.error(f"Error in update_simulation: {e}")
+# Progress achievements: text, UserSnapshot field and the value that unlocks it
+ACHIEVEMENTS = [
+    ("Reach a 20kg bench press", 'bench_press_pr', 20),
+    ("Reach a 40kg bench press", 'bench_press_pr', 40),
+    ("Reach a 60kg bench press", 'bench_press_pr', 60),
+    ("Reach a 80kg bench press", 'bench_press_pr', 80),
+    ("Reach a 100kg bench press", 'bench_press_pr', 100),
+    ("Reach a 20kg squat", 'squat_pr', 20),
+    ("Reach a 40kg squat", 'squat_pr', 40),
+    ("Reach a 60kg squat", 'squat_pr', 60),
+    ("Reach a 80kg squat", 'squat_pr', 80),
+    ("Reach a 100kg squat", 'squat_pr', 100),
+    ("Reach a 60kg deadlift", 'deadlift_pr', 60),
+    ("Reach a 80kg deadlift", 'deadlift_pr', 80),
+    ("Reach a 100kg deadlift", 'deadlift_pr', 100),
+    ("Reach a 120kg deadlift", 'deadlift_pr', 120),
+    ("Reach a 140kg deadlift", 'deadlift_pr', 140),
+]
 
 dropdown_theme_created = False
 
 #--------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 # Enhanced Database Operations with proper error handling
-
-def get_db_connection():
-    """Get database connection with error handling"""
-    try:
-        conn = sqlite3.connect('fitplus.db', timeout=10.0)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
-    except sqlite3.Error as e:
-        logger.error(f"Database connection error: {e}")
-        raise
+# All helpers share the pooled connections from database.py
 
 def setup_database():
-    """Setup database with enhanced error handling and better field types"""
-    conn = None
+    """Bring fitplus.db up to the current schema version"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                username TEXT PRIMARY KEY,
-                password TEXT NOT NULL,
-                security_question TEXT NOT NULL,
-                security_answer TEXT NOT NULL,
-                daily_calorie_limit INTEGER DEFAULT 2000,
-                daily_calorie_intake INTEGER DEFAULT 0,
-                daily_fat REAL DEFAULT 0,
-                daily_carbs REAL DEFAULT 0,
-                daily_protein REAL DEFAULT 0,
-                daily_sugars REAL DEFAULT 0,
-                current_weight REAL DEFAULT 0,
-                ideal_weight REAL DEFAULT 0,
-                bench_press_pr REAL DEFAULT 0,
-                squat_pr REAL DEFAULT 0,
-                deadlift_pr REAL DEFAULT 0,
-                last_update DATE DEFAULT (DATE('now')),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
-        logger.info("Database setup completed successfully")
+        migrate()
+        logger.info("Database setup completed successfully (schema version %s)", SCHEMA_VERSION)
         return True
     except sqlite3.Error as e:
-        logger.error(f"Database setup error: {e}")
-        if conn:
-            conn.rollback()
+        logger.error("Database setup error: %s", e)
         return False
-    finally:
-        if conn:
-            conn.close()
 
 def validate_input(value, input_type, min_val=None, max_val=None):
     """Generic input validation function"""
@@ -289,7 +151,7 @@ def validate_input(value, input_type, min_val=None, max_val=None):
                 return False, "Please enter a valid number"
                 
     except Exception as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return False, "Validation error occurred"
 
 def update_user_data(username, **kwargs):
@@ -297,49 +159,38 @@ def update_user_data(username, **kwargs):
     if not kwargs:
         return False, "No data to update"
     
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Build dynamic query
         set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
         values = list(kwargs.values()) + [username]
         
         query = f"UPDATE users SET {set_clause} WHERE username = ?"
-        cursor.execute(query, values)
-        
-        if cursor.rowcount == 0:
-            return False, "User not found"
+        with db_transaction() as conn:
+            cursor = conn.execute(query, values)
+            if cursor.rowcount == 0:
+                return False, "User not found"
         
-        conn.commit()
-        logger.info(f"Updated user data for {username}: {kwargs}")
+        invalidate_snapshot(username)
+        # Lazy %-args: the kwargs dict is only rendered by the log writer thread
+        logger.info("Updated user data for %s: %s", username, kwargs)
         return True, "Update successful"
         
     except sqlite3.Error as e:
-        logger.error(f"Error updating user data: {e}")
-        if conn:
-            conn.rollback()
+        logger.error("Error updating user data: %s", e)
         return False, f"Database error: {str(e)}"
-    finally:
-        if conn:
-            conn.close()
 
 def get_user_data(username, fields=None):
     """Generic function to get user data"""
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         if fields:
             field_list = ", ".join(fields)
             query = f"SELECT {field_list} FROM users WHERE username = ?"
         else:
             query = "SELECT * FROM users WHERE username = ?"
         
-        cursor.execute(query, (username,))
-        result = cursor.fetchone()
+        with db_connection() as conn:
+            cursor = conn.execute(query, (username,))
+            result = cursor.fetchone()
         
         if result:
             if fields:
@@ -351,11 +202,8 @@ def get_user_data(username, fields=None):
         return None
         
     except sqlite3.Error as e:
-        logger.error(f"Error getting user data: {e}")
+        logger.error("Error getting user data: %s", e)
         return None
-    finally:
-        if conn:
-            conn.close()
 
 def register_user(username, password, security_question, security_answer):
     """Enhanced user registration with validation"""
@@ -376,31 +224,24 @@ def register_user(username, password, security_question, security_answer):
     if not valid:
         return False, "Security answer is required"
     
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO users (username, password, security_question, security_answer)
-            VALUES (?, ?, ?, ?)
-        ''', (username, password, security_question, security_answer))
-        conn.commit()
-        logger.info(f"User {username} registered successfully")
+        password_hash = hash_password(password)
+        with db_transaction() as conn:
+            conn.execute('''
+                INSERT INTO users (username, password, security_question, security_answer)
+                VALUES (?, ?, ?, ?)
+            ''', (username, password_hash, security_question, security_answer))
+        logger.info("User %s registered successfully", username)
         return True, "Registration successful"
     except sqlite3.IntegrityError:
-        logger.warning(f"Registration failed - username {username} already exists")
+        logger.warning("Registration failed - username %s already exists", username)
         return False, "Username already exists"
     except sqlite3.Error as e:
-        logger.error(f"Registration error: {e}")
-        if conn:
-            conn.rollback()
+        logger.error("Registration error: %s", e)
         return False, "Registration failed - database error"
-    finally:
-        if conn:
-            conn.close()
 
 def login_user(username, password):
-    """Enhanced login with validation"""
+    """Enhanced login with validation; slow by design, so the UI calls it off the Tk thread"""
     valid, username = validate_input(username, 'string')
     if not valid:
         return False, username
@@ -408,60 +249,76 @@ def login_user(username, password):
     valid, password = validate_input(password, 'string')
     if not valid:
         return False, password
+
+    started = time.perf_counter()
+    events = get_event_recorder()
+
+    # Throttled attempts stop here, before any database read or password hash
+    throttle = get_login_throttle()
+    allowed, retry_after = throttle.check(username)
+    if not allowed:
+        logger.warning("Login throttled for user %s", username)
+        events.record('login', username, (time.perf_counter() - started) * 1000, 'throttled')
+        return False, f"Too many failed attempts. Try again in {math.ceil(retry_after)} seconds"
     
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT password FROM users WHERE username = ?', (username,))
-        result = cursor.fetchone()
+        with db_connection() as conn:
+            result = conn.execute('SELECT password FROM users WHERE username = ?', 
+                                  (username,)).fetchone()
         
-        if result and result[0] == password:
-            logger.info(f"User {username} logged in successfully")
+        if verify_password(password, result[0] if result else None):
+            if needs_rehash(result[0]):
+                # Plain-text row or older cost parameters: store a current hash while we have the password
+                with db_transaction() as conn:
+                    conn.execute('UPDATE users SET password = ? WHERE username = ?',
+                                 (hash_password(password), username))
+                logger.info("Upgraded password hash for user %s", username)
+            throttle.record_success(username)
+            events.record('login', username, (time.perf_counter() - started) * 1000, 'ok')
+            logger.info("User %s logged in successfully", username)
             return True, "Login successful"
         else:
-            logger.warning(f"Login failed for user {username}")
+            throttle.record_failure(username)
+            events.record('login', username, (time.perf_counter() - started) * 1000, 'failed')
+            logger.warning("Login failed for user %s", username)
             return False, "Invalid username or password"
             
     except sqlite3.Error as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
+        events.record('login', username, (time.perf_counter() - started) * 1000, 'error')
         return False, "Login failed - database error"
-    finally:
-        if conn:
-            conn.close()
 
-def forgot_password(username, security_answer):
-    """Enhanced forgot password with validation"""
+def reset_password(username, security_answer, new_password):
+    """Set a new password once the security answer checks out; stored hashes cannot be read back"""
     valid, username = validate_input(username, 'string')
     if not valid:
-        return None, username
+        return False, username
     
     valid, security_answer = validate_input(security_answer, 'string')
     if not valid:
-        return None, "Security answer is required"
+        return False, "Security answer is required"
+
+    valid, new_password = validate_input(new_password, 'password')
+    if not valid:
+        return False, new_password
     
-    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT password FROM users WHERE username = ? AND security_answer = ?
-        ''', (username, security_answer))
-        result = cursor.fetchone()
+        password_hash = hash_password(new_password)
+        with db_transaction() as conn:
+            updated = conn.execute('''
+                UPDATE users SET password = ? WHERE username = ? AND security_answer = ?
+            ''', (password_hash, username, security_answer)).rowcount
         
-        if result:
-            logger.info(f"Password retrieved for user {username}")
-            return result[0], "Password retrieved successfully"
+        if updated:
+            logger.info("Password reset for user %s", username)
+            return True, "Password reset successfully"
         else:
-            logger.warning(f"Password retrieval failed for user {username}")
-            return None, "Incorrect username or security answer"
+            logger.warning("Password reset failed for user %s", username)
+            return False, "Incorrect username or security answer"
             
     except sqlite3.Error as e:
-        logger.error(f"Password retrieval error: {e}")
-        return None, "Database error occurred"
-    finally:
-        if conn:
-            conn.close()
+        logger.error("Password reset error: %s", e)
+        return False, "Database error occurred"
 
 def delete_account():
     """Enhanced account deletion with validation"""
@@ -475,11 +332,10 @@ def delete_account():
         if success:
             # Instead of actually deleting, we could mark as deleted
             # For now, we'll still delete as per original functionality
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM users WHERE username = ?', (username,))
-            conn.commit()
-            conn.close()
+            get_food_log_writer().flush(username)
+            with db_transaction() as conn:
+                conn.execute('DELETE FROM users WHERE username = ?', (username,))
+            forget_user(username)
             
             # Hide the main app frame and show the login screen
             mainapp.pack_forget()
@@ -490,22 +346,22 @@ def delete_account():
             user_var.set("")
             pass_var.set("")
             
-            logger.info(f"Account deleted for user {username}")
+            logger.info("Account deleted for user %s", username)
             return True, "Account deleted successfully"
         else:
             return False, message
             
     except Exception as e:
-        logger.error(f"Error deleting account: {e}")
+        logger.error("Error deleting account: %s", e)
         return False, "Error deleting account"
     
 def open_youtube_video(url):
     """Safely open YouTube videos - Global function"""
     try:
         webbrowser.open(url)
-        logger.info(f"Opened YouTube video: {url}")
+        logger.info("Opened YouTube video: %s", url)
     except Exception as e:
-        logger.error(f"Error opening YouTube video {url}: {e}")
+        logger.error("Error opening YouTube video %s: %s", url, e)
         CTkMessagebox(title="Error", message="Could not open video", 
                     icon="warning", justify=CENTER, button_color="black")
 
@@ -513,140 +369,96 @@ def open_recipe_link(url):
     """Safely open recipe links - Global function"""
     try:
         webbrowser.open(url)
-        logger.info(f"Opened recipe: {url}")
+        logger.info("Opened recipe: %s", url)
     except Exception as e:
-        logger.error(f"Error opening recipe {url}: {e}")
+        logger.error("Error opening recipe %s: %s", url, e)
         CTkMessagebox(title="Error", message="Could not open recipe", 
                     icon="warning", justify=CENTER, button_color="black")
 
-def check_and_reset_calorie_data(username):
-    """Enhanced daily reset with better error handling"""
-    conn = None
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT last_update FROM users WHERE username = ?", (username,))
-        result = cursor.fetchone()
-        
-        if not result:
-            logger.warning(f"User {username} not found for calorie reset")
-            return False
-        
-        last_update = result[0] if result[0] else "1970-01-01"
-        today = datetime.date.today().isoformat()
-        
-        if last_update < today:
-            cursor.execute('''
-                UPDATE users SET 
-                daily_calorie_intake = 0,
-                daily_fat = 0,
-                daily_carbs = 0,
-                daily_protein = 0,
-                daily_sugars = 0,
-                last_update = ?
-                WHERE username = ?
-            ''', (today, username))
-            conn.commit()
-            logger.info(f"Daily nutrition data reset for user {username}")
-            return True
-        return False
-        
-    except sqlite3.Error as e:
-        logger.error(f"Error resetting calorie data: {e}")
-        if conn:
-            conn.rollback()
-        return False
-    finally:
-        if conn:
-            conn.close()
-
 # Enhanced wrapper functions for backward compatibility
 def update_current_weight(username, new_weight):
     valid, weight = validate_input(str(new_weight), 'numeric', 0, MAX_WEIGHT)
     if not valid:
-        logger.error(f"Invalid weight value: {weight}")
+        logger.error("Invalid weight value: %s", weight)
         return False, weight
     
     success, message = update_user_data(username, current_weight=weight)
     if success:
-        logger.info(f"Current weight updated for {username}: {weight}")
+        record_measurement(username, 'current_weight', weight)
+        logger.info("Current weight updated for %s: %s", username, weight)
     return success, message
 
 def update_ideal_weight(username, new_weight):
     valid, weight = validate_input(str(new_weight), 'numeric', 0, MAX_WEIGHT)
     if not valid:
-        logger.error(f"Invalid ideal weight value: {weight}")
+        logger.error("Invalid ideal weight value: %s", weight)
         return False, weight
     
     success, message = update_user_data(username, ideal_weight=weight)
     if success:
-        logger.info(f"Ideal weight updated for {username}: {weight}")
+        record_measurement(username, 'ideal_weight', weight)
+        logger.info("Ideal weight updated for %s: %s", username, weight)
     return success, message
 
 def update_bench_press_pr(username, new_pr):
     valid, pr = validate_input(str(new_pr), 'numeric', 0, MAX_PR)
     if not valid:
-        logger.error(f"Invalid bench press PR: {pr}")
+        logger.error("Invalid bench press PR: %s", pr)
         return False, pr
     
     success, message = update_user_data(username, bench_press_pr=pr)
     if success:
-        logger.info(f"Bench press PR updated for {username}: {pr}")
+        record_measurement(username, 'bench_press_pr', pr)
+        logger.info("Bench press PR updated for %s: %s", username, pr)
     return success, message
 
 def update_squat_pr(username, new_pr):
     valid, pr = validate_input(str(new_pr), 'numeric', 0, MAX_PR)
     if not valid:
-        logger.error(f"Invalid squat PR: {pr}")
+        logger.error("Invalid squat PR: %s", pr)
         return False, pr
     
     success, message = update_user_data(username, squat_pr=pr)
     if success:
-        logger.info(f"Squat PR updated for {username}: {pr}")
+        record_measurement(username, 'squat_pr', pr)
+        logger.info("Squat PR updated for %s: %s", username, pr)
     return success, message
 
 def update_deadlift_pr(username, new_pr):
     valid, pr = validate_input(str(new_pr), 'numeric', 0, MAX_PR)
     if not valid:
-        logger.error(f"Invalid deadlift PR: {pr}")
+        logger.error("Invalid deadlift PR: %s", pr)
         return False, pr
     
     success, message = update_user_data(username, deadlift_pr=pr)
     if success:
-        logger.info(f"Deadlift PR updated for {username}: {pr}")
+        record_measurement(username, 'deadlift_pr', pr)
+        logger.info("Deadlift PR updated for %s: %s", username, pr)
     return success, message
 
 def get_user_calorie_limit(username):
     try:
-        data = get_user_data(username, ['daily_calorie_limit'])
-        return data['daily_calorie_limit'] if data else 2000
+        snapshot = get_user_snapshot(username)
+        return snapshot.daily_calorie_limit if snapshot else 2000
     except Exception as e:
-        logger.error(f"Error getting calorie limit: {e}")
+        logger.error("Error getting calorie limit: %s", e)
         return 2000
 
 def get_user_calorie_intake(username):
     try:
-        check_and_reset_calorie_data(username)
-        data = get_user_data(username, ['daily_calorie_intake'])
-        return data['daily_calorie_intake'] if data else 0
+        # Today's total comes from the daily_nutrition summary row
+        snapshot = get_user_snapshot(username)
+        return snapshot.daily_calorie_intake if snapshot else 0
     except Exception as e:
-        logger.error(f"Error getting calorie intake: {e}")
+        logger.error("Error getting calorie intake: %s", e)
         return 0
 
-def reset_daily_calorie_intake(username):
-    success, message = update_user_data(username, daily_calorie_intake=0)
-    if success:
-        logger.info(f"Daily calorie intake reset for {username}")
-    return success, message
-
-def reset_nutrition(username):
-    success, message = update_user_data(username, 
-                                       daily_fat=0,
-                                       daily_carbs=0,
-                                       daily_protein=0,
-                                       daily_sugars=0)
+def reset_daily_intake(username):
+    """Clear today's food log, which zeroes both calories and macros"""
+    success, message = clear_day(username)
+    invalidate_snapshot(username)
     if success:
-        logger.info(f"Nutrition data reset for {username}")
+        logger.info("Daily intake reset for %s", username)
     return success, message
 
 def save_new_calorie_limit(username, new_limit):
@@ -656,98 +468,115 @@ def save_new_calorie_limit(username, new_limit):
     
     success, message = update_user_data(username, daily_calorie_limit=int(limit))
     if success:
-        logger.info(f"Calorie limit updated for {username}: {limit}")
+        logger.info("Calorie limit updated for %s: %s", username, limit)
     return success, message
 
 def add_food_to_intake(selected_item_name):
     """Enhanced food addition with better error handling"""
-    global items, current_username
+    global current_username
     
     try:
         if not selected_item_name or not current_username:
             logger.warning("Missing item name or username for food addition")
             return False, "Invalid selection"
         
-        selected_item = next((item for item in items if item["name"] == selected_item_name), None)
+        selected_item = get_food_catalog().by_name(selected_item_name)
         if not selected_item:
-            logger.warning(f"Food item not found: {selected_item_name}")
+            logger.warning("Food item not found: %s", selected_item_name)
             return False, "Food item not found"
 
-        # Get current intake from database
-        current_data = get_user_data(current_username, [
-            'daily_calorie_intake', 'daily_fat', 'daily_carbs', 
-            'daily_protein', 'daily_sugars'
-        ])
-        
-        if not current_data:
-            logger.error(f"User data not found: {current_username}")
-            return False, "User data not found"
-
-        # Calculate new values
-        new_intake = current_data['daily_calorie_intake'] + selected_item["calories"]
-        new_fats = current_data['daily_fat'] + selected_item["fat"]
-        new_carbs = current_data['daily_carbs'] + selected_item["carbs"]
-        new_protein = current_data['daily_protein'] + selected_item["protein"]
-        new_sugars = current_data['daily_sugars'] + selected_item["sugars"]
-
-        # Update database
-        success, message = update_user_data(current_username,
-                                           daily_calorie_intake=new_intake,
-                                           daily_fat=new_fats,
-                                           daily_carbs=new_carbs,
-                                           daily_protein=new_protein,
-                                           daily_sugars=new_sugars)
+        # Queue for the food log; once written, a trigger updates today's summary row
+        today = datetime.date.today().isoformat()
+        success, message = log_food(current_username, selected_item.name, selected_item.nutrition(), today)
         
         if success:
+            # Fold into the cached snapshot now; the batched write catches the database up
+            apply_user_deltas(current_username, today,
+                              daily_calorie_intake=selected_item.calories,
+                              daily_fat=selected_item.fat,
+                              daily_carbs=selected_item.carbs,
+                              daily_protein=selected_item.protein,
+                              daily_sugars=selected_item.sugars)
+
             # Refresh the UI
             update_calorie_counter_section()
-            logger.info(f"Added {selected_item_name} to {current_username}'s intake")
+            logger.info("Added %s to %s's intake", selected_item_name, current_username)
             return True, "Food added successfully"
         else:
             return False, message
             
     except Exception as e:
-        logger.error(f"Error adding food to intake: {e}")
+        logger.error("Error adding food to intake: %s", e)
         return False, "Error adding food item"
 
 # Safe file operations
-def safe_load_image(path, size=None, default_size=(100, 100)):
-    """Safely load images with fallback"""
+def safe_load_image(path, size=None, default_size=(100, 100), resample=RESAMPLE):
+    """Safely load images with fallback; decoded images are shared through the image cache"""
+    cache = get_image_cache()
+    key = (path, size, 'pil') if resample == RESAMPLE else (path, size, 'pil', resample)
+    img = cache.get(key)
+    if img is not None:
+        return img
     try:
         if not os.path.exists(path):
-            logger.warning(f"Image file not found: {path}")
-            # Create a simple placeholder image
-            img = Image.new('RGB', size or default_size, color='gray')
+            logger.warning("Image file not found: %s", path)
+            # Create a simple placeholder image (not cached, the file may appear later)
+            return Image.new('RGB', size or default_size, color='gray')
+        # A stored pre-scaled variant skips decoding the full-size source
+        variant = get_thumbnail(path, size, resample=resample) if size else None
+        if variant:
+            img = Image.open(variant)
+            img.load()
+        elif size:
+            img = open_scaled(path, size, resample)
         else:
             img = Image.open(path)
-            if size:
-                img = img.resize(size)
-        return img
+            img.load()
+        return cache.put(key, img)
     except Exception as e:
-        logger.error(f"Error loading image {path}: {e}")
+        logger.error("Error loading image %s: %s", path, e)
         # Return placeholder
         return Image.new('RGB', size or default_size, color='gray')
 
+def safe_load_photo_image(path, size=None):
+    """Cached Tk PhotoImage for a thumbnail Label"""
+    if not os.path.exists(path):
+        return ImageTk.PhotoImage(safe_load_image(path, size))
+    return get_image_cache().get_or_load((path, size, 'photo'),
+                                         lambda: ImageTk.PhotoImage(safe_load_image(path, size)))
+
 def safe_load_ctk_image(path, size=None):
     """Safely load CTkImage with fallback"""
     try:
-        img = safe_load_image(path, size)
-        return CTkImage(dark_image=img, light_image=img, size=size or (100, 100))
+        if not os.path.exists(path):
+            img = safe_load_image(path, size)
+            return CTkImage(dark_image=img, light_image=img, size=size or (100, 100))
+
+        def load():
+            img = safe_load_image(path, size)
+            return CTkImage(dark_image=img, light_image=img, size=size or (100, 100))
+        return get_image_cache().get_or_load((path, size, 'ctk'), load)
     except Exception as e:
-        logger.error(f"Error creating CTkImage: {e}")
+        logger.error("Error creating CTkImage: %s", e)
         # Create simple placeholder
         placeholder = Image.new('RGB', size or (100, 100), color='gray')
         return CTkImage(dark_image=placeholder, light_image=placeholder, size=size or (100, 100))
 
 # Initialize database
 try:
-    if not setup_database():
+    with startup.phase('setup_database'):
+        database_ready = setup_database()
+    if not database_ready:
         logger.error("Failed to setup database")
         sys.exit(1)
 except Exception as e:
-    logger.error(f"Critical database error: {e}")
+    logger.error("Critical database error: %s", e)
     sys.exit(1)
 
+# Load the food catalog and its search index once so page renders never touch the dataset file
+with startup.phase('food search index'):
+    get_food_search_index()
+
 #--------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
 # Global variables with proper initialization
@@ -757,6 +586,7 @@ selected_food = ""
 
 # Initialize the main application
 try:
+    startup.mark('window creation started')
     app = customtkinter.CTk()
     app.configure(bg=COLORS['primary_bg'])
     app.title("FitPlus")
@@ -777,6 +607,7 @@ try:
     x_cordinate = int((screen_width / 2) - (window_width / 2))
     y_cordinate = int((screen_height / 2) - (window_height / 2))
     app.geometry("{}x{}+{}+{}".format(window_width, window_height, x_cordinate, y_cordinate))
+    startup.mark('window created')
 
     # Initialize particle system
     particle_frame = ParticleFrame(app)
@@ -791,7 +622,7 @@ try:
     fitplus_smallicon = safe_load_ctk_image("fitplus_smallicon.ico", (96, 96))
 
 except Exception as e:
-    logger.error(f"Error initializing application: {e}")
+    logger.error("Error initializing application: %s", e)
     sys.exit(1)
 
 # Security questions
@@ -836,7 +667,24 @@ def loginClick():
                          icon="warning", justify=CENTER, button_color="black")
             return
         
-        success, message = login_user(username_input, password_input)
+        # Password hashing takes a few hundred ms; keep the login screen responsive meanwhile
+        loginButton.configure(state="disabled", text="Logging in...")
+        run_in_background(app, lambda: login_user(username_input, password_input),
+                          lambda result: finish_login(username_input, result))
+    except Exception as e:
+        logger.error("Login error: %s", e)
+        CTkMessagebox(title="Error", 
+                     message="An error occurred during login", 
+                     icon="cancel", justify=CENTER, button_color="black")
+
+def finish_login(username_input, result):
+    """Back on the Tk thread with login_user's (success, message) or the exception it raised"""
+    try:
+        loginButton.configure(state="normal", text="Login")
+        if isinstance(result, Exception):
+            raise result
+
+        success, message = result
         if success:
             global current_username
             current_username = username_input
@@ -851,7 +699,7 @@ def loginClick():
                          message=message, 
                          icon="cancel", justify=CENTER, button_color="black")
     except Exception as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         CTkMessagebox(title="Error", 
                      message="An error occurred during login", 
                      icon="cancel", justify=CENTER, button_color="black")
@@ -861,6 +709,9 @@ def loginClick():
 # Registration Frame Setup with enhanced error handling
 def hide_registration_show_login():
     registration_frame.lower()
+    # Stacking changes send no <Visibility> on Windows, so the covered canvas is paused by hand
+    registration_particle_frame.pause()
+    particle_frame.resume()
 
 registration_frame = customtkinter.CTkFrame(app, width=800, height=475)
 registration_frame.place(x=0, y=0, relwidth=1, relheight=1)
@@ -870,9 +721,12 @@ registration_inner_frame = customtkinter.CTkFrame(registration_particle_frame, c
 registration_inner_frame.pack(expand=True)
 pywinstyles.set_opacity(registration_inner_frame, 0.9)
 registration_frame.lower()
+registration_particle_frame.pause()
 
 def show_registration():
     registration_frame.lift()
+    registration_particle_frame.resume()
+    particle_frame.pause()
     for widget in registration_inner_frame.winfo_children():
         widget.destroy()
 
@@ -958,7 +812,24 @@ def show_registration():
                             icon="warning", justify=CENTER, button_color="black")
                 return
 
-            success, message = register_user(username, password, security_question, security_answer)
+            regConfirm.configure(state="disabled")
+            run_in_background(app, lambda: register_user(username, password, security_question, security_answer),
+                              finish_registration)
+                
+        except Exception as e:
+            logger.error("Registration validation error: %s", e)
+            CTkMessagebox(title="Error", 
+                        message="An error occurred during registration", 
+                        icon="cancel", justify=CENTER, button_color="black")
+
+    def finish_registration(result):
+        try:
+            if regConfirm.winfo_exists():
+                regConfirm.configure(state="normal")
+            if isinstance(result, Exception):
+                raise result
+
+            success, message = result
             if success:
                 CTkMessagebox(title="Registration Successful", 
                             message="You have been registered successfully", 
@@ -968,9 +839,8 @@ def show_registration():
                 CTkMessagebox(title="Registration Failed", 
                             message=message, 
                             icon="warning", justify=CENTER, button_color="black")
-                
         except Exception as e:
-            logger.error(f"Registration validation error: {e}")
+            logger.error("Registration error: %s", e)
             CTkMessagebox(title="Error", 
                         message="An error occurred during registration", 
                         icon="cancel", justify=CENTER, button_color="black")
@@ -983,6 +853,8 @@ def show_registration():
 # Enhanced forgot password functionality
 def hide_forgot_password_show_login():
     forgot_password_frame.lower()
+    forgot_password_particle_frame.pause()
+    particle_frame.resume()
 
 forgot_password_frame = customtkinter.CTkFrame(app, width=800, height=475)
 forgot_password_frame.place(x=0, y=0, relwidth=1, relheight=1)
@@ -992,9 +864,12 @@ forgot_password_inner_frame = customtkinter.CTkFrame(forgot_password_particle_fr
 forgot_password_inner_frame.pack(expand=True)
 pywinstyles.set_opacity(forgot_password_inner_frame, 0.9)
 forgot_password_frame.lower()
+forgot_password_particle_frame.pause()
 
 def show_forgot_password():
     forgot_password_frame.lift()
+    forgot_password_particle_frame.resume()
+    particle_frame.pause()
     for widget in forgot_password_inner_frame.winfo_children():
         widget.destroy()
 
@@ -1060,36 +935,63 @@ def show_forgot_password():
                                           font=FONTS['input'])
     securityAnsInp.pack()
 
+    newPassTitle = customtkinter.CTkLabel(forgot_password_inner_frame, text="New Password", 
+                                        font=FONTS['subtitle'])
+    newPassTitle.pack(pady=6)
+    newPass_var_forgot = tkinter.StringVar()
+    newPassInp = customtkinter.CTkEntry(forgot_password_inner_frame, width=350, height=40, 
+                                      textvariable=newPass_var_forgot, border_color="white", 
+                                      font=FONTS['input'], show="*")
+    newPassInp.pack()
+
     def validate_answer():
-        """Enhanced password retrieval validation"""
+        """Enhanced password reset validation"""
         try:
             username = user_var_forgot.get().strip()
             security_answer = securityAns_var_forgot.get().strip()
+            new_password = newPass_var_forgot.get().strip()
             
-            if not username or not security_answer:
+            if not username or not security_answer or not new_password:
                 CTkMessagebox(title="Validation Error", 
-                            message="Please enter both username and security answer", 
+                            message="Please enter your username, security answer and a new password", 
                             icon="warning", justify=CENTER, button_color="black")
                 return
             
-            password, message = forgot_password(username, security_answer)
-            if password:
-                CTkMessagebox(title="Password Retrieved", 
-                            message=f"Your password is: {password}", 
+            validate_button.configure(state="disabled")
+            run_in_background(app, lambda: reset_password(username, security_answer, new_password),
+                              finish_reset)
+                
+        except Exception as e:
+            logger.error("Password reset error: %s", e)
+            CTkMessagebox(title="Error", 
+                        message="An error occurred while resetting password", 
+                        icon="cancel", justify=CENTER, button_color="black")
+
+    def finish_reset(result):
+        try:
+            if validate_button.winfo_exists():
+                validate_button.configure(state="normal")
+            if isinstance(result, Exception):
+                raise result
+
+            success, message = result
+            if success:
+                CTkMessagebox(title="Password Reset", 
+                            message="Your password has been reset. You can now log in with it.", 
                             icon="check", justify=CENTER, button_color="black")
+                hide_forgot_password_show_login()
             else:
                 CTkMessagebox(title="Validation Failed", 
                             message=message, 
                             icon="cancel", justify=CENTER, button_color="black")
-                
         except Exception as e:
-            logger.error(f"Password retrieval error: {e}")
+            logger.error("Password reset error: %s", e)
             CTkMessagebox(title="Error", 
-                        message="An error occurred while retrieving password", 
+                        message="An error occurred while resetting password", 
                         icon="cancel", justify=CENTER, button_color="black")
     
     validate_button = customtkinter.CTkButton(forgot_password_inner_frame, command=validate_answer, 
-                                            text="Retrieve Password", fg_color="black", 
+                                            text="Reset Password", fg_color="black", 
                                             hover_color="grey", font=FONTS['button'])
     validate_button.pack(padx=18, pady=18)
 
@@ -1114,21 +1016,29 @@ forgot_password_button.pack(padx=18, pady=16)
 
 def FitPlusApp():
     """Enhanced main application with better error handling and performance"""
+    login_started = time.perf_counter()
     
     def switch_page(page):
         """Enhanced page switching with error handling"""
         try:
-            pages = [workoutPage, nutritionPage, progressPage, settingsPage, dashboardPage]
-            for p in pages:
-                p.pack_forget()
-            page.pack(expand=True, fill='both')
-
-            # Ensure fixed widgets stay on top
-            fixed_widgets = [workoutButton, progressButton, nutritionButton, settingsButton, dashboardButton]
-            for widget in fixed_widgets:
-                widget.lift()
+            with get_event_recorder().timed('page_switch', current_username, page=page_names.get(page)) as event:
+                # A section not built yet is built right before it is first shown
+                section = section_pages.get(page)
+                if section is not None and not section.built:
+                    section.ensure_built()
+                    event['first_visit'] = True
+
+                pages = [workoutPage, nutritionPage, progressPage, settingsPage, dashboardPage]
+                for p in pages:
+                    p.pack_forget()
+                page.pack(expand=True, fill='both')
+
+                # Ensure fixed widgets stay on top
+                fixed_widgets = [workoutButton, progressButton, nutritionButton, settingsButton, dashboardButton]
+                for widget in fixed_widgets:
+                    widget.lift()
         except Exception as e:
-            logger.error(f"Error switching pages: {e}")
+            logger.error("Error switching pages: %s", e)
     
     def MealToNutrition():
         try:
@@ -1136,7 +1046,7 @@ def FitPlusApp():
             Frame6.lift()
             nutritionTitle.lift()
         except Exception as e:
-            logger.error(f"Error in MealToNutrition: {e}")
+            logger.error("Error in MealToNutrition: %s", e)
 
     def CalorieToNutrition():
         try:
@@ -1144,7 +1054,7 @@ def FitPlusApp():
             Frame6.lift()
             nutritionTitle.lift()
         except Exception as e:
-            logger.error(f"Error in CalorieToNutrition: {e}")
+            logger.error("Error in CalorieToNutrition: %s", e)
 
     def open_calorie_settings():
         """Enhanced calorie settings with better validation"""
@@ -1197,8 +1107,7 @@ def FitPlusApp():
                     
                     success, message = save_new_calorie_limit(current_username, new_limit)
                     if success:
-                        reset_daily_calorie_intake(current_username)
-                        reset_nutrition(current_username)
+                        reset_daily_intake(current_username)
                         calorie_settings_frame.destroy()
                         update_calorie_counter_section()
                         CTkMessagebox(title="Success", message="Calorie limit updated successfully", 
@@ -1207,7 +1116,7 @@ def FitPlusApp():
                         CTkMessagebox(title="Error", message=message, 
                                     icon="warning", justify=CENTER, button_color="black")
                 except Exception as e:
-                    logger.error(f"Error saving calorie limit: {e}")
+                    logger.error("Error saving calorie limit: %s", e)
                     CTkMessagebox(title="Error", message="Error updating calorie limit", 
                                 icon="cancel", justify=CENTER, button_color="black")
 
@@ -1217,7 +1126,7 @@ def FitPlusApp():
             save_button.place(relx=0.5, rely=0.6, anchor='center')
             
         except Exception as e:
-            logger.error(f"Error opening calorie settings: {e}")
+            logger.error("Error opening calorie settings: %s", e)
             CTkMessagebox(title="Error", message="Error opening settings", 
                         icon="cancel", justify=CENTER, button_color="black")
 
@@ -1232,6 +1141,8 @@ def FitPlusApp():
     progressPage = customtkinter.CTkFrame(mainapp, fg_color='transparent', corner_radius=0, border_width=0)
     settingsPage = customtkinter.CTkFrame(mainapp, fg_color='transparent', corner_radius=0, border_width=0)
     dashboardPage = customtkinter.CTkFrame(mainapp, fg_color='transparent', corner_radius=0, border_width=0)
+    page_names = {workoutPage: 'workouts', nutritionPage: 'nutrition', progressPage: 'progress',
+                  settingsPage: 'settings', dashboardPage: 'dashboard'}
     
     # Show dashboard by default
     dashboardPage.pack(expand=True, fill='both')
@@ -1265,7 +1176,7 @@ def FitPlusApp():
             switch_page(progressPage)
             update_progress_section()
         except Exception as e:
-            logger.error(f"Error switching to progress: {e}")
+            logger.error("Error switching to progress: %s", e)
     
     progressButton = customtkinter.CTkButton(
         master=mainapp,
@@ -1283,7 +1194,7 @@ def FitPlusApp():
             Frame6.lift()
             nutritionTitle.lift()
         except Exception as e:
-            logger.error(f"Error switching to nutrition: {e}")
+            logger.error("Error switching to nutrition: %s", e)
 
     nutritionButton = customtkinter.CTkButton(
         master=mainapp,
@@ -1312,7 +1223,7 @@ def FitPlusApp():
         try:
             update_meals_section()
         except Exception as e:
-            logger.error(f"Error updating meals section: {e}")
+            logger.error("Error updating meals section: %s", e)
             CTkMessagebox(title="Error", message="Error loading meals section", 
                         icon="warning", justify=CENTER, button_color="black")
 
@@ -1320,7 +1231,7 @@ def FitPlusApp():
         try:
             update_calorie_counter_section()
         except Exception as e:
-            logger.error(f"Error updating calorie counter: {e}")
+            logger.error("Error updating calorie counter: %s", e)
             CTkMessagebox(title="Error", message="Error loading calorie counter", 
                         icon="warning", justify=CENTER, button_color="black")
 
@@ -1366,7 +1277,7 @@ def FitPlusApp():
             switch_page(settingsPage)
             update_settings_section()
         except Exception as e:
-            logger.error(f"Error switching to settings: {e}")
+            logger.error("Error switching to settings: %s", e)
 
     settingsButton = customtkinter.CTkButton(
         master=mainapp,
@@ -1429,13 +1340,10 @@ def FitPlusApp():
                                                 border_width=0, fg_color=COLORS['frame_bg'], corner_radius=0)
     CalorieCounter_Frame.place(x=280, y=0)
 
-    # Enhanced workout section with better error handling
-    def update_workouts_section():
+    # Workout page: each category panel is built on its first visit and re-shown after that
+    def build_workouts_page(page):
         """Enhanced workout section with safe image loading"""
         try:
-            for widget in workoutsframe.winfo_children():
-                widget.destroy()
-            
             # Video data with safe paths
             video_data = {
                 'Cardio': {
@@ -1517,53 +1425,89 @@ def FitPlusApp():
             categories = ['Cardio', 'Strength', 'Yoga', 'HIIT']
             x_pos = 145
 
-            def show_category_details(category):
-                """Enhanced category display with safe image loading"""
-                try:
-                    for widget in workoutsframe.winfo_children():
-                        if widget != categories_frame:
-                            widget.destroy()
+            category_panels = {}  # category -> {'widgets': [(widget, place options)], 'pending': [...]}
 
-                    category_title = customtkinter.CTkLabel(workoutsframe, text=category, font=('Impact', 19))
-                    category_title.place(x=10, y=150)
+            def build_category_panel(category):
+                """Title and level rows for one category; thumbnails arrive from the image loader"""
+                panel = {'widgets': [], 'pending': []}
+                category_title = customtkinter.CTkLabel(workoutsframe, text=category, font=('Impact', 19))
+                panel['widgets'].append((category_title, {'x': 10, 'y': 150}))
 
-                    levels = ['Beginner', 'Intermediate', 'Advanced']
-                    colors = {'Beginner': 'green', 'Intermediate': 'yellow', 'Advanced': 'red'}
-                    y_pos = 90
-
-                    for level in levels:
-                        level_frame = customtkinter.CTkFrame(workoutsframe, width=1100, height=240, 
-                                                           corner_radius=0, fg_color='#2d2d2d')
-                        level_frame.place(x=10, y=y_pos)
-                        
-                        level_label = customtkinter.CTkLabel(level_frame, text=f"{level} - {category}", 
-                                                           font=('Impact', 16), text_color=colors[level])
-                        level_label.place(x=30, y=7)
+                levels = ['Beginner', 'Intermediate', 'Advanced']
+                colors = {'Beginner': 'green', 'Intermediate': 'yellow', 'Advanced': 'red'}
+                y_pos = 90
 
-                        for i, (video_url, thumbnail_path) in enumerate(video_data[category][level]):
+                for level in levels:
+                    level_frame = customtkinter.CTkFrame(workoutsframe, width=1100, height=240, 
+                                                       corner_radius=0, fg_color='#2d2d2d')
+                    panel['widgets'].append((level_frame, {'x': 10, 'y': y_pos}))
+                    
+                    level_label = customtkinter.CTkLabel(level_frame, text=f"{level} - {category}", 
+                                                       font=('Impact', 16), text_color=colors[level])
+                    level_label.place(x=30, y=7)
+
+                    for i, (video_url, thumbnail_path) in enumerate(video_data[category][level]):
+                        # Gray placeholder right away; the decoded thumbnail replaces it when ready
+                        placeholder_label = customtkinter.CTkLabel(level_frame, text="Video\nThumbnail", 
+                                                                 width=315, height=177,
+                                                                 fg_color="gray", cursor="hand2")
+                        placeholder_label.place(x=30 + (360 * i), y=40)
+                        placeholder_label.bind("<Button-1>", lambda e, url=video_url: open_youtube_video(url))
+
+                        def show_thumbnail(img, frame=level_frame, placeholder=placeholder_label,
+                                           path=thumbnail_path, url=video_url, x=30 + (360 * i)):
+                            if not placeholder.winfo_exists():
+                                return
                             try:
-                                # Safe image loading
-                                img = safe_load_image(thumbnail_path, (315, 177))
-                                photoImg = ImageTk.PhotoImage(img)
-
-                                thumbnail_label = Label(level_frame, image=photoImg, cursor="hand2")
+                                if img is None:
+                                    photoImg = safe_load_photo_image(path, (315, 177))
+                                else:
+                                    # The worker already decoded and scaled it; only the Tk conversion is left
+                                    photoImg = ImageTk.PhotoImage(img)
+                                    if os.path.exists(path):  # a missing file's gray stand-in isn't cached
+                                        get_image_cache().put((path, (315, 177), 'photo'), photoImg)
+                                thumbnail_label = Label(frame, image=photoImg, cursor="hand2")
                                 thumbnail_label.image = photoImg  # Keep reference
-                                thumbnail_label.place(x=30 + (360 * i), y=40)
-                                thumbnail_label.bind("<Button-1>", lambda e, url=video_url: open_youtube_video(url))
-                                
+                                thumbnail_label.place(x=x, y=40)
+                                thumbnail_label.bind("<Button-1>", lambda e: open_youtube_video(url))
+                                placeholder.destroy()
                             except Exception as e:
-                                logger.error(f"Error loading workout thumbnail {thumbnail_path}: {e}")
-                                # Create placeholder label
-                                placeholder_label = customtkinter.CTkLabel(level_frame, text="Video\nThumbnail", 
-                                                                         width=315, height=177,
-                                                                         fg_color="gray", cursor="hand2")
-                                placeholder_label.place(x=30 + (360 * i), y=40)
-                                placeholder_label.bind("<Button-1>", lambda e, url=video_url: open_youtube_video(url))
-
-                        y_pos += 230
+                                logger.error("Error loading workout thumbnail %s: %s", path, e)
+
+                        panel['pending'].append((placeholder_label, thumbnail_path, show_thumbnail))
+
+                    y_pos += 230
+                return panel
+
+            def show_category_details(category):
+                """Enhanced category display with safe image loading"""
+                try:
+                    # Thumbnails still decoding for the previous category are no longer wanted
+                    get_image_loader().cancel('workouts')
+                    for other, other_panel in category_panels.items():
+                        if other != category:
+                            for widget, _ in other_panel['widgets']:
+                                widget.place_forget()
+
+                    panel = category_panels.get(category)
+                    if panel is None:
+                        panel = category_panels[category] = build_category_panel(category)
+                    for widget, place_options in panel['widgets']:
+                        widget.place(**place_options)
+                        widget.lift()
+
+                    # Placeholders left over from a cancelled visit get their loads queued again
+                    panel['pending'] = [job for job in panel['pending'] if job[0].winfo_exists()]
+                    for placeholder_label, thumbnail_path, show_thumbnail in panel['pending']:
+                        if get_image_cache().get((thumbnail_path, (315, 177), 'photo')) is not None:
+                            show_thumbnail(None)
+                        else:
+                            get_image_loader().submit(placeholder_label, 'workouts',
+                                                      lambda path=thumbnail_path: safe_load_image(path, (315, 177)),
+                                                      show_thumbnail)
                         
                 except Exception as e:
-                    logger.error(f"Error showing category details: {e}")
+                    logger.error("Error showing category details: %s", e)
 
             # Create category buttons
             for category in categories:
@@ -1576,18 +1520,15 @@ def FitPlusApp():
                     btn.place(x=x_pos, y=20)
                     x_pos += 220
                 except Exception as e:
-                    logger.error(f"Error creating category button {category}: {e}")
+                    logger.error("Error creating category button %s: %s", category, e)
                     
         except Exception as e:
-            logger.error(f"Error updating workouts section: {e}")
+            logger.error("Error building workouts section: %s", e)
 
     # Enhanced dashboard section
-    def update_dashboard_section():
+    def build_dashboard_page(page):
         """Enhanced dashboard with safe image loading"""
         try:
-            for widget in Frame15.winfo_children():
-                widget.destroy()
-
             # Quote section
             quote_frame = customtkinter.CTkFrame(Frame15, width=1120, height=100, corner_radius=0)
             quote_frame.place(x=0, y=80)
@@ -1611,8 +1552,7 @@ def FitPlusApp():
 
             for i, (url, img_path) in enumerate(dashboard_workouts):
                 try:
-                    img = safe_load_image(img_path, (350, 196))
-                    photoImg = ImageTk.PhotoImage(img)
+                    photoImg = safe_load_photo_image(img_path, (350, 196))
                     
                     thumbnail_label = Label(featured_workouts_frame, image=photoImg, cursor="hand2")
                     thumbnail_label.image = photoImg
@@ -1620,7 +1560,7 @@ def FitPlusApp():
                     thumbnail_label.bind("<Button-1>", lambda e, video_url=url: open_youtube_video(video_url))
                     
                 except Exception as e:
-                    logger.error(f"Error loading dashboard workout image {img_path}: {e}")
+                    logger.error("Error loading dashboard workout image %s: %s", img_path, e)
                     # Create placeholder
                     placeholder = customtkinter.CTkLabel(featured_workouts_frame, text="Workout\nVideo", 
                                                     width=350, height=196, fg_color="gray", cursor="hand2")
@@ -1643,8 +1583,7 @@ def FitPlusApp():
 
             for i, (url, img_path) in enumerate(dashboard_meals):
                 try:
-                    img = safe_load_image(img_path, (350, 196))
-                    photoImg = ImageTk.PhotoImage(img)
+                    photoImg = safe_load_photo_image(img_path, (350, 196))
                     
                     thumbnail_label = Label(featured_meals_frame, image=photoImg, cursor="hand2")
                     thumbnail_label.image = photoImg
@@ -1652,7 +1591,7 @@ def FitPlusApp():
                     thumbnail_label.bind("<Button-1>", lambda e, video_url=url: open_youtube_video(video_url))
                     
                 except Exception as e:
-                    logger.error(f"Error loading dashboard meal image {img_path}: {e}")
+                    logger.error("Error loading dashboard meal image %s: %s", img_path, e)
                     # Create placeholder
                     placeholder = customtkinter.CTkLabel(featured_meals_frame, text="Meal\nVideo", 
                                                     width=350, height=196, fg_color="gray", cursor="hand2")
@@ -1660,16 +1599,12 @@ def FitPlusApp():
                     placeholder.bind("<Button-1>", lambda e, video_url=url: open_youtube_video(video_url))
                 
         except Exception as e:
-            logger.error(f"Error updating dashboard section: {e}")
+            logger.error("Error building dashboard section: %s", e)
 
     # Enhanced meals section
-    def update_meals_section():
+    def build_meals_page(page):
         """Enhanced meals section with safe image loading"""
         try:
-            for widget in MealsFrame.winfo_children():
-                widget.destroy()
-            MealsFrame.lift()
-            
             MealsTitle = customtkinter.CTkLabel(master=MealsFrame, font=FONTS['section_title'],
                                               text='Meals', bg_color=COLORS['frame_bg'])
             MealsTitle.place(x=510, y=16)
@@ -1711,8 +1646,7 @@ def FitPlusApp():
             for i, (url, img_path, description) in enumerate(meals_data):
                 try:
                     # Safe image loading
-                    img = safe_load_image(img_path, (350, 196))
-                    photoImg = ImageTk.PhotoImage(img)
+                    photoImg = safe_load_photo_image(img_path, (350, 196))
                     
                     thumbnail_label = Label(xy_frame, image=photoImg, cursor="hand2")
                     thumbnail_label.image = photoImg
@@ -1725,7 +1659,7 @@ def FitPlusApp():
                     description_label.grid(row=i, column=1, padx=15, pady=0)
                     
                 except Exception as e:
-                    logger.error(f"Error loading meal {i}: {e}")
+                    logger.error("Error loading meal %s: %s", i, e)
                     # Create placeholder
                     placeholder = customtkinter.CTkLabel(xy_frame, text="Recipe\nImage", 
                                                        width=350, height=196, fg_color="gray", cursor="hand2")
@@ -1737,187 +1671,152 @@ def FitPlusApp():
                     description_label.grid(row=i, column=1, padx=15, pady=0)
                     
         except Exception as e:
-            logger.error(f"Error updating meals section: {e}")
+            logger.error("Error building meals section: %s", e)
 
     # Enhanced calorie counter section
-    global update_calorie_counter_section
-    def update_calorie_counter_section():
+    def build_calorie_counter_page(page):
         """Enhanced calorie counter with better error handling"""
-        global current_username, items, selected_food
-        
-        try:
-            current_username = user_var.get().strip()
-            if not current_username:
-                logger.warning("No username available for calorie counter")
-                return
-                
-            for widget in CalorieCounter_Frame.winfo_children():
-                widget.destroy()
-            CalorieCounter_Frame.lift()
+        global selected_food
 
+        try:
             calorieTitle = customtkinter.CTkLabel(master=CalorieCounter_Frame, font=FONTS['section_title'],
                                                 text='Calorie Counter', bg_color=COLORS['frame_bg'])
             calorieTitle.place(x=450, y=16)
 
-            back_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Back", 
-                                                command=CalorieToNutrition, fg_color="black", 
+            back_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Back",
+                                                command=CalorieToNutrition, fg_color="black",
                                                 hover_color="grey", font=FONTS['button'], width=30)
             back_button.place(x=1050, y=16)
 
-            adjustcalorie_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Adjust calorie limit", 
-                                                         command=open_calorie_settings, fg_color="black", 
+            adjustcalorie_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Adjust calorie limit",
+                                                         command=open_calorie_settings, fg_color="black",
                                                          hover_color="grey", font=FONTS['button'], width=200)
             adjustcalorie_button.place(x=900, y=80)
 
-            # Enhanced food database
-            items = [
-                {"name": "Egg", "calories": 155, "fat": 11, "carbs": 1.1, "protein": 13, "sugars": 1.1},
-                {"name": "Milk (1 cup)", "calories": 103, "fat": 2.4, "carbs": 12, "protein": 8, "sugars": 12},
-                {"name": "Banana", "calories": 89, "fat": 0.3, "carbs": 23, "protein": 1.1, "sugars": 12},
-                {"name": "Chicken Breast (100g)", "calories": 165, "fat": 3.6, "carbs": 0, "protein": 31, "sugars": 0},
-                {"name": "Apple", "calories": 52, "fat": 0.2, "carbs": 14, "protein": 0.3, "sugars": 10},
-                {"name": "Almonds (1 ounce)", "calories": 579, "fat": 49.9, "carbs": 21.6, "protein": 21.2, "sugars": 3.9},
-                {"name": "Broccoli (1 cup)", "calories": 34, "fat": 0.4, "carbs": 6.6, "protein": 2.8, "sugars": 1.7},
-                {"name": "Salmon (100g)", "calories": 208, "fat": 13, "carbs": 0, "protein": 20, "sugars": 0},
-                {"name": "Sweet Potato", "calories": 86, "fat": 0.1, "carbs": 20, "protein": 1.6, "sugars": 4.2},
-                {"name": "Oats (1 cup)", "calories": 389, "fat": 6.9, "carbs": 66, "protein": 17, "sugars": 0},
-                {"name": "White Rice (1 cup)", "calories": 130, "fat": 0.3, "carbs": 28, "protein": 2.7, "sugars": 0.1},
-                {"name": "Whole Wheat Bread (1 slice)", "calories": 247, "fat": 4.4, "carbs": 41, "protein": 13, "sugars": 6},
-                {"name": "Avocado", "calories": 160, "fat": 15, "carbs": 9, "protein": 2, "sugars": 0.7},
-                {"name": "Greek Yogurt (100g)", "calories": 59, "fat": 0.4, "carbs": 3.6, "protein": 10, "sugars": 3.2},
-                {"name": "Spinach (1 cup)", "calories": 23, "fat": 0.4, "carbs": 3.6, "protein": 2.9, "sugars": 0.4},
-                {"name": "Tomato", "calories": 18, "fat": 0.2, "carbs": 3.9, "protein": 0.9, "sugars": 2.6},
-                {"name": "Beef (100g)", "calories": 254, "fat": 20, "carbs": 0, "protein": 17.2, "sugars": 0},
-                {"name": "Peanut Butter (2 tablespoons)", "calories": 588, "fat": 50, "carbs": 20, "protein": 25, "sugars": 9},
-                {"name": "Quinoa (1 cup)", "calories": 120, "fat": 1.9, "carbs": 21, "protein": 4.1, "sugars": 0.9},
-                {"name": "Lentils (1 cup)", "calories": 116, "fat": 0.4, "carbs": 20, "protein": 9, "sugars": 1.8},
-                {"name": "Cucumber", "calories": 16, "fat": 0.1, "carbs": 3.6, "protein": 0.7, "sugars": 1.7},
-                {"name": "Cheddar Cheese (1 ounce)", "calories": 402, "fat": 33, "carbs": 1.3, "protein": 25, "sugars": 0.5},
-                {"name": "Whole Wheat Pasta (1 cup)", "calories": 124, "fat": 0.8, "carbs": 26, "protein": 5, "sugars": 1.3},
-                {"name": "Orange", "calories": 47, "fat": 0.1, "carbs": 12, "protein": 0.9, "sugars": 9},
-                {"name": "Tofu (100g)", "calories": 76, "fat": 4.8, "carbs": 1.9, "protein": 8, "sugars": 0.3}
-            ]
-
-            item_names = [item["name"] for item in items]
+            # Catalog is loaded once at startup; names are a prebuilt tuple
+            item_names = list(get_food_catalog().names)
             selected_food = ""
 
-            button = customtkinter.CTkButton(CalorieCounter_Frame, text="Choose food item", width=400, 
-                                           fg_color="black", hover_color="grey", font=("Impact", 17))
-            button.place(x=360, y=400)
+            food_entry = customtkinter.CTkEntry(CalorieCounter_Frame, width=400, height=40,
+                                              placeholder_text="Search food item",
+                                              border_color="white", font=("Impact", 17))
+            food_entry.place(x=360, y=400)
 
             def on_select(selected_item):
                 """Enhanced food selection"""
                 try:
                     global selected_food
                     selected_food = selected_item
-                    button.configure(text=selected_item)
-                    logger.info(f"Selected food item: {selected_item}")
+                    food_entry.delete(0, "end")
+                    food_entry.insert(0, selected_item)
+                    logger.info("Selected food item: %s", selected_item)
                 except Exception as e:
-                    logger.error(f"Error selecting food item: {e}")
-
-            CTkScrollableDropdown(button, values=item_names, height=200, resize=False, 
-                                button_height=50, scrollbar=True, command=on_select)
-
-            # Display calorie information with error handling
-            try:
-                daily_calorie_limit = get_user_calorie_limit(current_username)
-                daily_calorie_intake = get_user_calorie_intake(current_username)
-                remaining_calories = daily_calorie_limit - daily_calorie_intake
-                
-                intake_label = customtkinter.CTkLabel(CalorieCounter_Frame, 
-                                                    text=f"Today's Calorie Intake: {daily_calorie_intake} kcal", 
-                                                    font=("Impact", 20), bg_color=COLORS['frame_bg'])
-                intake_label.place(x=290, y=170)
-                
-                remaining_label = customtkinter.CTkLabel(CalorieCounter_Frame, 
-                                                       text=f"Remaining Calories: {remaining_calories} kcal", 
-                                                       font=("Impact", 20), bg_color=COLORS['frame_bg'])
-                remaining_label.place(x=590, y=170)
-
-                # Get nutrition data
-                nutrition_data = get_user_data(current_username, 
-                                             ['daily_fat', 'daily_carbs', 'daily_protein', 'daily_sugars'])
-                
-                if nutrition_data:
-                    daily_fat = nutrition_data.get('daily_fat', 0)
-                    daily_carbs = nutrition_data.get('daily_carbs', 0)
-                    daily_protein = nutrition_data.get('daily_protein', 0)
-                    daily_sugars = nutrition_data.get('daily_sugars', 0)
-                else:
-                    daily_fat = daily_carbs = daily_protein = daily_sugars = 0
-
-                # Display nutrition labels
-                labels = [
-                    ("Fats", daily_fat, "g"),
-                    ("Carbohydrates", daily_carbs, "g"),
-                    ("Proteins", daily_protein, "g"),
-                    ("Sugars", daily_sugars, "g")
-                ]
-
-                y_pos = 220
-                for label_text, value, unit in labels:
-                    label = customtkinter.CTkLabel(CalorieCounter_Frame, 
-                                                 text=f"{label_text}: {round(value, 1)} {unit}", 
-                                                 font=("Impact", 18), bg_color=COLORS['frame_bg'])
-                    label.place(x=290, y=y_pos)
-                    y_pos += 35
-
-            except Exception as e:
-                logger.error(f"Error displaying calorie information: {e}")
+                    logger.error("Error selecting food item: %s", e)
+
+            # Typing queries the search index; only the ranked matches are shown
+            CTkScrollableDropdown(food_entry, values=item_names, height=200, resize=False,
+                                button_height=50, scrollbar=True, command=on_select,
+                                autocomplete=True, virtual=True,
+                                search=lambda query: get_food_search_index().search(query, limit=500))
+
+            # Calorie labels are filled in by refresh_calorie_counter_page
+            intake_label = customtkinter.CTkLabel(CalorieCounter_Frame, text="",
+                                                font=("Impact", 20), bg_color=COLORS['frame_bg'])
+            intake_label.place(x=290, y=170)
+            page.add('intake', intake_label)
+
+            remaining_label = customtkinter.CTkLabel(CalorieCounter_Frame, text="",
+                                                   font=("Impact", 20), bg_color=COLORS['frame_bg'])
+            remaining_label.place(x=590, y=170)
+            page.add('remaining', remaining_label)
+
+            y_pos = 220
+            for label_text, field in CALORIE_NUTRIENTS:
+                label = customtkinter.CTkLabel(CalorieCounter_Frame, text="",
+                                             font=("Impact", 18), bg_color=COLORS['frame_bg'])
+                label.place(x=290, y=y_pos)
+                page.add(field, label)
+                y_pos += 35
 
             def reset_function():
                 """Enhanced reset with user feedback"""
                 try:
-                    success1, msg1 = reset_daily_calorie_intake(current_username)
-                    success2, msg2 = reset_nutrition(current_username)
-                    
-                    if success1 and success2:
+                    success, message = reset_daily_intake(current_username)
+
+                    if success:
                         update_calorie_counter_section()
-                        CTkMessagebox(title="Success", message="Daily intake reset successfully", 
+                        CTkMessagebox(title="Success", message="Daily intake reset successfully",
                                     icon="check", justify=CENTER, button_color="black")
                     else:
-                        CTkMessagebox(title="Error", message="Error resetting daily intake", 
+                        CTkMessagebox(title="Error", message="Error resetting daily intake",
                                     icon="warning", justify=CENTER, button_color="black")
                 except Exception as e:
-                    logger.error(f"Error in reset function: {e}")
-                    CTkMessagebox(title="Error", message="Error resetting data", 
+                    logger.error("Error in reset function: %s", e)
+                    CTkMessagebox(title="Error", message="Error resetting data",
                                 icon="cancel", justify=CENTER, button_color="black")
-            
-            reset_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Reset", 
-                                                 command=reset_function, fg_color="black", 
+
+            reset_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Reset",
+                                                 command=reset_function, fg_color="black",
                                                  hover_color="grey", font=FONTS['button'], width=200)
             reset_button.place(x=900, y=120)
 
             def safe_add_food():
                 """Enhanced food addition with validation"""
+                global selected_food
                 try:
-                    if not selected_food:
-                        CTkMessagebox(title="Error", message="Please select a food item first", 
+                    # A fully typed name works without picking it from the list
+                    food_name = food_entry.get().strip() or selected_food
+                    if not food_name:
+                        CTkMessagebox(title="Error", message="Please select a food item first",
                                     icon="warning", justify=CENTER, button_color="black")
                         return
-                    
-                    success, message = add_food_to_intake(selected_food)
+
+                    started = time.perf_counter()
+                    success, message = add_food_to_intake(food_name)
+                    get_event_recorder().record('food_add', current_username, (time.perf_counter() - started) * 1000,
+                                                'ok' if success else 'failed', item=food_name)
                     if success:
-                        CTkMessagebox(title="Success", message=f"Added {selected_food} to your intake", 
+                        # The page is no longer rebuilt, so clear the search box by hand
+                        food_entry.delete(0, "end")
+                        selected_food = ""
+                        CTkMessagebox(title="Success", message=f"Added {food_name} to your intake",
                                     icon="check", justify=CENTER, button_color="black")
                     else:
-                        CTkMessagebox(title="Error", message=message, 
+                        CTkMessagebox(title="Error", message=message,
                                     icon="warning", justify=CENTER, button_color="black")
                 except Exception as e:
-                    logger.error(f"Error adding food: {e}")
-                    CTkMessagebox(title="Error", message="Error adding food item", 
+                    logger.error("Error adding food: %s", e)
+                    CTkMessagebox(title="Error", message="Error adding food item",
                                 icon="cancel", justify=CENTER, button_color="black")
 
-            add_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Add", fg_color="black", 
-                                               hover_color="grey", font=FONTS['button'], 
+            add_button = customtkinter.CTkButton(CalorieCounter_Frame, text="Add", fg_color="black",
+                                               hover_color="grey", font=FONTS['button'],
                                                command=safe_add_food)
             add_button.place(x=490, y=450)
-            
+
+        except Exception as e:
+            logger.error("Error building calorie counter section: %s", e)
+
+    def refresh_calorie_counter_page(page, snapshot):
+        """Show today's totals from one snapshot in the existing labels"""
+        try:
+            if snapshot:
+                daily_calorie_intake = snapshot.daily_calorie_intake
+                remaining_calories = snapshot.remaining_calories
+            else:
+                daily_calorie_intake = 0
+                remaining_calories = 2000
+
+            page.set('intake', text=f"Today's Calorie Intake: {daily_calorie_intake} kcal")
+            page.set('remaining', text=f"Remaining Calories: {remaining_calories} kcal")
+            for label_text, field in CALORIE_NUTRIENTS:
+                value = getattr(snapshot, field) if snapshot else 0
+                page.set(field, text=f"{label_text}: {round(value, 1)} g")
         except Exception as e:
-            logger.error(f"Error updating calorie counter section: {e}")
+            logger.error("Error displaying calorie information: %s", e)
 
     # Enhanced settings section with safe pygame initialization
-    def update_settings_section():
+    def build_settings_page(page):
         """Enhanced settings with safe music handling"""
         try:
             # Safe pygame initialization
@@ -1933,7 +1832,7 @@ def FitPlusApp():
                 else:
                     logger.warning("Background music file not found: soundtrack.mp3")
             except Exception as e:
-                logger.error(f"Error initializing music: {e}")
+                logger.error("Error initializing music: %s", e)
                 music_available = False
 
             def toggle_music():
@@ -1941,7 +1840,7 @@ def FitPlusApp():
                 try:
                     if not music_available:
                         return
-                    
+
                     if musicCheckBox.get() == 1:
                         pygame.mixer.music.unpause()
                         logger.info("Music resumed")
@@ -1949,7 +1848,7 @@ def FitPlusApp():
                         pygame.mixer.music.pause()
                         logger.info("Music paused")
                 except Exception as e:
-                    logger.error(f"Error toggling music: {e}")
+                    logger.error("Error toggling music: %s", e)
 
             # Music checkbox (only if music is available)
             if music_available:
@@ -1977,24 +1876,25 @@ def FitPlusApp():
                     # Stop music if playing
                     if music_available:
                         pygame.mixer.music.stop()
-                    
+
                     # Hide main app
                     mainapp.pack_forget()
-                    
+
                     # Clear user data
                     global current_username
+                    forget_user(current_username)
                     current_username = ""
                     user_var.set("")
                     pass_var.set("")
-                    
+
                     # Show login screen
                     frame.pack(expand=True)
                     particle_frame.pack(expand=True, fill="both")
-                    
+
                     logger.info("User logged out successfully")
-                    
+
                 except Exception as e:
-                    logger.error(f"Error during logout: {e}")
+                    logger.error("Error during logout: %s", e)
 
             logoutButton = customtkinter.CTkButton(
                 master=settingsPage,
@@ -2013,23 +1913,23 @@ def FitPlusApp():
             def confirmDelete():
                 """Enhanced account deletion confirmation"""
                 try:
-                    confirmdelete = CTkMessagebox(title="Delete Account", 
-                                                message="Are you sure you want to delete your account? This action cannot be undone.", 
-                                                icon="warning", justify=CENTER, button_color="black", 
+                    confirmdelete = CTkMessagebox(title="Delete Account",
+                                                message="Are you sure you want to delete your account? This action cannot be undone.",
+                                                icon="warning", justify=CENTER, button_color="black",
                                                 button_hover_color="grey", option_1="Yes", option_2="No")
                     response = confirmdelete.get()
-                    
+
                     if response == "Yes":
                         success, message = delete_account()
                         if success:
-                            CTkMessagebox(title="Account Deleted", message="Your account has been deleted successfully", 
+                            CTkMessagebox(title="Account Deleted", message="Your account has been deleted successfully",
                                         icon="check", justify=CENTER, button_color="black")
                         else:
-                            CTkMessagebox(title="Error", message=message, 
+                            CTkMessagebox(title="Error", message=message,
                                         icon="warning", justify=CENTER, button_color="black")
                 except Exception as e:
-                    logger.error(f"Error confirming account deletion: {e}")
-                    CTkMessagebox(title="Error", message="Error processing account deletion", 
+                    logger.error("Error confirming account deletion: %s", e)
+                    CTkMessagebox(title="Error", message="Error processing account deletion",
                                 icon="cancel", justify=CENTER, button_color="black")
 
             DeleteAccButton = customtkinter.CTkButton(
@@ -2040,278 +1940,297 @@ def FitPlusApp():
                 fg_color=COLORS['button_bg'], bg_color=COLORS['frame_bg'],
                 command=confirmDelete, hover_color=COLORS['button_hover'])
             DeleteAccButton.place(x=723, y=162)
-            
+
         except Exception as e:
-            logger.error(f"Error updating settings section: {e}")
+            logger.error("Error building settings section: %s", e)
 
     # Enhanced progress section with better validation
-    def update_progress_section():
+    def build_progress_page(page):
         """Enhanced progress tracking with validation"""
         try:
-            # Clear existing widgets
-            for widget in Frame9.winfo_children():
-                widget.destroy()
-
-            # Get user data
-            user_data = get_user_data(current_username, 
-                                    ['current_weight', 'ideal_weight', 'bench_press_pr', 'squat_pr', 'deadlift_pr'])
-            
-            if not user_data:
-                logger.warning(f"No user data found for {current_username}")
-                return
-
-            current_weight = user_data.get('current_weight', 0)
-            ideal_weight = user_data.get('ideal_weight', 0)
-            bench_press_pr = user_data.get('bench_press_pr', 0)
-            squat_pr = user_data.get('squat_pr', 0)
-            deadlift_pr = user_data.get('deadlift_pr', 0)
-            
-            weight_difference = ideal_weight - current_weight
+            # Dialog title, prompt, updater, upper bound, success message and error message per field
+            progress_updates = {
+                'current_weight': ("Update Current Weight", "Enter your new current weight (kg):",
+                                   update_current_weight, MAX_WEIGHT,
+                                   "Current weight updated successfully", "Error updating weight"),
+                'ideal_weight': ("Update Ideal Weight", "Enter your new ideal weight (kg):",
+                                 update_ideal_weight, MAX_WEIGHT,
+                                 "Ideal weight updated successfully", "Error updating weight"),
+                'bench_press_pr': ("Update Bench Press PR", "Enter your new Bench Press PR (kg):",
+                                   update_bench_press_pr, MAX_PR,
+                                   "Bench Press PR updated successfully", "Error updating PR"),
+                'squat_pr': ("Update Squat PR", "Enter your new Squat PR (kg):",
+                             update_squat_pr, MAX_PR,
+                             "Squat PR updated successfully", "Error updating PR"),
+                'deadlift_pr': ("Update Deadlift PR", "Enter your new Deadlift PR (kg):",
+                                update_deadlift_pr, MAX_PR,
+                                "Deadlift PR updated successfully", "Error updating PR"),
+            }
 
             # Enhanced update functions with validation
-            def on_update_current_weight_click():
-                try:
-                    new_weight = simpledialog.askfloat("Update Current Weight", 
-                                                     f"Enter your new current weight (kg):\nCurrent: {current_weight} kg",
-                                                     minvalue=0, maxvalue=MAX_WEIGHT)
-                    if new_weight is not None:
-                        success, message = update_current_weight(current_username, new_weight)
-                        if success:
-                            update_progress_section()
-                            CTkMessagebox(title="Success", message="Current weight updated successfully", 
-                                        icon="check", justify=CENTER, button_color="black")
-                        else:
-                            CTkMessagebox(title="Error", message=message, 
-                                        icon="warning", justify=CENTER, button_color="black")
-                except Exception as e:
-                    logger.error(f"Error updating current weight: {e}")
-                    CTkMessagebox(title="Error", message="Error updating weight", 
-                                icon="cancel", justify=CENTER, button_color="black")
-
-            def on_update_ideal_weight_click():
-                try:
-                    new_weight = simpledialog.askfloat("Update Ideal Weight", 
-                                                     f"Enter your new ideal weight (kg):\nCurrent: {ideal_weight} kg",
-                                                     minvalue=0, maxvalue=MAX_WEIGHT)
-                    if new_weight is not None:
-                        success, message = update_ideal_weight(current_username, new_weight)
-                        if success:
-                            update_progress_section()
-                            CTkMessagebox(title="Success", message="Ideal weight updated successfully", 
-                                        icon="check", justify=CENTER, button_color="black")
-                        else:
-                            CTkMessagebox(title="Error", message=message, 
-                                        icon="warning", justify=CENTER, button_color="black")
-                except Exception as e:
-                    logger.error(f"Error updating ideal weight: {e}")
-                    CTkMessagebox(title="Error", message="Error updating weight", 
-                                icon="cancel", justify=CENTER, button_color="black")
-            
-            def on_update_bench_press_click():
-                try:
-                    new_pr = simpledialog.askfloat("Update Bench Press PR", 
-                                                 f"Enter your new Bench Press PR (kg):\nCurrent: {bench_press_pr} kg",
-                                                 minvalue=0, maxvalue=MAX_PR)
-                    if new_pr is not None:
-                        success, message = update_bench_press_pr(current_username, new_pr)
-                        if success:
-                            update_progress_section()
-                            CTkMessagebox(title="Success", message="Bench Press PR updated successfully", 
-                                        icon="check", justify=CENTER, button_color="black")
-                        else:
-                            CTkMessagebox(title="Error", message=message, 
-                                        icon="warning", justify=CENTER, button_color="black")
-                except Exception as e:
-                    logger.error(f"Error updating bench press PR: {e}")
-                    CTkMessagebox(title="Error", message="Error updating PR", 
-                                icon="cancel", justify=CENTER, button_color="black")
-            
-            def on_update_squat_click():
-                try:
-                    new_pr = simpledialog.askfloat("Update Squat PR", 
-                                                 f"Enter your new Squat PR (kg):\nCurrent: {squat_pr} kg",
-                                                 minvalue=0, maxvalue=MAX_PR)
-                    if new_pr is not None:
-                        success, message = update_squat_pr(current_username, new_pr)
-                        if success:
-                            update_progress_section()
-                            CTkMessagebox(title="Success", message="Squat PR updated successfully", 
-                                        icon="check", justify=CENTER, button_color="black")
-                        else:
-                            CTkMessagebox(title="Error", message=message, 
-                                        icon="warning", justify=CENTER, button_color="black")
-                except Exception as e:
-                    logger.error(f"Error updating squat PR: {e}")
-                    CTkMessagebox(title="Error", message="Error updating PR", 
-                                icon="cancel", justify=CENTER, button_color="black")
-
-            def on_update_deadlift_click():
-                try:
-                    new_pr = simpledialog.askfloat("Update Deadlift PR", 
-                                                 f"Enter your new Deadlift PR (kg):\nCurrent: {deadlift_pr} kg",
-                                                 minvalue=0, maxvalue=MAX_PR)
-                    if new_pr is not None:
-                        success, message = update_deadlift_pr(current_username, new_pr)
-                        if success:
-                            update_progress_section()
-                            CTkMessagebox(title="Success", message="Deadlift PR updated successfully", 
-                                        icon="check", justify=CENTER, button_color="black")
-                        else:
-                            CTkMessagebox(title="Error", message=message, 
-                                        icon="warning", justify=CENTER, button_color="black")
-                except Exception as e:
-                    logger.error(f"Error updating deadlift PR: {e}")
-                    CTkMessagebox(title="Error", message="Error updating PR", 
-                                icon="cancel", justify=CENTER, button_color="black")
+            def make_update_handler(field):
+                title, prompt, updater, maxvalue, success_message, error_message = progress_updates[field]
+
+                def on_update_click():
+                    try:
+                        # Read the value at click time; the page outlives any one snapshot
+                        snapshot = get_user_snapshot(current_username)
+                        current_value = getattr(snapshot, field) if snapshot else 0
+                        new_value = simpledialog.askfloat(title, f"{prompt}\nCurrent: {current_value} kg",
+                                                          minvalue=0, maxvalue=maxvalue)
+                        if new_value is not None:
+                            started = time.perf_counter()
+                            success, message = updater(current_username, new_value)
+                            get_event_recorder().record('progress_update', current_username,
+                                                        (time.perf_counter() - started) * 1000,
+                                                        'ok' if success else 'failed', field=field)
+                            if success:
+                                update_progress_section()
+                                CTkMessagebox(title="Success", message=success_message,
+                                            icon="check", justify=CENTER, button_color="black")
+                            else:
+                                CTkMessagebox(title="Error", message=message,
+                                            icon="warning", justify=CENTER, button_color="black")
+                    except Exception as e:
+                        logger.error("Error updating %s: %s", field.replace('_', ' '), e)
+                        CTkMessagebox(title="Error", message=error_message,
+                                    icon="cancel", justify=CENTER, button_color="black")
+
+                return on_update_click
 
             # Create achievement frame with scrolling
             achievementframe = CTkXYFrame(Frame9, width=1075, height=250)
             achievementframe.place(x=15, y=520)
 
-            # Enhanced achievement system
-            achievements = [
-                ("Reach a 20kg bench press", bench_press_pr >= 20),
-                ("Reach a 40kg bench press", bench_press_pr >= 40),
-                ("Reach a 60kg bench press", bench_press_pr >= 60),
-                ("Reach a 80kg bench press", bench_press_pr >= 80),
-                ("Reach a 100kg bench press", bench_press_pr >= 100),
-                ("Reach a 20kg squat", squat_pr >= 20),
-                ("Reach a 40kg squat", squat_pr >= 40),
-                ("Reach a 60kg squat", squat_pr >= 60),
-                ("Reach a 80kg squat", squat_pr >= 80),
-                ("Reach a 100kg squat", squat_pr >= 100),
-                ("Reach a 60kg deadlift", deadlift_pr >= 60),
-                ("Reach a 80kg deadlift", deadlift_pr >= 80),
-                ("Reach a 100kg deadlift", deadlift_pr >= 100),
-                ("Reach a 120kg deadlift", deadlift_pr >= 120),
-                ("Reach a 140kg deadlift", deadlift_pr >= 140),
-            ]
-
-            def update_achievement_labels(frame, achievement_text, achieved, relx_position):
-                """Enhanced achievement display"""
-                try:
-                    static_label = customtkinter.CTkLabel(master=frame, text=f"{achievement_text}: ", 
-                                                        font=("Impact", 24))
-                    static_label.place(relx=relx_position, rely=0.5, anchor='e')
-
-                    status = "✓ Unlocked" if achieved else "✗ Locked"
-                    status_color = "green" if achieved else "red"
-                    status_label = customtkinter.CTkLabel(master=frame, text=status, font=("Impact", 24), 
-                                                        text_color=status_color)
-                    status_label.place(relx=relx_position, rely=0.5, anchor='w')
-                except Exception as e:
-                    logger.error(f"Error updating achievement label: {e}")
-
-            # Create achievement frames
-            for i, (achievement_text, achieved) in enumerate(achievements):
+            # Create achievement frames; refresh_progress_page sets each status
+            for i, (achievement_text, field, threshold) in enumerate(ACHIEVEMENTS):
                 try:
                     achievement_frame = customtkinter.CTkFrame(achievementframe, width=1060, height=100)
                     achievement_frame.grid(row=i, column=0, padx=5, pady=20)
-                    update_achievement_labels(achievement_frame, achievement_text, achieved, 0.3)
+
+                    static_label = customtkinter.CTkLabel(master=achievement_frame, text=f"{achievement_text}: ",
+                                                        font=("Impact", 24))
+                    static_label.place(relx=0.3, rely=0.5, anchor='e')
+
+                    status_label = customtkinter.CTkLabel(master=achievement_frame, text="", font=("Impact", 24))
+                    status_label.place(relx=0.3, rely=0.5, anchor='w')
+                    page.add(('achievement', i), status_label)
                 except Exception as e:
-                    logger.error(f"Error creating achievement frame {i}: {e}")
+                    logger.error("Error creating achievement frame %s: %s", i, e)
 
             # Weight tracking frame
             weightFrame = customtkinter.CTkFrame(Frame9, width=450, height=300)
             weightFrame.place(x=63, y=120)
-            
-            WeightTitle = customtkinter.CTkLabel(master=weightFrame, text="Weight Tracker", 
+
+            WeightTitle = customtkinter.CTkLabel(master=weightFrame, text="Weight Tracker",
                                                font=("Calibri", 18, 'underline'))
             WeightTitle.place(relx=0.5, rely=0.1, anchor='center')
-            
-            current_weight_label = customtkinter.CTkLabel(master=weightFrame, 
-                                                        text=f"Current Weight: {current_weight} kg", 
-                                                        font=("Calibri", 16))
+
+            current_weight_label = customtkinter.CTkLabel(master=weightFrame, text="", font=("Calibri", 16))
             current_weight_label.place(relx=0.5, rely=0.3, anchor='center')
-            
-            ideal_weight_label = customtkinter.CTkLabel(master=weightFrame, 
-                                                      text=f"Ideal Weight: {ideal_weight} kg", 
-                                                      font=("Calibri", 16))
+            page.add('current_weight', current_weight_label)
+
+            ideal_weight_label = customtkinter.CTkLabel(master=weightFrame, text="", font=("Calibri", 16))
             ideal_weight_label.place(relx=0.5, rely=0.4, anchor='center')
-            
-            diff_text = "Weight to Gain: " if weight_difference > 0 else "Weight to Lose: " if weight_difference < 0 else "At Ideal Weight: "
-            weight_diff_label = customtkinter.CTkLabel(master=weightFrame, 
-                                                     text=f"{diff_text} {abs(weight_difference)} kg", 
-                                                     font=("Calibri", 16))
+            page.add('ideal_weight', ideal_weight_label)
+
+            weight_diff_label = customtkinter.CTkLabel(master=weightFrame, text="", font=("Calibri", 16))
             weight_diff_label.place(relx=0.5, rely=0.5, anchor='center')
-            
-            UpdateCurrentWeight = customtkinter.CTkButton(weightFrame, text="Update Current Weight", 
-                                                        width=180, fg_color="black", hover_color="grey", 
-                                                        font=("Impact", 16), command=on_update_current_weight_click)
+            page.add('weight_difference', weight_diff_label)
+
+            weight_history_label = customtkinter.CTkLabel(master=weightFrame, text="", font=("Calibri", 14))
+            weight_history_label.place(relx=0.5, rely=0.6, anchor='center')
+            page.add('weight_history', weight_history_label)
+
+            UpdateCurrentWeight = customtkinter.CTkButton(weightFrame, text="Update Current Weight",
+                                                        width=180, fg_color="black", hover_color="grey",
+                                                        font=("Impact", 16), command=make_update_handler('current_weight'))
             UpdateCurrentWeight.place(relx=0.25, rely=0.75, anchor='center')
-            
-            UpdateIdealWeight = customtkinter.CTkButton(weightFrame, text="Update Ideal Weight", 
-                                                      width=180, fg_color="black", hover_color="grey", 
-                                                      font=("Impact", 16), command=on_update_ideal_weight_click)
+
+            UpdateIdealWeight = customtkinter.CTkButton(weightFrame, text="Update Ideal Weight",
+                                                      width=180, fg_color="black", hover_color="grey",
+                                                      font=("Impact", 16), command=make_update_handler('ideal_weight'))
             UpdateIdealWeight.place(relx=0.75, rely=0.75, anchor='center')
 
             # PR tracking frame
             prFrame = customtkinter.CTkFrame(Frame9, width=450, height=300)
             prFrame.place(x=606, y=120)
-            
-            prTitle = customtkinter.CTkLabel(master=prFrame, text="Personal Record Tracker", 
+
+            prTitle = customtkinter.CTkLabel(master=prFrame, text="Personal Record Tracker",
                                            font=("Calibri", 18, 'underline'))
             prTitle.place(relx=0.5, rely=0.1, anchor='center')
-            
-            bench_pr_label = customtkinter.CTkLabel(master=prFrame, text=f"Bench Press PR: {bench_press_pr} kg", 
-                                                  font=("Calibri", 16))
+
+            bench_pr_label = customtkinter.CTkLabel(master=prFrame, text="", font=("Calibri", 16))
             bench_pr_label.place(relx=0.5, rely=0.3, anchor='center')
-            
-            squat_pr_label = customtkinter.CTkLabel(master=prFrame, text=f"Squat PR: {squat_pr} kg", 
-                                                  font=("Calibri", 16))
+            page.add('bench_press_pr', bench_pr_label)
+
+            squat_pr_label = customtkinter.CTkLabel(master=prFrame, text="", font=("Calibri", 16))
             squat_pr_label.place(relx=0.5, rely=0.4, anchor='center')
-            
-            deadlift_pr_label = customtkinter.CTkLabel(master=prFrame, text=f"Deadlift PR: {deadlift_pr} kg", 
-                                                     font=("Calibri", 16))
+            page.add('squat_pr', squat_pr_label)
+
+            deadlift_pr_label = customtkinter.CTkLabel(master=prFrame, text="", font=("Calibri", 16))
             deadlift_pr_label.place(relx=0.5, rely=0.5, anchor='center')
-            
-            UpdateBench = customtkinter.CTkButton(prFrame, text="Update Bench Press", width=143, 
-                                                fg_color="black", hover_color="grey", font=("Impact", 16), 
-                                                command=on_update_bench_press_click)
+            page.add('deadlift_pr', deadlift_pr_label)
+
+            UpdateBench = customtkinter.CTkButton(prFrame, text="Update Bench Press", width=143,
+                                                fg_color="black", hover_color="grey", font=("Impact", 16),
+                                                command=make_update_handler('bench_press_pr'))
             UpdateBench.place(relx=0.5, rely=0.75, anchor='center')
-            
-            UpdatesSquat = customtkinter.CTkButton(prFrame, text="Update Squat", width=140, 
-                                                 fg_color="black", hover_color="grey", font=("Impact", 16), 
-                                                 command=on_update_squat_click)
+
+            UpdatesSquat = customtkinter.CTkButton(prFrame, text="Update Squat", width=140,
+                                                 fg_color="black", hover_color="grey", font=("Impact", 16),
+                                                 command=make_update_handler('squat_pr'))
             UpdatesSquat.place(relx=0.17, rely=0.75, anchor='center')
-            
-            UpdateDeadlift = customtkinter.CTkButton(prFrame, text="Update Deadlift", width=140, 
-                                                   fg_color="black", hover_color="grey", font=("Impact", 16), 
-                                                   command=on_update_deadlift_click)
+
+            UpdateDeadlift = customtkinter.CTkButton(prFrame, text="Update Deadlift", width=140,
+                                                   fg_color="black", hover_color="grey", font=("Impact", 16),
+                                                   command=make_update_handler('deadlift_pr'))
             UpdateDeadlift.place(relx=0.83, rely=0.75, anchor='center')
 
             achievementTitle = customtkinter.CTkLabel(master=Frame9, text="Achievements", font=("Impact", 20))
             achievementTitle.place(relx=0.5, rely=0.62, anchor='center')
-            
+
+        except Exception as e:
+            logger.error("Error building progress section: %s", e)
+
+    def refresh_progress_page(page, snapshot):
+        """Show the user's weights, PRs and achievements in the existing labels"""
+        try:
+            if not snapshot:
+                logger.warning("No user data found for %s", current_username)
+                return
+
+            weight_difference = snapshot.ideal_weight - snapshot.current_weight
+            diff_text = "Weight to Gain: " if weight_difference > 0 else "Weight to Lose: " if weight_difference < 0 else "At Ideal Weight: "
+
+            page.set('current_weight', text=f"Current Weight: {snapshot.current_weight} kg")
+            page.set('ideal_weight', text=f"Ideal Weight: {snapshot.ideal_weight} kg")
+            page.set('weight_difference', text=f"{diff_text} {abs(weight_difference)} kg")
+            page.set('bench_press_pr', text=f"Bench Press PR: {snapshot.bench_press_pr} kg")
+            page.set('squat_pr', text=f"Squat PR: {snapshot.squat_pr} kg")
+            page.set('deadlift_pr', text=f"Deadlift PR: {snapshot.deadlift_pr} kg")
+
+            # 30-day history, downsampled in SQL to one row per day
+            month_ago = datetime.date.today() - datetime.timedelta(days=30)
+            weight_history = get_downsampled(current_username, 'current_weight', start=month_ago)
+            if weight_history:
+                low = min(day['min'] for day in weight_history)
+                high = max(day['max'] for day in weight_history)
+                history_text = f"Last 30 days: {low} - {high} kg ({len(weight_history)} days logged)"
+            else:
+                history_text = "Last 30 days: no weigh-ins yet"
+            page.set('weight_history', text=history_text)
+
+            for i, (_, field, threshold) in enumerate(ACHIEVEMENTS):
+                achieved = getattr(snapshot, field) >= threshold
+                page.set(('achievement', i), text="✓ Unlocked" if achieved else "✗ Locked",
+                         text_color="green" if achieved else "red")
+        except Exception as e:
+            logger.error("Error updating progress section: %s", e)
+
+    # Each section builds its widgets once; navigation and saves only refresh them
+    workouts_page = Page('workouts', build_workouts_page)
+    dashboard_page = Page('dashboard', build_dashboard_page)
+    meals_page = Page('meals', build_meals_page)
+    calorie_counter_page = Page('calorie counter', build_calorie_counter_page, refresh_calorie_counter_page,
+                                load=lambda: get_user_snapshot(current_username))
+    settings_page = Page('settings', build_settings_page)
+    progress_page = Page('progress', build_progress_page, refresh_progress_page,
+                         load=lambda: get_user_snapshot(current_username))
+
+    def update_meals_section():
+        """Show the meals list, building it on first use"""
+        meals_page.ensure_built()
+        MealsFrame.lift()
+
+    global update_calorie_counter_section
+    def update_calorie_counter_section():
+        """Refresh the calorie counter for the logged-in user and bring it to the front"""
+        global current_username
+
+        try:
+            current_username = user_var.get().strip()
+            if not current_username:
+                logger.warning("No username available for calorie counter")
+                return
+            calorie_counter_page.refresh()
+            CalorieCounter_Frame.lift()
+        except Exception as e:
+            logger.error("Error updating calorie counter section: %s", e)
+
+    def update_settings_section():
+        settings_page.ensure_built()
+
+    def update_progress_section():
+        progress_page.refresh()
+
+    section_pages = {workoutPage: workouts_page, progressPage: progress_page, settingsPage: settings_page}
+
+    # Remaining sections, built one per idle slot once the dashboard is interactive
+    prewarm_queue = [workouts_page, progress_page, meals_page, calorie_counter_page, settings_page]
+
+    def prewarm_next():
+        try:
+            while prewarm_queue:
+                page = prewarm_queue.pop(0)
+                if not page.built:
+                    page.ensure_built()
+                    break
+            if prewarm_queue:
+                mainapp.after(PREWARM_DELAY_MS, lambda: mainapp.after_idle(prewarm_next))
+            else:
+                logger.info("All sections pre-warmed")
         except Exception as e:
-            logger.error(f"Error updating progress section: {e}")
+            logger.error("Error pre-warming sections: %s", e)
+
+    def report_time_to_interactive():
+        elapsed_ms = (time.perf_counter() - login_started) * 1000
+        logger.info("Time to interactive after login: %.1f ms "
+                    "(dashboard built in %.1f ms)", elapsed_ms, dashboard_page.build_ms or 0)
+        if PREWARM_PAGES:
+            mainapp.after(PREWARM_DELAY_MS, lambda: mainapp.after_idle(prewarm_next))
 
-    # Initialize all sections with error handling
+    # Only the dashboard is built at login; the rest wait for their first visit or idle time
     try:
-        update_workouts_section()
-        update_dashboard_section()
-        update_meals_section()
-        update_calorie_counter_section()
-        update_settings_section()
-        update_progress_section()
-        logger.info("All sections initialized successfully")
+        dashboard_page.ensure_built()
+        # Queued behind the dashboard's own geometry and redraw idle handlers, so this runs once it is on screen
+        mainapp.after_idle(report_time_to_interactive)
     except Exception as e:
-        logger.error(f"Error initializing sections: {e}")
+        logger.error("Error initializing sections: %s", e)
 
 # Enhanced error handling for main execution
 try:
     if __name__ == "__main__":
         logger.info("Starting FitPlus application")
+        startup.mark('login screen built')
+
+        def first_frame_drawn():
+            startup.finish()
+            if startup.exit_after_startup:
+                app.quit()
+
+        # after_idle runs once the initial layout and redraw idle handlers are done; the timer then
+        # fires on the next pass of the event loop, after the first frame is on screen
+        app.after_idle(lambda: app.after(0, first_frame_drawn))
         app.mainloop()
 except KeyboardInterrupt:
     logger.info("Application interrupted by user")
 except Exception as e:
-    logger.error(f"Critical application error: {e}")
+    logger.error("Critical application error: %s", e)
 finally:
     try:
         # Cleanup on exit
         if 'pygame' in sys.modules:
             pygame.mixer.quit()
+        get_animation_scheduler().log_stats()
+        get_image_cache().log_stats()
+        get_image_loader().shutdown()
+        shutdown_worker()
+        get_login_throttle().flush()
+        get_event_recorder().stop()
+        get_food_log_writer().stop()
+        close_pool()
         logger.info("Application cleanup completed")
     except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
+        logger.error("Error during cleanup: %s", e)
+    stop_logging()
\ No newline at end of file
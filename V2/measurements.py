@@ -0,0 +1,104 @@
+"""
+FitPlus measurements
+Time series of body weight and personal records. Every update appends a
+sample; range queries and daily/weekly downsampling run in SQL on a covering
+index so long histories never have to be pulled into Python row by row.
+"""
+
+import sqlite3
+import datetime
+import logging
+
+from database import db_connection, db_transaction
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('current_weight', 'ideal_weight', 'bench_press_pr', 'squat_pr', 'deadlift_pr')
+
+# Bucket start for each downsampling resolution; weeks start on Monday
+BUCKETS = {
+    'day': "date(recorded_at)",
+    'week': "date(recorded_at, 'weekday 0', '-6 days')",
+}
+
+
+def _timestamp(moment=None):
+    return (moment or datetime.datetime.now()).isoformat(sep=' ', timespec='seconds')
+
+
+def _range_bounds(start, end):
+    """Inclusive start, exclusive end; dates are widened to whole days"""
+    if start is None:
+        start = '0000-01-01'
+    elif isinstance(start, datetime.datetime):
+        # Same ' ' separator as stored recorded_at values; isoformat()'s 'T' sorts after it
+        start = _timestamp(start)
+    else:
+        start = start.isoformat()
+    if end is None:
+        end = '9999-12-31'
+    elif isinstance(end, datetime.datetime):
+        end = _timestamp(end)
+    else:
+        end = (end + datetime.timedelta(days=1)).isoformat()
+    return start, end
+
+
+def record_measurement(username, metric, value, recorded_at=None):
+    """Append one sample"""
+    if metric not in METRICS:
+        return False, f"Unknown metric: {metric}"
+    try:
+        with db_transaction() as conn:
+            conn.execute('''
+                INSERT INTO measurements (username, metric, value, recorded_at)
+                VALUES (?, ?, ?, ?)
+            ''', (username, metric, value, _timestamp(recorded_at)))
+        return True, "Measurement recorded"
+    except sqlite3.Error as e:
+        logger.error("Error recording measurement: %s", e)
+        return False, f"Database error: {str(e)}"
+
+
+def get_measurements(username, metric, start=None, end=None):
+    """Raw samples in [start, end] as (recorded_at, value) tuples, oldest first"""
+    start, end = _range_bounds(start, end)
+    try:
+        with db_connection() as conn:
+            return conn.execute('''
+                SELECT recorded_at, value FROM measurements
+                WHERE username = ? AND metric = ? AND recorded_at >= ? AND recorded_at < ?
+                ORDER BY recorded_at
+            ''', (username, metric, start, end)).fetchall()
+    except sqlite3.Error as e:
+        logger.error("Error reading measurements: %s", e)
+        return []
+
+
+def get_downsampled(username, metric, start=None, end=None, resolution='day'):
+    """One row per day or week with min, max, last value and sample count"""
+    bucket = BUCKETS.get(resolution)
+    if bucket is None:
+        raise ValueError(f"Unknown resolution: {resolution}")
+    start, end = _range_bounds(start, end)
+    try:
+        with db_connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT bucket, MIN(value) AS min, MAX(value) AS max,
+                       MAX(CASE WHEN position = 1 THEN value END) AS last,
+                       COUNT(*) AS samples
+                FROM (
+                    SELECT {bucket} AS bucket, value,
+                           ROW_NUMBER() OVER (PARTITION BY {bucket}
+                                              ORDER BY recorded_at DESC, id DESC) AS position
+                    FROM measurements
+                    WHERE username = ? AND metric = ? AND recorded_at >= ? AND recorded_at < ?
+                )
+                GROUP BY bucket
+                ORDER BY bucket
+            ''', (username, metric, start, end))
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    except sqlite3.Error as e:
+        logger.error("Error downsampling measurements: %s", e)
+        return []
@@ -0,0 +1,267 @@
+"""
+FitPlus schema migrations
+Ordered migrations keyed by PRAGMA user_version. Each one runs in its own
+transaction at startup and its duration is stored in schema_migrations so
+upgrades of large databases can be measured.
+
+Every step spells out its own SQL instead of calling into the feature
+modules, so what migration N does to a database that has not upgraded yet
+never changes after it ships. Schema changes go in a new migration.
+"""
+
+import sqlite3
+import time
+import datetime
+import logging
+
+from database import db_connection
+
+logger = logging.getLogger(__name__)
+
+USERS_SCHEMA = '''
+    CREATE TABLE {table} (
+        username TEXT PRIMARY KEY,
+        password TEXT NOT NULL,
+        security_question TEXT NOT NULL,
+        security_answer TEXT NOT NULL,
+        daily_calorie_limit INTEGER DEFAULT 2000,
+        daily_calorie_intake INTEGER DEFAULT 0,
+        daily_fat REAL DEFAULT 0,
+        daily_carbs REAL DEFAULT 0,
+        daily_protein REAL DEFAULT 0,
+        daily_sugars REAL DEFAULT 0,
+        current_weight REAL DEFAULT 0,
+        ideal_weight REAL DEFAULT 0,
+        bench_press_pr REAL DEFAULT 0,
+        squat_pr REAL DEFAULT 0,
+        deadlift_pr REAL DEFAULT 0,
+        last_update DATE DEFAULT (DATE('now')),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        deleted_at TIMESTAMP
+    )
+'''
+
+
+def table_columns(conn, table):
+    """Column name -> declared type, in table order"""
+    return {row[1]: row[2].upper() for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def rebuild_table(conn, table, schema):
+    """Recreate table from schema and copy shared columns across in one INSERT ... SELECT.
+
+    Skipped when the existing columns and types already match. Callers run with
+    foreign keys off so dropping the old table does not cascade into child rows.
+    """
+    scratch = f"{table}__rebuild"
+    conn.execute(f"DROP TABLE IF EXISTS {scratch}")
+    conn.execute(schema.format(table=scratch))
+    wanted = table_columns(conn, scratch)
+    existing = table_columns(conn, table)
+    if wanted == existing:
+        conn.execute(f"DROP TABLE {scratch}")
+        return False
+
+    shared = ", ".join(column for column in wanted if column in existing)
+    conn.execute(f"INSERT INTO {scratch} ({shared}) SELECT {shared} FROM {table}")
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {scratch} RENAME TO {table}")
+    logger.info("Rebuilt table %s", table)
+    return True
+
+
+def _create_users(conn):
+    conn.execute(USERS_SCHEMA.format(table="IF NOT EXISTS users"))
+
+
+def _upgrade_users_columns(conn):
+    # Older databases have INTEGER weights/PRs and no created_at/deleted_at
+    rebuild_table(conn, "users", USERS_SCHEMA)
+
+
+def _create_food_log(conn):
+    """The log, its index, the summary table and the trigger that keeps it up to date"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS food_log (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+            day DATE NOT NULL,
+            logged_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            item TEXT NOT NULL,
+            calories INTEGER NOT NULL DEFAULT 0,
+            fat REAL NOT NULL DEFAULT 0,
+            carbs REAL NOT NULL DEFAULT 0,
+            protein REAL NOT NULL DEFAULT 0,
+            sugars REAL NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_food_log_user_day ON food_log (username, day)')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS daily_nutrition (
+            username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+            day DATE NOT NULL,
+            calories INTEGER NOT NULL DEFAULT 0,
+            fat REAL NOT NULL DEFAULT 0,
+            carbs REAL NOT NULL DEFAULT 0,
+            protein REAL NOT NULL DEFAULT 0,
+            sugars REAL NOT NULL DEFAULT 0,
+            entries INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (username, day)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_food_log_summary AFTER INSERT ON food_log
+        BEGIN
+            INSERT INTO daily_nutrition (username, day, calories, fat, carbs, protein, sugars, entries)
+            VALUES (NEW.username, NEW.day, NEW.calories, NEW.fat, NEW.carbs, NEW.protein, NEW.sugars, 1)
+            ON CONFLICT (username, day) DO UPDATE SET
+                calories = calories + excluded.calories,
+                fat = fat + excluded.fat,
+                carbs = carbs + excluded.carbs,
+                protein = protein + excluded.protein,
+                sugars = sugars + excluded.sugars,
+                entries = entries + 1;
+        END
+    ''')
+    # Carry today's totals over from the old per-user counters, then retire them
+    conn.execute('''
+        INSERT INTO food_log (username, day, item, calories, fat, carbs, protein, sugars)
+        SELECT username, last_update, 'Earlier today', daily_calorie_intake,
+               daily_fat, daily_carbs, daily_protein, daily_sugars
+        FROM users
+        WHERE last_update = ? AND daily_calorie_intake > 0
+    ''', (datetime.date.today().isoformat(),))
+    conn.execute('''
+        UPDATE users SET daily_calorie_intake = 0, daily_fat = 0, daily_carbs = 0,
+                         daily_protein = 0, daily_sugars = 0
+        WHERE daily_calorie_intake != 0 OR daily_fat != 0 OR daily_carbs != 0
+           OR daily_protein != 0 OR daily_sugars != 0
+    ''')
+
+
+def _create_measurements(conn):
+    """The time series table and one seed sample per user from their current values"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS measurements (
+            id INTEGER PRIMARY KEY,
+            username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+            metric TEXT NOT NULL,
+            value REAL NOT NULL,
+            recorded_at TIMESTAMP NOT NULL
+        )
+    ''')
+    # Covering index: range scans never touch the table itself
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_measurements_series
+        ON measurements (username, metric, recorded_at, value)
+    ''')
+    now = datetime.datetime.now().isoformat(sep=' ', timespec='seconds')
+    for metric in ('current_weight', 'ideal_weight', 'bench_press_pr', 'squat_pr', 'deadlift_pr'):
+        conn.execute(f'''
+            INSERT INTO measurements (username, metric, value, recorded_at)
+            SELECT username, ?, {metric}, ? FROM users
+            WHERE {metric} > 0 AND NOT EXISTS (
+                SELECT 1 FROM measurements m WHERE m.username = users.username AND m.metric = ?)
+        ''', (metric, now, metric))
+
+
+def _create_login_lockouts(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS login_lockouts (
+            username TEXT PRIMARY KEY,
+            locked_until REAL NOT NULL
+        )
+    ''')
+
+
+def _create_events(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY,
+            recorded_at REAL NOT NULL,
+            action TEXT NOT NULL,
+            username TEXT,
+            duration_ms REAL,
+            outcome TEXT NOT NULL,
+            detail TEXT
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_events_action
+        ON events (action, recorded_at, duration_ms)
+    ''')
+
+
+MIGRATIONS = [
+    (1, "create users", _create_users),
+    (2, "real-valued users columns with created_at and deleted_at", _upgrade_users_columns),
+    (3, "food log and daily nutrition summary", _create_food_log),
+    (4, "measurements time series", _create_measurements),
+    (5, "persisted login lockouts", _create_login_lockouts),
+    (6, "structured event log", _create_events),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def _apply(conn, version, name, migration):
+    """Run one migration in its own transaction and record how long it took"""
+    start = time.perf_counter()
+    # Must be set outside a transaction; lets table rebuilds drop parents safely
+    conn.execute("PRAGMA foreign_keys = OFF")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        migration(conn)
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            raise sqlite3.IntegrityError(f"Migration {version} left {len(violations)} foreign key violations")
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                duration_ms REAL NOT NULL
+            )
+        ''')
+        duration_ms = (time.perf_counter() - start) * 1000
+        conn.execute("INSERT OR REPLACE INTO schema_migrations (version, name, duration_ms) VALUES (?, ?, ?)",
+                     (version, name, duration_ms))
+        conn.execute(f"PRAGMA user_version = {version}")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+    return duration_ms
+
+
+def migrate():
+    """Apply every migration newer than PRAGMA user_version.
+
+    Returns a list of (version, name, duration_ms) for the migrations that ran.
+    """
+    applied = []
+    with db_connection() as conn:
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        if current > SCHEMA_VERSION:
+            logger.warning("Database schema version %s is newer than this app (%s)", current, SCHEMA_VERSION)
+            return applied
+        for version, name, migration in MIGRATIONS:
+            if version <= current:
+                continue
+            duration_ms = _apply(conn, version, name, migration)
+            logger.info("Applied migration %s (%s) in %.1f ms", version, name, duration_ms)
+            applied.append((version, name, duration_ms))
+    return applied
+
+
+def migration_history():
+    """Recorded migrations with their timings, oldest first"""
+    try:
+        with db_connection() as conn:
+            return conn.execute('''
+                SELECT version, name, applied_at, duration_ms FROM schema_migrations ORDER BY version
+            ''').fetchall()
+    except sqlite3.Error:
+        return []
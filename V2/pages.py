@@ -0,0 +1,65 @@
+"""
+FitPlus pages
+Build-once page framework. Each section builds its widget tree a single
+time; after that refresh(data) only reconfigures the widgets whose options
+actually changed, so navigating or saving never recreates widgets.
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+
+class Page:
+    """One app section: widgets built on first use, then updated in place
+
+    build(page) creates the widgets and registers the ones refresh needs
+    with page.add(key, widget). refresh(page, data) pushes new values
+    through page.set(key, **options). When refresh() is called without
+    data, load() supplies it.
+    """
+
+    def __init__(self, name, build, refresh=None, load=None):
+        self.name = name
+        self._build = build
+        self._refresh = refresh
+        self._load = load
+        self.widgets = {}
+        self._applied = {}
+        self.build_ms = None
+
+    @property
+    def built(self):
+        return self.build_ms is not None
+
+    def add(self, key, widget):
+        self.widgets[key] = widget
+        return widget
+
+    def ensure_built(self):
+        if not self.built:
+            start = time.perf_counter()
+            self._build(self)
+            self.build_ms = (time.perf_counter() - start) * 1000
+            logger.info("Built %s page in %.1f ms", self.name, self.build_ms)
+        return self
+
+    def refresh(self, data=None):
+        self.ensure_built()
+        if self._refresh is None:
+            return
+        if data is None and self._load is not None:
+            data = self._load()
+        self._refresh(self, data)
+
+    def set(self, key, **options):
+        """Configure widgets[key] with just the options that differ from the last ones applied"""
+        applied = self._applied.setdefault(key, {})
+        changed = {option: value for option, value in options.items() if applied.get(option, _UNSET) != value}
+        if changed:
+            self.widgets[key].configure(**changed)
+            applied.update(changed)
+        return bool(changed)
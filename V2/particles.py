@@ -0,0 +1,528 @@
+"""
+FitPlus particles
+Background particle animation for the login, registration and password reset
+screens. Particle state lives in NumPy arrays and is advanced in one
+vectorized step per frame; the canvas is updated through one call to a
+byte-compiled Tcl proc instead of one canvas.move call per particle, or,
+with renderer="image", rasterized into a single PhotoImage.
+Every animated canvas is driven by one AnimationScheduler, which only ticks
+the ones that are on screen and stops its timer entirely when none are.
+"""
+
+import time
+import tkinter
+import threading
+import logging
+
+import numpy as np
+from PIL import Image, ImageTk
+
+logger = logging.getLogger(__name__)
+
+PARTICLE_COUNT = 50  # Reduced from 100
+PARTICLE_UPDATE_INTERVAL = 16  # ~60 FPS
+PARTICLE_RESPAWN_TIME = 15
+PARTICLE_SPEED = 0.5
+PARTICLE_LIFETIME = (100, 300)  # frames
+MIN_CANVAS_SIZE = (800, 600)
+PARTICLE_TAG = "particle"
+
+# Frame-rate controller: (interval ms, share of particles) from best to cheapest
+QUALITY_LEVELS = (
+    (PARTICLE_UPDATE_INTERVAL, 1.0), (20, 1.0), (25, 1.0), (33, 1.0),
+    (33, 0.75), (33, 0.5), (50, 0.5), (50, 0.25),
+)
+FRAME_BUDGET = 0.5  # share of the frame interval animation work may use
+HEADROOM = 0.25  # frames under this share of the budget count as headroom
+DOWNGRADE_FRAMES = 10  # consecutive slow frames before stepping down
+UPGRADE_FRAMES = 120  # consecutive fast frames before stepping back up
+
+# Byte-compiled once per interpreter, so a whole frame is a single Python -> Tcl call
+PUSH_PROC = "fitplus_push_particles"
+PUSH_PROC_BODY = '''
+proc %s {canvas coords shown hidden} {
+    foreach {id x0 y0 x1 y1} $coords { $canvas coords $id $x0 $y0 $x1 $y1 }
+    foreach id $shown { $canvas itemconfigure $id -state normal }
+    foreach id $hidden { $canvas itemconfigure $id -state hidden }
+}
+''' % PUSH_PROC
+
+
+class ParticleEngine:
+    """Fixed-capacity particle state; dead slots are reused on respawn"""
+
+    def __init__(self, capacity, radius=3, rng=None):
+        self.capacity = capacity
+        self.radius = radius
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.width, self.height = MIN_CANVAS_SIZE
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def resize(self, width, height):
+        self.width = max(width, MIN_CANVAS_SIZE[0])
+        self.height = max(height, MIN_CANVAS_SIZE[1])
+
+    def spawn(self, count=None):
+        """Bring up to count dead slots back to life; returns their indices"""
+        slots = np.flatnonzero(~self.alive)
+        if count is not None:
+            slots = slots[:max(0, count)]
+        n = len(slots)
+        if n:
+            low = self.radius
+            high = np.array([self.width, self.height]) - self.radius
+            self.position[slots] = self.rng.uniform(low, high, (n, 2))
+            self.velocity[slots] = self.rng.uniform(-PARTICLE_SPEED, PARTICLE_SPEED, (n, 2))
+            self.age[slots] = 0
+            self.lifetime[slots] = self.rng.integers(PARTICLE_LIFETIME[0], PARTICLE_LIFETIME[1], n, endpoint=True)
+            self.alive[slots] = True
+        return slots
+
+    def step(self):
+        """Advance every live particle one frame; returns the indices that just expired"""
+        # Dense updates are cheaper than masked ones; dead slots are reset on respawn anyway
+        self.position += self.velocity
+        self.age += 1
+        expired = self.alive & (self.age > self.lifetime)
+        self.alive[expired] = False
+        return np.flatnonzero(expired)
+
+    def pixels(self):
+        """Whole-pixel centers of every slot"""
+        return np.rint(self.position).astype(np.int64)
+
+
+class FrameRateController:
+    """Picks a quality level from measured frame cost
+
+    Each tick reports how long the animation work took. Sustained frames
+    over budget step down a QUALITY_LEVELS entry (lower frame rate first,
+    then fewer particles); sustained headroom steps back up.
+    """
+
+    def __init__(self, levels=QUALITY_LEVELS, smoothing=0.1):
+        self.levels = levels
+        self.smoothing = smoothing
+        self.level = 0
+        self.frame_time = 0.0  # smoothed seconds of work per frame
+        self.frame_interval = levels[0][0] / 1000  # smoothed seconds between frames
+        self._last_frame = None
+        self._slow = self._fast = 0
+
+    @property
+    def interval(self):
+        return self.levels[self.level][0]
+
+    @property
+    def density(self):
+        return self.levels[self.level][1]
+
+    @property
+    def fps(self):
+        return 1 / self.frame_interval if self.frame_interval else 0.0
+
+    def reset_clock(self):
+        """Forget the last frame time, e.g. after the loop was suspended"""
+        self._last_frame = None
+
+    def record(self, started, duration):
+        """Account one frame; returns True when the quality level changed"""
+        if self._last_frame is not None:
+            self.frame_interval += self.smoothing * (started - self._last_frame - self.frame_interval)
+        self._last_frame = started
+        self.frame_time += self.smoothing * (duration - self.frame_time)
+
+        budget = self.interval / 1000 * FRAME_BUDGET
+        self._slow = self._slow + 1 if self.frame_time > budget else 0
+        self._fast = self._fast + 1 if self.frame_time < budget * HEADROOM else 0
+        if self._slow >= DOWNGRADE_FRAMES and self.level < len(self.levels) - 1:
+            return self._set_level(self.level + 1)
+        if self._fast >= UPGRADE_FRAMES and self.level > 0:
+            return self._set_level(self.level - 1)
+        return False
+
+    def _set_level(self, level):
+        direction = "down" if level > self.level else "up"
+        self.level = level
+        self._slow = self._fast = 0
+        logger.info("Animation quality %s: %s ms interval, %.0f%% particles (frame time %.1f ms, %.0f FPS)",
+                    direction, self.interval, self.density * 100, self.frame_time * 1000, self.fps)
+        return True
+
+
+class AnimationScheduler:
+    """Single after() loop for every registered animated widget
+
+    A widget is ticked only while it is mapped, not fully obscured and not
+    paused, and the timer is cancelled while nothing is visible or the window
+    is minimized. Windows sends no <Visibility> events, so a frame hidden by
+    lowering it below another one has to be paused by whoever lowers it.
+    Process CPU time is split into running and suspended periods so idle
+    cost can be reported.
+    """
+
+    def __init__(self, controller=None):
+        self.controller = FrameRateController() if controller is None else controller
+        self._visible = {}  # widget -> on screen
+        self._paused = set()  # widgets explicitly hidden by their owner
+        self._minimized = set()  # toplevels currently iconified
+        self._toplevels = set()
+        self._job = None
+        self._job_owner = None
+        self.ticks = 0
+        self._cpu = {True: 0.0, False: 0.0}
+        self._wall = {True: 0.0, False: 0.0}
+        self._mark = (time.perf_counter(), time.process_time())
+
+    @property
+    def running(self):
+        return self._job is not None
+
+    def register(self, widget):
+        if widget in self._visible:
+            return
+        self._visible[widget] = bool(widget.winfo_viewable())
+        widget.bind("<Map>", lambda e: self._set_visible(widget, True), add="+")
+        widget.bind("<Unmap>", lambda e: self._set_visible(widget, False), add="+")
+        widget.bind("<Visibility>", lambda e: self._set_visible(widget, e.state != "VisibilityFullyObscured"), add="+")
+        toplevel = widget.winfo_toplevel()
+        if toplevel not in self._toplevels:
+            self._toplevels.add(toplevel)
+            # Toplevel bindings also fire for every child, so only the toplevel's own events count
+            toplevel.bind("<Unmap>", lambda e: e.widget is toplevel and self._set_minimized(toplevel, True), add="+")
+            toplevel.bind("<Map>", lambda e: e.widget is toplevel and self._set_minimized(toplevel, False), add="+")
+        self._refresh()
+
+    def unregister(self, widget):
+        self._paused.discard(widget)
+        if self._visible.pop(widget, None) is not None:
+            self._refresh()
+
+    def pause(self, widget):
+        """Stop ticking widget until resume(), whatever its visibility events say"""
+        if widget not in self._paused:
+            self._paused.add(widget)
+            self._refresh()
+
+    def resume(self, widget):
+        if widget in self._paused:
+            self._paused.discard(widget)
+            self._refresh()
+
+    def _set_visible(self, widget, visible):
+        if widget in self._visible and self._visible[widget] != visible:
+            self._visible[widget] = visible
+            self._refresh()
+
+    def _set_minimized(self, toplevel, minimized):
+        if minimized and toplevel.state() != "iconic":
+            return
+        if minimized:
+            self._minimized.add(toplevel)
+        else:
+            self._minimized.discard(toplevel)
+        self._refresh()
+
+    def _active(self):
+        return [widget for widget, visible in self._visible.items()
+                if visible and widget not in self._paused and widget.winfo_toplevel() not in self._minimized]
+
+    def _account(self):
+        """Charge the time since the last transition to the current running state"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        self._wall[self.running] += wall - self._mark[0]
+        self._cpu[self.running] += cpu - self._mark[1]
+        self._mark = (wall, cpu)
+
+    def _refresh(self):
+        active = self._active()
+        if active and not self.running:
+            self._account()
+            self.controller.reset_clock()
+            self._schedule(active[0])
+            logger.debug("Animations resumed for %s widget(s)", len(active))
+        elif not active and self.running:
+            self._account()
+            try:
+                self._job_owner.after_cancel(self._job)
+            except tkinter.TclError:
+                pass
+            self._job = self._job_owner = None
+            logger.debug("Animations suspended: nothing visible")
+
+    @property
+    def interval(self):
+        return self.controller.interval
+
+    def _schedule(self, widget, elapsed=0.0):
+        # Timers hang off the toplevel so destroying an animated widget never orphans the loop.
+        # The frame's own work is subtracted so the period stays at the interval.
+        self._job_owner = widget.winfo_toplevel()
+        delay = max(1, int(self.interval - elapsed * 1000))
+        self._job = self._job_owner.after(delay, self._tick)
+
+    def _tick(self):
+        now = time.monotonic()
+        active = self._active()
+        for widget in active:
+            try:
+                widget.animate(now)
+            except Exception as e:
+                logger.error("Error animating %s: %s", widget, e)
+        elapsed = time.monotonic() - now
+        self.ticks += 1
+        if self.controller.record(now, elapsed):
+            for widget in self._visible:
+                widget.set_density(self.controller.density)
+        if active:
+            self._schedule(active[0], elapsed)
+        else:
+            self._account()
+            self._job = self._job_owner = None
+
+    def stats(self):
+        """Registered/active widget counts and process CPU use while running and while suspended"""
+        self._account()
+        return {
+            'registered': len(self._visible),
+            'active': len(self._active()),
+            'running': self.running,
+            'ticks': self.ticks,
+            'fps': self.controller.fps,
+            'frame_time_ms': self.controller.frame_time * 1000,
+            'interval_ms': self.interval,
+            'density': self.controller.density,
+            'running_seconds': self._wall[True],
+            'suspended_seconds': self._wall[False],
+            'running_cpu_percent': 100 * self._cpu[True] / self._wall[True] if self._wall[True] else 0.0,
+            'idle_cpu_percent': 100 * self._cpu[False] / self._wall[False] if self._wall[False] else 0.0,
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info("Animation scheduler: %s ticks, %.0f FPS, %.2f ms/frame, %.0f%% particles, "
+                    "running %.1fs at %.1f%% CPU, suspended %.1fs at %.1f%% CPU",
+                    stats['ticks'], stats['fps'], stats['frame_time_ms'], stats['density'] * 100,
+                    stats['running_seconds'], stats['running_cpu_percent'],
+                    stats['suspended_seconds'], stats['idle_cpu_percent'])
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_animation_scheduler():
+    """Process-wide scheduler shared by every ParticleFrame"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = AnimationScheduler()
+    return _scheduler
+
+
+class ItemRenderer:
+    """One canvas oval per engine slot, created once and recycled"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.item_ids = None
+        self._drawn = np.zeros((canvas.engine.capacity, 2), dtype=np.int64)
+        canvas.tk.eval(PUSH_PROC_BODY)
+
+    @property
+    def ready(self):
+        return self.item_ids is not None
+
+    def prepare(self):
+        canvas = self.canvas
+        self.item_ids = np.array([
+            canvas.create_oval(0, 0, 0, 0, fill=canvas.color, outline=canvas.color,
+                               state="hidden", tags=PARTICLE_TAG)
+            for _ in range(canvas.engine.capacity)
+        ])
+
+    def draw(self, shown=(), hidden=()):
+        """Apply this frame's coordinate and visibility changes in one Tcl call"""
+        canvas, engine = self.canvas, self.canvas.engine
+        # Particles move under a pixel per frame, so only the ones that crossed a pixel are redrawn
+        centers = engine.pixels()
+        moved = engine.alive & (centers != self._drawn).any(axis=1)
+        moved[shown] = True
+        slots = np.flatnonzero(moved)
+        if not len(slots) and not len(hidden):
+            return
+        self._drawn[slots] = centers[slots]
+        boxes = np.hstack((centers[slots] - canvas.size, centers[slots] + canvas.size))
+        rows = np.column_stack((self.item_ids[slots], boxes)).ravel().tolist()
+        canvas.tk.call(PUSH_PROC, canvas._w, tuple(rows),
+                       tuple(self.item_ids[shown].tolist()), tuple(self.item_ids[hidden].tolist()))
+
+    def clear(self):
+        self.canvas.delete(PARTICLE_TAG)
+        self.item_ids = None
+
+
+class ImageRenderer:
+    """The whole particle field rasterized into one PhotoImage per frame
+
+    Frames are 8-bit palette images (0 = background, 1 = particle) with a
+    margin of one sprite radius, so a disc sprite can be stamped at every
+    live particle with a single flat fancy-index assignment. The cost then
+    depends mostly on the canvas area, not on how many items Tk tracks.
+    """
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.photo = None
+        self.item = None
+        self._frame = None
+        background = [c >> 8 for c in canvas.winfo_rgb(canvas.cget("bg"))]
+        color = [c >> 8 for c in canvas.winfo_rgb(canvas.color)]
+        self._palette = background + color
+        r = canvas.size
+        dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+        disc = dx * dx + dy * dy <= r * r
+        self._sprite = np.column_stack((dy[disc], dx[disc]))
+        self._offsets = None
+
+    @property
+    def ready(self):
+        return self.photo is not None
+
+    def allocate(self):
+        """Frame buffer and flat sprite offsets for the engine's current size"""
+        engine, r = self.canvas.engine, self.canvas.size
+        self._frame = np.zeros((engine.height + 2 * r, engine.width + 2 * r), dtype=np.uint8)
+        stride = self._frame.shape[1]
+        self._offsets = (self._sprite[:, 0] + r) * stride + self._sprite[:, 1] + r
+
+    def prepare(self):
+        engine = self.canvas.engine
+        self.allocate()
+        self.photo = ImageTk.PhotoImage("RGB", (engine.width, engine.height), master=self.canvas)
+        self.item = self.canvas.create_image(0, 0, image=self.photo, anchor="nw", tags=PARTICLE_TAG)
+        self.canvas.tag_lower(self.item)
+
+    def draw(self, shown=(), hidden=()):
+        engine, r = self.canvas.engine, self.canvas.size
+        if self._frame.shape != (engine.height + 2 * r, engine.width + 2 * r):
+            self.clear()
+            self.prepare()
+        frame = self._frame
+        frame.fill(0)
+        centers = engine.pixels()[engine.alive]
+        on_canvas = ((centers[:, 0] >= 0) & (centers[:, 0] < engine.width)
+                     & (centers[:, 1] >= 0) & (centers[:, 1] < engine.height))
+        centers = centers[on_canvas]
+        frame.ravel()[(centers[:, 1] * frame.shape[1] + centers[:, 0])[:, None] + self._offsets] = 1
+        image = Image.fromarray(frame[r:r + engine.height, r:r + engine.width], "P")
+        image.putpalette(self._palette)
+        self.photo.paste(image)
+
+    def clear(self):
+        self.canvas.delete(PARTICLE_TAG)
+        self.photo = self.item = None
+
+
+RENDERERS = {'items': ItemRenderer, 'image': ImageRenderer}
+
+
+class ParticleFrame(tkinter.Canvas):
+    def __init__(self,
+                 master,
+                 fg_color="black",
+                 particle_color="white",
+                 particle_size=3,
+                 particle_count=PARTICLE_COUNT,
+                 respawn=PARTICLE_RESPAWN_TIME,
+                 renderer="items",
+                 **kwargs):
+
+        super().__init__(master, bg=fg_color,
+                         highlightthickness=0,
+                         borderwidth=0, **kwargs)
+
+        self.color = particle_color
+        self.size = particle_size
+        self.max_particles = particle_count
+        self.respawn = respawn
+        self._stop = False
+        self.engine = ParticleEngine(particle_count, radius=min(particle_size, 5))
+        self.renderer = RENDERERS[renderer](self)
+        self.scheduler = get_animation_scheduler()
+        self.num_particles = max(1, round(particle_count * self.scheduler.controller.density))
+        self._next_respawn = 0.0
+
+        self.after(200, self.start)
+        self.bind("<Destroy>", lambda e: self.stop())
+
+    def stop(self):
+        self._stop = True
+        self.scheduler.unregister(self)
+        self.cleanup_particles()
+
+    def pause(self):
+        """Stop animating while another frame is stacked on top of this one"""
+        self.scheduler.pause(self)
+
+    def resume(self):
+        self.scheduler.resume(self)
+
+    def cleanup_particles(self):
+        """Drop the renderer's canvas items and forget all particle state"""
+        try:
+            self.renderer.clear()
+            self.engine.alive[:] = False
+        except Exception as e:
+            logger.error("Error cleaning up particles: %s", e)
+
+    def create_particles(self):
+        if self._stop:
+            return
+
+        try:
+            self.engine.resize(self.winfo_width(), self.winfo_height())
+            if not self.renderer.ready:
+                self.renderer.prepare()
+            spawned = self.engine.spawn(self.num_particles - int(self.engine.alive.sum()))
+            self.renderer.draw(shown=spawned)
+            self._next_respawn = time.monotonic() + self.respawn
+        except Exception as e:
+            logger.error("Error in create_particles: %s", e)
+
+    def move_particles(self):
+        try:
+            expired = self.engine.step()
+            self.renderer.draw(hidden=expired)
+        except Exception as e:
+            logger.error("Error moving particles: %s", e)
+
+    def start(self):
+        if self._stop:
+            return
+        self.create_particles()
+        self.scheduler.register(self)
+
+    def set_density(self, density):
+        """Keep this share of the configured particles: surplus ones go now, missing ones spawn now"""
+        self.num_particles = max(1, round(self.max_particles * density))
+        if not self.renderer.ready:
+            return
+        alive = np.flatnonzero(self.engine.alive)
+        surplus = alive[self.num_particles:]
+        self.engine.alive[surplus] = False
+        spawned = self.engine.spawn(self.num_particles - (len(alive) - len(surplus)))
+        self.renderer.draw(shown=spawned, hidden=surplus)
+
+    def animate(self, now):
+        """One scheduler tick: respawn when due, then advance a frame"""
+        if self._stop:
+            return
+        if now >= self._next_respawn:
+            self.create_particles()
+        self.move_particles()
@@ -0,0 +1,131 @@
+"""
+FitPlus startup profiler
+Wall-clock timings for the path from launching main.py to the first frame
+of the login screen: every top-level import in main.py, setup_database, the
+food index, window creation and the first frame itself. Off by default;
+turn it on with the FITPLUS_PROFILE_STARTUP=1 environment variable or the
+--profile-startup flag. The timings are logged and written to
+startup_profile.json.
+
+Only uses the standard library, because it is imported before everything it times.
+"""
+
+import os
+import sys
+import json
+import time
+import builtins
+import threading
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = 'FITPLUS_PROFILE_STARTUP'
+PROFILE_FLAG = '--profile-startup'
+EXIT_FLAG = '--exit-after-startup'  # quit once the first frame is drawn; used by the startup benchmark
+STARTUP_REPORT = 'startup_profile.json'
+
+
+class StartupProfiler:
+    """Named phases and marks measured from the moment this module was imported"""
+
+    def __init__(self, enabled=False, exit_after_startup=False):
+        self.enabled = enabled
+        self.exit_after_startup = exit_after_startup
+        self.origin = time.perf_counter()
+        self.phases = []  # (name, started_ms, duration_ms)
+        self.marks = {}  # name -> ms since origin
+        self._original_import = None
+        if enabled:
+            self._install_import_timer()
+
+    def _elapsed_ms(self, moment=None):
+        return ((moment if moment is not None else time.perf_counter()) - self.origin) * 1000
+
+    def _install_import_timer(self):
+        """Time each import statement executed by main.py itself, including what it pulls in"""
+        original = self._original_import = builtins.__import__
+        phases = self.phases
+        origin = self.origin
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if not globals or globals.get('__name__') != '__main__':
+                return original(name, globals, locals, fromlist, level)
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                end = time.perf_counter()
+                phases.append((f"import {name}", (start - origin) * 1000, (end - start) * 1000))
+
+        builtins.__import__ = timed_import
+
+    def _remove_import_timer(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, self._elapsed_ms(start), (time.perf_counter() - start) * 1000))
+
+    def mark(self, name):
+        if self.enabled:
+            self.marks[name] = self._elapsed_ms()
+
+    def report(self):
+        imports = [phase for phase in self.phases if phase[0].startswith('import ')]
+        return {
+            'total_ms': self.marks.get('first frame', self._elapsed_ms()),
+            'imports_ms': sum(duration for _, _, duration in imports),
+            'phases': [{'name': name, 'started_ms': round(started, 2), 'duration_ms': round(duration, 2)}
+                       for name, started, duration in self.phases],
+            'marks': {name: round(ms, 2) for name, ms in self.marks.items()},
+        }
+
+    def finish(self, path=STARTUP_REPORT):
+        """Record the first frame, stop timing imports, then log and save the report"""
+        if not self.enabled:
+            return None
+        self.mark('first frame')
+        self._remove_import_timer()
+        report = self.report()
+        slowest = sorted(self.phases, key=lambda phase: phase[2], reverse=True)[:8]
+        logger.info("Startup: first frame after %.0f ms, "
+                    "%.0f ms of it in main.py imports", report['total_ms'], report['imports_ms'])
+        for name, _, duration in slowest:
+            logger.info("Startup:   %8.1f ms  %s", duration, name)
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            logger.error("Error writing startup profile: %s", e)
+        return report
+
+
+def profiling_requested(argv=None, environ=None):
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    return PROFILE_FLAG in argv or environ.get(PROFILE_ENV, '') not in ('', '0')
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_startup_profiler():
+    """Process-wide profiler; enabled by FITPLUS_PROFILE_STARTUP or --profile-startup"""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = StartupProfiler(profiling_requested(), EXIT_FLAG in sys.argv)
+    return _profiler
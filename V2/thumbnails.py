@@ -0,0 +1,160 @@
+"""
+FitPlus thumbnail store
+Pre-scaled, size-specific copies of the bundled images kept in a
+content-addressed directory. A variant's file name is a hash of the source
+path, its mtime and byte size and the target size, so editing or replacing
+a source image simply misses and produces a fresh variant.
+
+Rebuild the whole store from the V2 folder with:
+    python thumbnails.py rebuild [--workers N] [--clean]
+"""
+
+import os
+import sys
+import hashlib
+import threading
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = '.thumbnails'
+JPEG_QUALITY = 90
+RESAMPLE = Image.Resampling.BICUBIC  # Image.resize's own default
+REDUCING_GAP = 2.0  # non-JPEG sources are first shrunk by an integer factor down to 2x the target
+
+# Image folders, or single images, and the sizes the pages draw them at
+THUMBNAIL_SPECS = {
+    'workoutimgs': [(315, 177)],
+    'mealimages': [(350, 196)],
+    'dashboardimgs': [(350, 196)],
+    'fitplus.png': [(213, 164)],
+    'fitplus_smallicon.ico': [(96, 96)],
+}
+
+
+def open_scaled(source, size, resample=RESAMPLE):
+    """Decode source straight to size, letting the decoder do most of the shrinking
+
+    JPEGs are decoded at the smallest power-of-two DCT scale (1/2 .. 1/8)
+    that still covers size via draft(); other formats are reduced by an
+    integer factor before the final resample.
+    """
+    with Image.open(source) as img:
+        if img.format == 'JPEG':
+            img.draft('RGB' if img.mode not in ('L', 'CMYK') else img.mode, tuple(size))
+        return img.resize(tuple(size), resample=resample, reducing_gap=REDUCING_GAP)
+
+
+def _variant_name(source, size, stat, resample=RESAMPLE):
+    key = (f"{os.path.abspath(source)}|{stat.st_mtime_ns}|{stat.st_size}|{size[0]}x{size[1]}"
+           f"|{Image.Resampling(resample).name}")
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    extension = '.jpg' if source.lower().endswith(('.jpg', '.jpeg')) else '.png'
+    return f"{digest}_{size[0]}x{size[1]}{extension}"
+
+
+def thumbnail_path(source, size, store=THUMBNAIL_DIR, resample=RESAMPLE):
+    """Where the variant of source at size lives; None if the source is missing"""
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    name = _variant_name(source, size, stat, resample)
+    return os.path.join(store, name[:2], name)
+
+
+def build_thumbnail(source, size, store=THUMBNAIL_DIR, resample=RESAMPLE):
+    """Write the variant of source at size unless it already exists; returns its path"""
+    target = thumbnail_path(source, size, store, resample)
+    if target is None or os.path.exists(target):
+        return target
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    variant = open_scaled(source, size, resample)
+    if target.endswith('.jpg') and variant.mode not in ('RGB', 'L'):
+        variant = variant.convert('RGB')
+    # Write under a temporary name first so a reader never sees a partial file
+    partial = f"{target}.{os.getpid()}.{threading.get_ident()}.part"
+    if target.endswith('.jpg'):
+        variant.save(partial, 'JPEG', quality=JPEG_QUALITY)
+    else:
+        variant.save(partial, 'PNG')
+    os.replace(partial, target)
+    return target
+
+
+def get_thumbnail(source, size, store=THUMBNAIL_DIR, resample=RESAMPLE):
+    """Path of the stored variant, generating it on a miss; None when it cannot be produced"""
+    try:
+        return build_thumbnail(source, size, store, resample)
+    except (OSError, ValueError) as e:
+        logger.error("Error building thumbnail for %s at %s: %s", source, size, e)
+        return None
+
+
+def _build_job(job):
+    source, size, store = job
+    return build_thumbnail(source, size, store)
+
+
+def spec_sources(path):
+    """Source images named by a THUMBNAIL_SPECS key: a folder's files, or the single image itself"""
+    if os.path.isdir(path):
+        return [os.path.join(path, name) for name in sorted(os.listdir(path))]
+    return [path] if os.path.isfile(path) else []
+
+
+def rebuild(specs=THUMBNAIL_SPECS, store=THUMBNAIL_DIR, workers=None, clean=False):
+    """Build every variant in specs on a process pool; returns the number of variants
+
+    clean only judges variants at sizes listed in specs: one of those that was
+    not just built belongs to an edited or removed source. Variants made on
+    demand at other sizes are kept.
+    """
+    jobs = [(source, size, store)
+            for path, sizes in specs.items()
+            for source in spec_sources(path)
+            for size in sizes]
+    built = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for (source, size, _), result in zip(jobs, pool.map(_build_job, jobs, chunksize=4)):
+            if result:
+                built.add(os.path.normpath(result))
+            else:
+                logger.warning("No thumbnail for %s at %s", source, size)
+
+    if clean and os.path.isdir(store):
+        spec_sizes = {f"{width}x{height}" for sizes in specs.values() for width, height in sizes}
+        removed = 0
+        for root, _, files in os.walk(store):
+            for name in files:
+                path = os.path.normpath(os.path.join(root, name))
+                size = os.path.splitext(name)[0].partition('_')[2]
+                if name.endswith('.part') or (size in spec_sizes and path not in built):
+                    os.remove(path)
+                    removed += 1
+        logger.info("Removed %s stale thumbnails", removed)
+    logger.info("Thumbnail store %s holds %s variants", store, len(built))
+    return len(built)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the FitPlus thumbnail store")
+    commands = parser.add_subparsers(dest='command', required=True)
+    rebuild_parser = commands.add_parser('rebuild', help="generate every thumbnail variant")
+    rebuild_parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    rebuild_parser.add_argument('--clean', action='store_true', help="delete variants of old or removed sources")
+    rebuild_parser.add_argument('--store', default=THUMBNAIL_DIR, help="thumbnail directory")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.command == 'rebuild':
+        rebuild(store=args.store, workers=args.workers, clean=args.clean)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+FitPlus user state
+Loads everything a page needs for one user in a single query and shares the
+result between sections until a write invalidates it. Writes that are known
+increments (food adds) are folded into the cached row instead of re-reading it,
+while the food log writer batches them to the database.
+"""
+
+import sqlite3
+import datetime
+import threading
+import logging
+from dataclasses import dataclass, replace
+
+from database import db_connection
+from food_log import get_food_log_writer
+
+logger = logging.getLogger(__name__)
+
+# Snapshot attribute -> daily_nutrition column
+NUTRITION_FIELDS = {
+    'daily_calorie_intake': 'calories',
+    'daily_fat': 'fat',
+    'daily_carbs': 'carbs',
+    'daily_protein': 'protein',
+    'daily_sugars': 'sugars',
+}
+PROFILE_FIELDS = ('daily_calorie_limit', 'current_weight', 'ideal_weight',
+                  'bench_press_pr', 'squat_pr', 'deadlift_pr')
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Immutable view of a user's profile and one day's nutrition totals"""
+    username: str
+    day: str
+    daily_calorie_limit: int
+    daily_calorie_intake: float
+    daily_fat: float
+    daily_carbs: float
+    daily_protein: float
+    daily_sugars: float
+    current_weight: float
+    ideal_weight: float
+    bench_press_pr: float
+    squat_pr: float
+    deadlift_pr: float
+
+    @property
+    def remaining_calories(self):
+        return self.daily_calorie_limit - self.daily_calorie_intake
+
+
+_snapshots = {}
+_snapshots_lock = threading.Lock()
+
+
+def load_user_snapshot(username, day=None):
+    """Read the profile and the day's summary row in one query"""
+    day = day or datetime.date.today().isoformat()
+    # Queued food adds must reach the summary table before it is read
+    get_food_log_writer().flush(username)
+    profile_columns = ", ".join(f"u.{field}" for field in PROFILE_FIELDS)
+    nutrition_columns = ", ".join(f"COALESCE(d.{column}, 0)" for column in NUTRITION_FIELDS.values())
+    try:
+        with db_connection() as conn:
+            row = conn.execute(f'''
+                SELECT {profile_columns}, {nutrition_columns}
+                FROM users u
+                LEFT JOIN daily_nutrition d ON d.username = u.username AND d.day = ?
+                WHERE u.username = ?
+            ''', (day, username)).fetchone()
+    except sqlite3.Error as e:
+        logger.error("Error loading user snapshot: %s", e)
+        return None
+
+    if not row:
+        logger.warning("User %s not found for snapshot", username)
+        return None
+    fields = PROFILE_FIELDS + tuple(NUTRITION_FIELDS)
+    values = {field: (value if value is not None else 0) for field, value in zip(fields, row)}
+    return UserSnapshot(username=username, day=day, **values)
+
+
+def get_user_snapshot(username):
+    """Return the shared snapshot for username, reloading after invalidation or midnight"""
+    today = datetime.date.today().isoformat()
+    with _snapshots_lock:
+        snapshot = _snapshots.get(username)
+    if snapshot is not None and snapshot.day == today:
+        return snapshot
+
+    snapshot = load_user_snapshot(username, today)
+    if snapshot is not None:
+        with _snapshots_lock:
+            _snapshots[username] = snapshot
+    return snapshot
+
+
+def apply_user_deltas(username, day, **deltas):
+    """Fold a queued food add into the cached row so pages show it before it is written.
+
+    When username has no cached row for day, including a user that no longer
+    exists, the call is a no-op; the next load flushes the queue and reads the database.
+    """
+    unknown = set(deltas) - set(NUTRITION_FIELDS)
+    if unknown:
+        raise ValueError(f"Not an additive field: {', '.join(sorted(unknown))}")
+    with _snapshots_lock:
+        snapshot = _snapshots.get(username)
+        if snapshot is None or snapshot.day != day:
+            return
+        _snapshots[username] = replace(
+            snapshot, **{field: getattr(snapshot, field) + delta for field, delta in deltas.items()})
+
+
+def invalidate_snapshot(username=None):
+    """Drop the cached snapshot for username, or for everyone when username is None"""
+    with _snapshots_lock:
+        if username is None:
+            _snapshots.clear()
+        else:
+            _snapshots.pop(username, None)
+
+
+def forget_user(username):
+    """Write out username's queued food adds and drop their cached state, on logout or account deletion"""
+    get_food_log_writer().flush(username)
+    invalidate_snapshot(username)